@@ -7,26 +7,33 @@
 # - 2025-11-20: brand_intention 노드 추가
 # - 2025-11-20: smalltalk 모드 추가
 # - 2025-11-21: Command.goto 로 분기 처리
+# - 2026-10-18: brand_understand(의도+정보 추출 통합) 노드 추가, 설정으로 기존 경로 선택
+# - 2026-10-18: split 모드에서 brand_collect / brand_intention 병렬 실행 + brand_route 합류
+# - 2026-10-18: MemorySaver 대신 설정 기반 공용 체크포인터(get_checkpointer) 사용
+# - 2026-10-18: 압축 체크포인터(최근 N개 보관, messages 델타 저장) 사용
 
 from __future__ import annotations
 
 from langgraph.graph import StateGraph, START, END
-from langgraph.checkpoint.memory import MemorySaver
 
 from app.agents.state import AppState
+from app.core.config import settings
+from app.db.checkpointer import get_checkpointer
 from app.llm.client import get_chat_model
 
 # 노드 함수
 from app.graphs.nodes.brand.brand_collect_node import make_brand_collect_node
 from app.graphs.nodes.brand.brand_chat_node import make_brand_chat_node
 from app.graphs.nodes.brand.brand_intention_node import make_brand_intention_node
+from app.graphs.nodes.brand.brand_understand_node import make_brand_understand_node
+from app.graphs.nodes.brand.brand_route_node import make_brand_route_node
 from app.graphs.nodes.brand.brand_trend_search_node import make_brand_trend_search_node
 from app.graphs.nodes.brand.brand_trend_refine_node import make_brand_trend_refine_node
 from app.graphs.nodes.brand.persist_brand_node import make_persist_brand_node
 
 
 # 세션별 대화 히스토리 유지를 위한 체크포인터
-checkpointer = MemorySaver()
+checkpointer = get_checkpointer(compact=settings.brand_checkpoint_compaction)
 
 
 def build_brand_graph():
@@ -45,8 +52,6 @@ def build_brand_graph():
     llm = get_chat_model()
 
     # 노드 함수 생성
-    brand_collect = make_brand_collect_node(llm)
-    brand_intention = make_brand_intention_node(llm)
     brand_trend_search = make_brand_trend_search_node(llm)
     brand_trend_refine = make_brand_trend_refine_node(llm)
     brand_chat = make_brand_chat_node(llm)
@@ -55,23 +60,31 @@ def build_brand_graph():
     g = StateGraph(AppState)
 
     # 노드 등록
-    g.add_node("brand_collect", brand_collect)
-    g.add_node("brand_intention", brand_intention)
     g.add_node("trend_search", brand_trend_search)
     g.add_node("trend_refine", brand_trend_refine)
     g.add_node("brand_chat", brand_chat)
     g.add_node("persist_brand", persist_brand)
 
-    # 1) 기본 진입
-    g.add_edge(START, "brand_collect")
-
-    # 2) brand_collect → brand_intention
-    g.add_edge("brand_collect", "brand_intention")
-
-    # # 3) brand_intention 에서 갈 수 있는 애들
-    # g.add_edge("brand_intention", "trend_search")
-    # g.add_edge("brand_intention", "trend_refine")
-    # g.add_edge("brand_intention", "brand_chat")
+    if settings.brand_understand_mode == "split":
+        # 분리 경로: brand_collect / brand_intention 을 병렬로 실행 (LLM 두 번 호출, 동시 진행)
+        g.add_node("brand_collect", make_brand_collect_node(llm))
+        g.add_node("brand_intention", make_brand_intention_node(llm))
+        g.add_node("brand_route", make_brand_route_node())
+
+        # 1) 기본 진입: 두 분석 노드로 동시에 fan-out
+        g.add_edge(START, "brand_collect")
+        g.add_edge(START, "brand_intention")
+
+        # 2) 두 노드가 모두 끝나면 brand_route 에서 합류
+        #    (다음 노드는 brand_route 가 Command.goto 로 결정)
+        g.add_edge(["brand_collect", "brand_intention"], "brand_route")
+    else:
+        # 기본 경로: brand_understand 한 번으로 의도 분류 + 브랜드 정보 추출
+        # (다음 노드는 brand_understand 가 Command.goto 로 결정)
+        g.add_node("brand_understand", make_brand_understand_node(llm))
+
+        # 1) 기본 진입
+        g.add_edge(START, "brand_understand")
 
     # 4) 트렌드 라인
     g.add_edge("trend_refine", "trend_search")
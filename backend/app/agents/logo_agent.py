@@ -3,6 +3,9 @@
 # 작성일: 2025-11-19
 # 수정내역
 # - 2025-11-19: 초기 작성
+# - 2026-10-18: async 노드로 변경 (llm.ainvoke)
+# - 2026-10-18: MemorySaver 대신 설정 기반 공용 체크포인터(get_checkpointer) 사용
+# - 2026-10-18: 전체 히스토리 대신 prepare_chat_history(롤링 요약 + 토큰 예산) 사용
 
 from __future__ import annotations
 from typing import Literal
@@ -13,15 +16,16 @@ from langgraph.graph.message import add_messages
 
 from app.agents.state import AppState
 from app.llm.client import get_chat_model
-from langgraph.checkpoint.memory import MemorySaver
+from app.db.checkpointer import get_checkpointer
+from app.graphs.nodes.common.history_utils import prepare_chat_history, HISTORY_META_KEY
 
 llm = get_chat_model()
 
-checkpointer = MemorySaver()
+checkpointer = get_checkpointer()
 
 # 이 부분은 현재 LangGraph 예시 코드입니다.
 
-def logo_node(state: AppState) -> AppState:
+async def logo_node(state: AppState) -> AppState:
     """
     로고 콘셉트/디자인 브리프를 잡아주는 기본 노드.
     - 지금은 단순히 로고 아이디어를 말로만 정리해 주는 용도.
@@ -34,12 +38,17 @@ def logo_node(state: AppState) -> AppState:
         "대답은 한국어로, 디자이너에게 전달할 수 있는 브리프 형태로 작성해라."
     )
 
-    messages = [SystemMessage(content=system_prompt)] + state["messages"]
+    history_messages, history_meta = await prepare_chat_history(state, llm, mode="logo")
+    messages = [SystemMessage(content=system_prompt)] + history_messages
 
-    ai_msg = llm.invoke(messages)
+    ai_msg = await llm.ainvoke(messages)
+
+    meta = dict(state.get("meta") or {})
+    meta[HISTORY_META_KEY] = history_meta
 
     return {
         "messages": [ai_msg],
+        "meta": meta,
     }
 
 
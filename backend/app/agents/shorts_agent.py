@@ -3,6 +3,9 @@
 # 작성일: 2025-11-19
 # 수정내역
 # - 2025-11-19: 초기 작성
+# - 2026-10-18: async 노드로 변경 (llm.ainvoke)
+# - 2026-10-18: MemorySaver 대신 설정 기반 공용 체크포인터(get_checkpointer) 사용
+# - 2026-10-18: 전체 히스토리 대신 prepare_chat_history(롤링 요약 + 토큰 예산) 사용
 
 from __future__ import annotations
 from typing import Literal
@@ -13,15 +16,16 @@ from langgraph.graph.message import add_messages
 
 from app.agents.state import AppState
 from app.llm.client import get_chat_model
-from langgraph.checkpoint.memory import MemorySaver
+from app.db.checkpointer import get_checkpointer
+from app.graphs.nodes.common.history_utils import prepare_chat_history, HISTORY_META_KEY
 
 llm = get_chat_model()
 
-checkpointer = MemorySaver()
+checkpointer = get_checkpointer()
 
 # 이 부분은 현재 LangGraph 예시 코드입니다.
 
-def shorts_node(state: AppState) -> AppState:
+async def shorts_node(state: AppState) -> AppState:
     """
     숏폼(쇼츠/릴스/틱톡) 아이디어 및 스크립트 초안을 만드는 노드.
     - 지금은 한 번 호출로 기획+스크립트를 같이 만들어주는 형태.
@@ -36,12 +40,17 @@ def shorts_node(state: AppState) -> AppState:
         "형식으로 한국어로 작성해라."
     )
 
-    messages = [SystemMessage(content=system_prompt)] + state["messages"]
+    history_messages, history_meta = await prepare_chat_history(state, llm, mode="shorts")
+    messages = [SystemMessage(content=system_prompt)] + history_messages
 
-    ai_msg = llm.invoke(messages)
+    ai_msg = await llm.ainvoke(messages)
+
+    meta = dict(state.get("meta") or {})
+    meta[HISTORY_META_KEY] = history_meta
 
     return {
         "messages": [ai_msg],
+        "meta": meta,
     }
 
 
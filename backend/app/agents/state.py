@@ -4,13 +4,17 @@
 # 수정내역
 # - 2025-11-17: 초기 작성
 # - 2025-11-19: LangChain AgentState 적용
+# - 2026-10-18: 병렬 분석 결과를 합치기 위한 turn_analysis 추가
+# - 2026-10-18: 트렌드 도구 검색 결과를 실행 단위로 보관하는 retrieved_docs 추가
+# - 2026-10-18: retrieved_docs 격리 방식 설명 수정 (체크포인터 없는 실행)
 
 from __future__ import annotations
 
-from typing import Literal, Optional, Dict, Any, Annotated
+from typing import Literal, Optional, Dict, Any, Annotated, List
 from typing_extensions import TypedDict
 
 from langchain.agents import AgentState
+from langchain_core.documents import Document
 
 class BrandProfile(TypedDict, total=False):
     """
@@ -48,6 +52,9 @@ class TrendContext(TypedDict, total=False):
     """
     last_query: Optional[str]      # 마지막으로 분석했던 질의 설명
     last_result_summary: Optional[str]  # 요약 결과(LLM가 만든 자연어)
+    evidence_id: Optional[str]     # 답변 근거 문서 묶음 참조 (trend_evidence_store, retry/refine 재사용)
+    constraints: List[str]         # trend_refine 으로 누적된 사용자 조건
+    needs_new_search: bool         # trend_refine: 조건상 새 문서 검색이 필요한지
     # 필요하면 키워드별 캐시, 플랫폼별 트렌드 등 확장 가능
     # e.g. "by_platform": {"instagram": "...", "tiktok": "..."}
 
@@ -69,6 +76,47 @@ def merge_trend_context(
         base.update(dict(new))
     return base  # type: ignore[return-value]
 
+def merge_turn_analysis(
+    prev: Dict[str, Any] | None,
+    new: Dict[str, Any] | None,
+) -> Dict[str, Any]:
+    """
+    turn_analysis 머지 함수.
+
+    brand_collect / brand_intention 처럼 같은 스텝에서 병렬로 실행되는 노드들이
+    각자 자기 키("collect", "intent")만 써도 서로 덮어쓰지 않도록 키 단위로 합친다.
+    """
+    base: Dict[str, Any] = dict(prev or {})
+    if new:
+        base.update(dict(new))
+    return base
+
+# retrieved_docs 최대 보관 개수 (오래된 문서부터 버림)
+MAX_RETRIEVED_DOCS = 40
+
+
+def merge_retrieved_docs(
+    prev: List[Document] | None,
+    new: List[Document] | None,
+) -> List[Document]:
+    """
+    retrieved_docs 머지 함수.
+
+    - 같은 스텝에서 병렬로 호출된 검색 도구(rag/웹) 결과가 서로 덮어쓰지 않도록 이어 붙인다.
+    - 본문이 같은 문서는 한 번만 남기고, MAX_RETRIEVED_DOCS 개를 넘으면 오래된 것부터 버린다.
+    - 트렌드 에이전트는 체크포인터 없이 컴파일되어 매 실행이 빈 retrieved_docs 로 시작하므로,
+      이전 실행 결과와 섞이지 않는다. (별도 초기화 불필요)
+    """
+    merged: List[Document] = list(prev or [])
+    seen = {doc.page_content for doc in merged}
+    for doc in new or []:
+        if doc.page_content in seen:
+            continue
+        seen.add(doc.page_content)
+        merged.append(doc)
+    return merged[-MAX_RETRIEVED_DOCS:]
+
+
 class AppState(AgentState):
     """
     전체 그래프 공유할 공통 상태 스키마.
@@ -92,5 +140,13 @@ class AppState(AgentState):
     # 트렌드 분석 관련 캐시/컨텍스트
     trend_context: Annotated[TrendContext, merge_trend_context]
 
+    # 트렌드 에이전트 실행 중 검색 도구가 모은 문서 (rag/웹 -> reranker 입력)
+    # - 실행(run) 단위로 격리되도록 state 에 두고, 실행 시작 시 비운다.
+    retrieved_docs: Annotated[List[Document], merge_retrieved_docs]
+
+    # 이번 턴의 병렬 분석 결과 (collect: 브랜드 정보 추출, intent: 의도 분류)
+    # - brand_route 노드가 합쳐서 brand_profile / meta 에 반영한다.
+    turn_analysis: Annotated[Dict[str, Any], merge_turn_analysis]
+
     # 추가로 메타데이터 보관용 (필요 시 확장)
     meta: Dict[str, Any]
\ No newline at end of file
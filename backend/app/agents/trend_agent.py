@@ -3,27 +3,69 @@
 # 수정내역
 # - 2025-11-19: 초기 작성 (create_react_agent 버전)
 # - 2025-11-19: create_agent + AgentState(AppState) 버전으로 변경
+# - 2026-10-18: async 실행 경로로 변경 (arun_trend_query_for_api, ainvoke)
+# - 2026-10-18: MemorySaver 대신 설정 기반 공용 체크포인터(get_checkpointer) 사용
+# - 2026-10-18: rag_search_tool 필터 사용 규칙 추가
+# - 2026-10-18: 실행 시작 시 retrieved_docs 초기화 (검색 결과를 실행 단위로 격리)
+# - 2026-10-18: 고정 파이프라인 모드 추가 (RAG/웹 동시 검색 -> 1회 재정렬 -> 1회 합성)
+# - 2026-10-18: 시맨틱 답변 캐시 적용 (use_cache=False 로 우회)
+# - 2026-10-18: 근거 문서를 evidence_id 로 보관, retry/refine 은 보관된 근거로 재합성 (arefine_trend_answer)
+# - 2026-10-18: 체크포인터 제거 (기본 stateless), use_memory=True 일 때만 최근 N개 질문/답변 단기 메모리 사용
+# - 2026-10-18: 사전 계산된 카테고리 리포트가 맞으면 바로 반환
+# - 2026-10-18: 리포트에 없는 프로필 항목이 있으면 리포트 근거 문서로 실제 프로필 기준 재합성
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
+import asyncio
 import logging
 
 from langchain.agents import create_agent
-from langgraph.checkpoint.memory import MemorySaver
-from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.documents import Document
+from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
 from app.agents.state import AppState
+from app.core.config import settings
 from app.graphs.tools.trend_tools import (
     rag_search_tool,
     tavily_web_search_tool,
     apply_reranker_tool,
+    format_evidence,
+    web_results_to_documents,
 )
 from app.llm.client import get_chat_model
+from app.services.rerank_service import rerank_documents
+from app.services.retrieval_service import hybrid_search
+from app.services.trend_answer_cache import (
+    lookup_trend_answer,
+    profile_fingerprint,
+    store_trend_answer,
+)
+from app.services.trend_evidence_store import load_trend_evidence, save_trend_evidence
+from app.services.trend_memory import QAPair, get_trend_memory, memory_key
+from app.services.trend_report_service import find_precomputed_report, profile_needs_tailoring
+from app.services.web_search_service import web_search
 
 logger = logging.getLogger(__name__)
 
+# 에이전트/파이프라인 공통 출력 형식
+_OUTPUT_GUIDE = """
+# 출력 형식 가이드
+
+- 가능한 한 **한글로**, 명확하고 구조화된 형식으로 답변한다.
+- 필요한 경우 다음과 같이 섹션을 나눈다.
+  1. 요약
+  2. 핵심 트렌드
+  3. 타깃별 인사이트
+  4. 실행 아이디어
+  5. 참고 자료 (필요 시)
+
+- 근거가 된 내용이 있으면 '근거' 섹션에서 간단히 정리한다.
+- 도구 호출 로그나 내부 시스템 설명은 그대로 노출하지 않는다.
+""".strip()
+
 # -------------------------------------------------------------------
 # 트렌드 서브에이전트 시스템 프롬프트
 # (기존 SUBAGENT1_SYSTEM_PROMPT 를 기반으로 재구성)
@@ -48,6 +90,7 @@ SYSTEM_PROMPT = """
 - 항상 **첫 번째로 시도**되는 검색 도구
 - 내부 마크다운/트렌드 DB 검색
 - 결과가 충분하면 이것만으로도 답변 가능
+- 질문에 플랫폼/분류/기간이 분명하면 platform, category, date_from, date_to 필터를 함께 지정
 
 ## tavily_web_search_tool
 - 내부 검색 결과가 부족할 때만 사용
@@ -56,29 +99,17 @@ SYSTEM_PROMPT = """
 
 ## apply_reranker_tool
 - **RAG + Tavily 검색이 끝난 후 반드시 한 번 이상 사용**
-- `_last_docs`에 쌓인 모든 문서를 대상으로 재정렬
+- 이번 질문에서 검색 도구들이 모은 모든 문서를 대상으로 재정렬
 - 최종 답변을 생성하기 전 마지막 단계로 호출
 
-# 출력 형식 가이드
-
-- 가능한 한 **한글로**, 명확하고 구조화된 형식으로 답변한다.
-- 필요한 경우 다음과 같이 섹션을 나눈다.
-  1. 요약
-  2. 핵심 트렌드
-  3. 타깃별 인사이트
-  4. 실행 아이디어
-  5. 참고 자료 (필요 시)
-
-- 근거가 된 내용이 있으면 '근거' 섹션에서 간단히 정리한다.
-- 도구 호출 로그나 내부 시스템 설명은 그대로 노출하지 않는다.
-""".strip()
+""".strip() + "\n\n" + _OUTPUT_GUIDE
 
 # -------------------------------------------------------------------
 # LangGraph + LangChain v1 create_agent 기반 에이전트 생성
 # -------------------------------------------------------------------
 
-_memory = MemorySaver()
-
+# 체크포인터 없이 컴파일: 실행마다 독립된 state 로 시작한다 (thread 별 메시지 누적 없음)
+# 후속 질문 문맥이 필요하면 arun_trend_query(use_memory=True) 의 단기 메모리를 사용
 _trend_agent = create_agent(
     model=get_chat_model(),                  # 기존 LLM 팩토리 그대로 사용
     tools=[
@@ -88,61 +119,281 @@ _trend_agent = create_agent(
     ],
     system_prompt=SYSTEM_PROMPT,
     state_schema=AppState,
-    checkpointer=_memory,
 )
 
 
-def run_trend_query_for_api(
+# -------------------------------------------------------------------
+# 고정 파이프라인 모드 (RAG + 웹 동시 검색 -> 1회 재정렬 -> 1회 합성)
+# -------------------------------------------------------------------
+TrendStrategy = Literal["agent", "pipeline"]
+
+_NO_ANSWER = "응답을 생성하지 못했습니다."
+
+PIPELINE_SYSTEM_PROMPT = """
+너는 브랜드 마케팅 트렌드 분석가다.
+아래 [검색 자료] 만 근거로 사용자의 질문에 답한다.
+
+- 자료에 없는 수치/사례는 지어내지 않는다. 자료가 부족하면 부족하다고 밝힌다.
+- [브랜드 정보] 가 있으면 그 업종/타깃에 맞춰 인사이트와 실행 아이디어를 구체화한다.
+- 웹 자료(TAVILY)를 인용할 때는 참고 자료에 URL 을 남긴다.
+""".strip() + "\n\n" + _OUTPUT_GUIDE
+
+_PROFILE_LABELS = {
+    "brand_name": "브랜드명",
+    "name": "브랜드명",
+    "category": "업종",
+    "industry": "업종",
+    "tone_mood": "톤/무드",
+    "core_keywords": "핵심 키워드",
+    "target_age": "타깃 연령",
+    "target_gender": "타깃 성별",
+    "avoided_trends": "기피 트렌드",
+    "preferred_colors": "선호 색상",
+}
+
+
+def _format_history(history: List[QAPair]) -> str:
+    return "\n\n".join(f"Q: {question}\nA: {answer}" for question, answer in history)
+
+
+def _format_brand_profile(brand_profile: Optional[Dict[str, Any]]) -> str:
+    lines = [
+        f"- {label}: {brand_profile[key]}"
+        for key, label in _PROFILE_LABELS.items()
+        if brand_profile and brand_profile.get(key)
+    ]
+    return "\n".join(lines) or "(없음)"
+
+
+async def _gather_evidence(query: str) -> List[Document]:
+    """내부 RAG 하이브리드 검색과 웹 검색을 동시에 실행하고, 한 번 재정렬한 상위 문서를 돌려준다."""
+    tasks = [hybrid_search(query)]
+    if settings.tavily_api_key and settings.trend_pipeline_web_search:
+        tasks.append(web_search(query, max_results=5, search_depth="advanced"))
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    docs: List[Document] = []
+    for idx, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.warning("[trend_agent] 파이프라인 %s 검색 실패: %s", "RAG" if idx == 0 else "웹", result)
+            continue
+        docs.extend(result if idx == 0 else web_results_to_documents(result))
+
+    if not docs:
+        return []
+
+    try:
+        return await rerank_documents(query, docs)
+    except RuntimeError as e:
+        # 재정렬 백엔드를 쓸 수 없으면 검색 순서대로 사용
+        logger.warning("[trend_agent] 재정렬 생략: %s", e)
+        return docs[: settings.reranker_top_n]
+
+
+async def _synthesize(
+    query: str,
+    docs: List[Document],
+    *,
+    brand_profile: Optional[Dict[str, Any]] = None,
+    constraints: Optional[List[str]] = None,
+    previous_answer: Optional[str] = None,
+    history: Optional[List[QAPair]] = None,
+) -> str:
+    """근거 문서로 답변을 만드는 LLM 1회 호출. previous_answer 가 있으면 겹치지 않는 새 추천을 요청한다."""
+    sections = [f"[브랜드 정보]\n{_format_brand_profile(brand_profile)}"]
+    if history:
+        sections.append(f"[이전 대화]\n{_format_history(history)}")
+    sections.append(f"[질문]\n{query}")
+    if constraints:
+        sections.append("[추가 조건]\n" + "\n".join(f"- {c}" for c in constraints))
+    if previous_answer:
+        sections.append(
+            "[이전 답변]\n"
+            f"{previous_answer[: settings.history_tool_output_max_chars]}\n\n"
+            "이전 답변과 겹치지 않는 다른 트렌드/사례/아이디어 위주로 새로 추천해줘."
+        )
+    sections.append(f"[검색 자료]\n{format_evidence(docs) if docs else '(검색 결과 없음)'}")
+
+    prompt = [
+        SystemMessage(content=PIPELINE_SYSTEM_PROMPT),
+        HumanMessage(content="\n\n".join(sections)),
+    ]
+    ai_msg = await get_chat_model().ainvoke(prompt)
+    content = ai_msg.content
+    return content if isinstance(content, str) else str(content)
+
+
+async def _arun_pipeline(
+    query: str,
+    *,
+    brand_profile: Optional[Dict[str, Any]] = None,
+    history: Optional[List[QAPair]] = None,
+) -> Tuple[str, List[Document]]:
+    docs = await _gather_evidence(query)
+    logger.info("[trend_agent] 파이프라인 근거 문서 %d건", len(docs))
+    return await _synthesize(query, docs, brand_profile=brand_profile, history=history), docs
+
+
+# -------------------------------------------------------------------
+# 실행 진입점
+# -------------------------------------------------------------------
+@dataclass
+class TrendAnswer:
+    """트렌드 답변 + 근거 문서 묶음 참조 (trend_evidence_store, 없으면 None)."""
+    answer: str
+    evidence_id: Optional[str] = None
+
+
+async def arun_trend_query(
     query: str,
     *,
     mode: str = "brand",
     project_id: Optional[int] = None,
     brand_profile: Optional[Dict[str, Any]] = None,
     user_id: Optional[int] = None,
-) -> str:
+    strategy: Optional[TrendStrategy] = None,
+    use_cache: bool = True,
+    use_memory: bool = False,
+) -> TrendAnswer:
     """
-    FastAPI API에서 직접 호출할 때 사용하는 래퍼 함수.
+    트렌드 질의 실행. 답변과 근거 문서 묶음의 evidence_id 를 함께 돌려준다.
 
-    - AppState 구조를 맞춰서 초기 state를 구성하고
-    - _trend_agent.invoke(...) 를 호출한 뒤
-    - 마지막 AIMessage의 content만 뽑아서 문자열로 반환한다.
+    strategy:
+    - "pipeline": RAG/웹 검색을 동시에 실행하고 한 번 재정렬한 뒤 LLM 1회로 답변 (빠름)
+    - "agent"   : ReAct 에이전트가 도구 호출을 직접 결정 (여러 번의 LLM 왕복)
+    - None      : settings.trend_strategy_by_mode[mode] (없으면 "agent")
+
+    use_cache:
+    - True 면 사전 계산된 카테고리 리포트, 같은 mode/브랜드 프로필 지문의 비슷한 이전 질문 답변을 재사용한다.
+    - 카테고리 리포트는 업종/타깃만으로 만든 것이라, 프로필에 톤/키워드/기피 트렌드 등이 있으면
+      본문을 그대로 쓰지 않고 (답변 캐시 조회 후) 리포트 근거 문서로 이 프로필 기준 답변을 한 번 합성한다.
+    - "다른 추천" 처럼 새 답변이 필요한 경우(trend_retry) False 로 넘긴다. 새 답변은 캐시에 다시 저장된다.
+
+    use_memory:
+    - 기본(False)은 stateless: 이전 트렌드 질의가 프롬프트에 섞이지 않는다.
+    - True 면 같은 user_id/project_id 의 최근 settings.trend_memory_turns 개 질문/답변을 문맥으로 넘기고,
+      이번 질문/답변도 메모리에 추가한다. (이전 대화가 있으면 답변 캐시는 조회하지 않는다)
     """
+    strategy = strategy or settings.trend_strategy_by_mode.get(mode, "agent")
+
     logger.info(
-        "[trend_agent] run_trend_query_for_api user_id=%s project_id=%s mode=%s query=%s",
+        "[trend_agent] arun_trend_query user_id=%s project_id=%s mode=%s strategy=%s query=%s",
         user_id,
         project_id,
         mode,
+        strategy,
         query,
     )
 
-    initial_state: AppState = {
-        "messages": [HumanMessage(content=query)],
-        # AgentState 기본 필드(remaining_steps)는 기본값 사용
-        "mode": mode,                       # "brand" / "logo" / "shorts"
-        "project_id": project_id,
-        "brand_profile": brand_profile or {},
-        "trend_context": {},               # 처음에는 비어 있고, 도중에 도구/에이전트가 채울 수 있음
-        "meta": {"user_id": user_id},
-    }
+    memory = get_trend_memory() if use_memory else None
+    history = memory.get(memory_key(user_id, project_id)) if memory is not None else []
+
+    report = None
+    if use_cache and not history:
+        report = await find_precomputed_report(query, brand_profile)
+        if report is not None and not profile_needs_tailoring(brand_profile):
+            if memory is not None:
+                memory.append(memory_key(user_id, project_id), query, report["answer"])
+            return TrendAnswer(answer=report["answer"], evidence_id=report["evidence_id"])
+
+    fingerprint = profile_fingerprint(mode, brand_profile)
+    if use_cache and settings.trend_answer_cache_enabled and not history:
+        cached = await lookup_trend_answer(query, fingerprint)
+        if cached:
+            if memory is not None:
+                memory.append(memory_key(user_id, project_id), query, cached[0])
+            return TrendAnswer(answer=cached[0], evidence_id=cached[1])
 
-    # thread_id를 붙이고 싶으면 config에 넣을 수 있음 (옵션)
-    # config = {"configurable": {"thread_id": f"trend:{user_id}:{project_id}"}}
-    # result_state = _trend_agent.invoke(initial_state, config=config)
+    answer: Optional[str] = None
+    evidence_id: Optional[str] = None
+    if report is not None and report["evidence_id"]:
+        # 리포트 근거 문서는 재사용하고, 답변은 이 프로필(톤/키워드/기피 트렌드 등) 기준으로 다시 합성
+        report_docs = await load_trend_evidence(report["evidence_id"])
+        if report_docs:
+            logger.info("[trend_agent] 사전 계산 리포트 근거로 재합성 (%d건)", len(report_docs))
+            answer = await _synthesize(query, report_docs, brand_profile=brand_profile)
+            evidence_id = report["evidence_id"]
 
-    thread_id = f"trend:{user_id or 'anon'}:{project_id or 'none'}"
+    if answer is None:
+        if strategy == "pipeline":
+            answer, docs = await _arun_pipeline(query, brand_profile=brand_profile, history=history)
+        else:
+            answer, docs = await _arun_agent(
+                query,
+                mode=mode,
+                project_id=project_id,
+                brand_profile=brand_profile,
+                user_id=user_id,
+                history=history,
+            )
+        evidence_id = await save_trend_evidence(query, docs)
 
-    result_state = _trend_agent.invoke(
-        initial_state,
-        config={
-            "configurable": {
-                "thread_id": thread_id,
-            }
-        },
+    if memory is not None and answer != _NO_ANSWER:
+        memory.append(memory_key(user_id, project_id), query, answer)
+
+    if settings.trend_answer_cache_enabled and answer and answer != _NO_ANSWER and not history:
+        await store_trend_answer(query, fingerprint, answer, evidence_id=evidence_id)
+    return TrendAnswer(answer=answer, evidence_id=evidence_id)
+
+
+async def arun_trend_query_for_api(query: str, **kwargs: Any) -> str:
+    """
+    FastAPI API에서 직접 호출할 때 사용하는 래퍼 함수. 답변 문자열만 반환한다.
+    (인자는 arun_trend_query 와 같다)
+    """
+    return (await arun_trend_query(query, **kwargs)).answer
+
+
+async def arefine_trend_answer(
+    query: str,
+    *,
+    evidence_id: Optional[str],
+    brand_profile: Optional[Dict[str, Any]] = None,
+    constraints: Optional[List[str]] = None,
+    previous_answer: Optional[str] = None,
+    fetch_new: bool = False,
+) -> Optional[TrendAnswer]:
+    """
+    retry / refine 턴용. 이전 턴의 근거 문서(evidence_id)로 답변을 다시 만든다.
+
+    - fetch_new=False: 검색 없이 LLM 1회로 재합성 (retry, 조건만 바뀐 refine)
+    - fetch_new=True : 바뀐 질의로 새 문서를 검색해 기존 근거와 합친 뒤 재정렬, 재합성
+    - 근거가 만료/없으면 None -> 호출 측에서 arun_trend_query 로 전체 검색
+    """
+    cached_docs = await load_trend_evidence(evidence_id)
+    if cached_docs is None:
+        return None
+
+    docs = cached_docs
+    if fetch_new:
+        new_docs = await _gather_evidence(query)
+        try:
+            docs = await rerank_documents(query, cached_docs + new_docs)
+        except RuntimeError as e:
+            logger.warning("[trend_agent] 재정렬 생략: %s", e)
+            docs = (new_docs + cached_docs)[: settings.reranker_top_n]
+
+    logger.info(
+        "[trend_agent] arefine_trend_answer fetch_new=%s 근거 %d건 query=%s",
+        fetch_new,
+        len(docs),
+        query,
+    )
+    answer = await _synthesize(
+        query,
+        docs,
+        brand_profile=brand_profile,
+        constraints=constraints,
+        previous_answer=previous_answer,
     )
-    
-    messages = result_state["messages"]
+    new_evidence_id = await save_trend_evidence(query, docs) if fetch_new else evidence_id
+    return TrendAnswer(answer=answer, evidence_id=new_evidence_id)
+
+
+def _last_ai_text(messages: List[Any]) -> str:
     if not messages:
-        return "응답을 생성하지 못했습니다."
+        return _NO_ANSWER
 
     # 가장 마지막 AIMessage를 찾아서 반환
     for msg in reversed(messages):
@@ -156,4 +407,42 @@ def run_trend_query_for_api(
         return content
 
     # content가 list 형식일 수도 있으니 fallback 처리
-    return str(content)
\ No newline at end of file
+    return str(content)
+
+
+async def _arun_agent(
+    query: str,
+    *,
+    mode: str,
+    project_id: Optional[int],
+    brand_profile: Optional[Dict[str, Any]],
+    user_id: Optional[int],
+    history: Optional[List[QAPair]] = None,
+) -> Tuple[str, List[Document]]:
+    """
+    ReAct 에이전트 실행.
+
+    - AppState 구조를 맞춰서 초기 state를 구성하고
+    - _trend_agent.ainvoke(...) 를 호출한 뒤
+    - (마지막 AIMessage 의 content, 이번 실행에서 도구가 모은 문서) 를 반환한다.
+    - 체크포인터가 없어 매 실행이 독립적이다. history 가 있으면 그 질문/답변만 앞에 붙인다.
+    """
+    messages: List[Any] = []
+    for question, answer in history or []:
+        messages.extend([HumanMessage(content=question), AIMessage(content=answer)])
+    messages.append(HumanMessage(content=query))
+
+    initial_state: AppState = {
+        "messages": messages,
+        # AgentState 기본 필드(remaining_steps)는 기본값 사용
+        "mode": mode,                       # "brand" / "logo" / "shorts"
+        "project_id": project_id,
+        "brand_profile": brand_profile or {},
+        "trend_context": {},               # 처음에는 비어 있고, 도중에 도구/에이전트가 채울 수 있음
+        "retrieved_docs": [],
+        "meta": {"user_id": user_id},
+    }
+
+    result_state = await _trend_agent.ainvoke(initial_state)
+
+    return _last_ai_text(result_state["messages"]), list(result_state.get("retrieved_docs") or [])
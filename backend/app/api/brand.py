@@ -3,19 +3,26 @@
 # 작성일: 2025-11-20
 # 수정내역
 # - 2025-11-20: 초기 작성
+# - 2026-10-18: SSE 스트리밍 엔드포인트(/brand/chat/stream) 추가
+# - 2026-10-18: async 엔드포인트로 변경 (graph.ainvoke, AsyncOrmSession)
+# - 2026-10-18: current_user 타입을 CurrentUser 스냅샷으로 변경 (principal 캐시)
+
+import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.schemas.chat import BrandChatRequest, BrandChatResponse, CreateBrandProjectRequest, CreateBrandProjectResponse
-from app.db.orm import get_orm_session
+from app.db.orm import get_async_orm_session, run_in_orm_session, AsyncOrmSession
 from app.core.deps import get_current_user
-from app.models.auth import UserInfo
+from app.schemas.auth import CurrentUser
 
 from langchain_core.messages import HumanMessage
 from app.agents.state import AppState 
 from app.agents.brand_agent import build_brand_graph
 from app.services.brand_service import persist_brand_from_graph_state
+from app.utils.stream_utils import stream_graph_events, sse_event, SSE_HEADERS
 
 from uuid import uuid4
 
@@ -24,21 +31,34 @@ router = APIRouter(
     tags=["brand"],
 )
 
+logger = logging.getLogger(__name__)
+
 brand_graph = build_brand_graph()
 
-@router.post("/chat", response_model=BrandChatResponse)
-def chat_brand(
+# 스트리밍 시 토큰을 흘려보낼 노드 (사용자에게 보이는 최종 답변을 만드는 노드만)
+BRAND_TOKEN_NODES = ("brand_chat",)
+
+
+def _new_brand_state(message: str) -> AppState:
+    return {
+        "messages": [HumanMessage(content=message)],
+        "mode": "brand",
+        "project_id": None,
+        "project_draft": {},
+        "brand_profile": {},
+        "trend_context": {},
+        "meta": {},
+    }
+
+
+async def _prepare_brand_turn(
     req: BrandChatRequest,
-    db: Session = Depends(get_orm_session),
-    current_user: UserInfo = Depends(get_current_user),
-):
+    current_user: CurrentUser,
+) -> tuple[str, dict, AppState]:
     """
-    브랜드 정보 수집/브랜드 상담 챗봇 엔드포인트.
-    project_id 는 처음에는 None 이고,
-    사용자가 '생성하기' 액션을 했을 때
-    실제 prod_grp + brand_info 를 생성하고 project_id 를 발급
+    brand_session_id / config 를 정하고, 이전 state 를 복원해 이번 턴의 입력 state 를 만든다.
+    (일반/스트리밍 엔드포인트 공통)
     """
-
     brand_session_id = req.brand_session_id or str(uuid4())
     thread_id = f"user-{current_user.id}-project-brand-{brand_session_id}"
     
@@ -50,7 +70,7 @@ def chat_brand(
 
     # 이전 state 복원 시도
     try:
-        previous_state_result = brand_graph.get_state(config)
+        previous_state_result = await brand_graph.aget_state(config)
         if previous_state_result and previous_state_result.values:
             # 이전 state가 있으면 그것을 기반으로 사용
             state = dict(previous_state_result.values)
@@ -59,26 +79,10 @@ def chat_brand(
             state["messages"].append(HumanMessage(content=req.message))
         else:
             # 이전 state가 없으면 새로 생성
-            state: AppState = {
-                "messages": [HumanMessage(content=req.message)],
-                "mode": "brand",
-                "project_id": None,
-                "project_draft": {},
-                "brand_profile": {},
-                "trend_context": {},
-                "meta": {},
-            }
+            state = _new_brand_state(req.message)
     except Exception:
         # get_state() 실패 시 새로 생성
-        state: AppState = {
-            "messages": [HumanMessage(content=req.message)],
-            "mode": "brand",
-            "project_id": None,
-            "project_draft": {},
-            "brand_profile": {},
-            "trend_context": {},
-            "meta": {},
-        }
+        state = _new_brand_state(req.message)
 
     if req.grp_nm:
         state["project_draft"] = {
@@ -87,11 +91,19 @@ def chat_brand(
             "creator_id": current_user.id,
         }
 
-    new_state = brand_graph.invoke(
-        state,
-        config=config,
-    )
+    return brand_session_id, config, state
+
 
+def _finish_brand_turn(
+    db: Session,
+    current_user: CurrentUser,
+    new_state: AppState,
+    brand_session_id: str,
+) -> BrandChatResponse:
+    """
+    그래프 실행 결과로 persist_request 를 처리하고 응답을 만든다.
+    (일반/스트리밍 엔드포인트 공통)
+    """
     messages = new_state["messages"]
     last_msg = messages[-1]
     reply_text = getattr(last_msg, "content", str(last_msg))
@@ -118,11 +130,78 @@ def chat_brand(
     )
 
 
+@router.post("/chat", response_model=BrandChatResponse)
+async def chat_brand(
+    req: BrandChatRequest,
+    db: AsyncOrmSession = Depends(get_async_orm_session),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    브랜드 정보 수집/브랜드 상담 챗봇 엔드포인트.
+    project_id 는 처음에는 None 이고,
+    사용자가 '생성하기' 액션을 했을 때
+    실제 prod_grp + brand_info 를 생성하고 project_id 를 발급
+    """
+    brand_session_id, config, state = await _prepare_brand_turn(req, current_user)
+
+    new_state = await brand_graph.ainvoke(
+        state,
+        config=config,
+    )
+
+    return await db.run(_finish_brand_turn, current_user, new_state, brand_session_id)
+
+
+@router.post("/chat/stream")
+async def chat_brand_stream(
+    req: BrandChatRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    브랜드 챗봇 스트리밍(SSE) 엔드포인트.
+
+    - event: node  → 노드 진행 상황 (예: trend_search started)
+    - event: token → brand_chat 노드의 응답 토큰
+    - event: final → /brand/chat 과 동일한 BrandChatResponse
+    - event: error → 실패 사유
+    """
+    brand_session_id, config, state = await _prepare_brand_turn(req, current_user)
+
+    async def event_stream():
+        try:
+            async for event in stream_graph_events(
+                brand_graph,
+                state,
+                config,
+                token_nodes=BRAND_TOKEN_NODES,
+            ):
+                yield event
+
+            snapshot = await brand_graph.aget_state(config)
+            # 의존성 세션은 응답 시작 전에 닫히므로 새 세션으로 저장한다
+            response = await run_in_orm_session(
+                _finish_brand_turn,
+                current_user,
+                dict(snapshot.values),
+                brand_session_id,
+            )
+            yield sse_event("final", response.model_dump())
+        except Exception as e:
+            logger.exception("[brand] chat stream failed")
+            yield sse_event("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
 @router.post("/create-project", response_model=CreateBrandProjectResponse, status_code=status.HTTP_201_CREATED)
-def create_brand_project(
+async def create_brand_project(
     req: CreateBrandProjectRequest,
-    db: Session = Depends(get_orm_session),
-    current_user: UserInfo = Depends(get_current_user),
+    db: AsyncOrmSession = Depends(get_async_orm_session),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     브랜드 프로젝트 생성 엔드포인트.
@@ -139,7 +218,7 @@ def create_brand_project(
 
     # 이전 state에서 brand_profile 가져오기
     try:
-        previous_state_result = brand_graph.get_state(config)
+        previous_state_result = await brand_graph.aget_state(config)
         if previous_state_result and previous_state_result.values:
             brand_profile = previous_state_result.values.get("brand_profile") or {}
         else:
@@ -175,8 +254,8 @@ def create_brand_project(
         "creator_id": current_user.id,
     }
     
-    group = persist_brand_project(
-        db,
+    group = await db.run(
+        persist_brand_project,
         creator_id=current_user.id,
         project_id=None,  # 새로 생성
         project_draft=project_draft,
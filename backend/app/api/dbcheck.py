@@ -3,10 +3,12 @@
 # 작성일: 2025-10-28
 # 수정내역
 # - 2025-10-28: 초기 작성
+# - 2026-10-18: 커넥션 풀 통계 조회 추가
 
 
 from fastapi import APIRouter, Depends
-from app.db.session import get_db_session
+from app.db.orm import engine
+from app.db.session import get_db_session, oracle_db
 
 router = APIRouter(prefix="/db", tags=["db"])
 
@@ -19,3 +21,12 @@ def db_ping(conn=Depends(get_db_session)):
         return {"status": "ok", "db_result": row[0] if row else None}
     except Exception as e:
         return {"status": "error", "error": str(e)}
+
+
+@router.get("/pool")
+def db_pool_stats():
+    """Oracle 커넥션 풀 사용 현황 (raw 커서 / SQLAlchemy 공용 풀)."""
+    return {
+        "oracle_pool": oracle_db.stats(),
+        "sqlalchemy_pool": engine.pool.status(),
+    }
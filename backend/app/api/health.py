@@ -3,9 +3,14 @@
 # 작성일: 2025-10-28
 # 수정내역
 # - 2025-10-28: 초기 작성
+# - 2026-10-18: 벡터스토어 상태 조회 추가
+# - 2026-10-18: 임베딩 캐시 통계 조회 추가
 
 from fastapi import APIRouter
 from app.core.config import settings
+from app.llm.client import get_embeddings
+from app.llm.embedding_cache import CachedEmbeddings
+from app.services.vector_service import get_vectorstore_health
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -17,3 +22,22 @@ def health_check():
         "app_name": settings.app_name,
         "version": settings.app_version,
     }
+
+
+@router.get("/vectorstore")
+def vectorstore_health():
+    """프로세스에 열려 있는 벡터스토어(경로, 컬렉션)별 문서 수/오픈 정보."""
+    stores = get_vectorstore_health()
+    return {
+        "status": "ok" if all(s["status"] == "ok" for s in stores) else "error",
+        "stores": stores,
+    }
+
+
+@router.get("/embeddings")
+def embedding_cache_health():
+    """임베딩 캐시 적중/미스 횟수 (캐시 비활성화 시 enabled=False)."""
+    embeddings = get_embeddings()
+    if not isinstance(embeddings, CachedEmbeddings):
+        return {"enabled": False}
+    return {"enabled": True, "model": embeddings.model, **embeddings.stats()}
@@ -3,18 +3,25 @@
 # 작성일: 2025-11-20
 # 수정내역
 # - 2025-11-20: 초기 작성
+# - 2026-10-18: SSE 스트리밍 엔드포인트(/logo/chat/stream) 추가, 응답에 세션 ID 포함
+# - 2026-10-18: async 엔드포인트로 변경 (graph.ainvoke, AsyncOrmSession)
+# - 2026-10-18: 턴마다 meta 를 초기화하지 않도록 변경 (히스토리 요약 유지)
+# - 2026-10-18: current_user 타입을 CurrentUser 스냅샷으로 변경 (principal 캐시)
+
+import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
 
 from app.schemas.chat import LogoChatRequest, LogoChatResponse
-from app.db.orm import get_orm_session
+from app.db.orm import get_async_orm_session, AsyncOrmSession
 from app.core.deps import get_current_user
-from app.models.auth import UserInfo
+from app.schemas.auth import CurrentUser
 
 from langchain_core.messages import HumanMessage
 from app.agents.state import AppState 
 from app.agents.logo_agent import build_logo_graph
+from app.utils.stream_utils import stream_graph_events, sse_event, SSE_HEADERS
 
 from uuid import uuid4
 
@@ -23,32 +30,28 @@ router = APIRouter(
     tags=["logo"],
 )
 
+logger = logging.getLogger(__name__)
+
 logo_graph = build_logo_graph()
 
-@router.post("/chat", response_model=LogoChatResponse)
-def chat_logo(
+
+async def _prepare_logo_turn(
     req: LogoChatRequest,
-    db: Session = Depends(get_orm_session),
-    current_user: UserInfo = Depends(get_current_user),
-):
+    db: AsyncOrmSession,
+    current_user: CurrentUser,
+) -> tuple[str, dict, AppState]:
     """
-    로고 브리프/생성을 위한 챗봇 엔드포인트.
-
-    - 반드시 project_id 가 있어야 한다.
-      (브랜드 챗봇을 통해 이미 생성된 프로젝트/브랜드를 대상으로 하기 때문)
-    - 브랜드 챗봇에서 project_id 가 생성된 후,
-      같은 화면에서 '로고 만들기'를 선택하면 그 project_id 를 들고 이 엔드포인트를 친다.
+    project_id 검증, 브랜드 프로필 로딩 후 이번 턴의 입력 state / config 를 만든다.
+    (일반/스트리밍 엔드포인트 공통)
     """
-    # 프로젝트 id 확인
     if req.project_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="logo 챗봇 호출 시 project_id 는 필수입니다.",
         )
-    
-    # TODO: logo 에이전트 호출
+
     from app.services.project_service import load_brand_profile_for_agent
-    brand_profile = load_brand_profile_for_agent(db, req.project_id)
+    brand_profile = await db.run(load_brand_profile_for_agent, req.project_id)
 
     logo_session_id = req.logo_session_id or str(uuid4())
 
@@ -59,16 +62,17 @@ def chat_logo(
         "project_draft": {},         
         "brand_profile": brand_profile,
         "trend_context": {},
-        "meta": {},
+        # meta 는 넘기지 않는다 (체크포인트의 meta["history"] 롤링 요약을 유지)
     }
 
-    new_state = logo_graph.invoke(
-        state,
-        config={"configurable": {
-            "thread_id": f"user-{current_user.id}-project-{req.project_id}-logo-{logo_session_id}"
-        }},
-    )
+    config = {"configurable": {
+        "thread_id": f"user-{current_user.id}-project-{req.project_id}-logo-{logo_session_id}"
+    }}
+
+    return logo_session_id, config, state
 
+
+def _to_logo_response(req: LogoChatRequest, new_state: AppState, logo_session_id: str) -> LogoChatResponse:
     messages = new_state["messages"]
     last_msg = messages[-1]
     reply_text = getattr(last_msg, "content", str(last_msg))
@@ -76,4 +80,69 @@ def chat_logo(
     return LogoChatResponse(
         reply=reply_text,
         project_id=req.project_id,
-    )
\ No newline at end of file
+        logo_session_id=logo_session_id,
+    )
+
+
+@router.post("/chat", response_model=LogoChatResponse)
+async def chat_logo(
+    req: LogoChatRequest,
+    db: AsyncOrmSession = Depends(get_async_orm_session),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    로고 브리프/생성을 위한 챗봇 엔드포인트.
+
+    - 반드시 project_id 가 있어야 한다.
+      (브랜드 챗봇을 통해 이미 생성된 프로젝트/브랜드를 대상으로 하기 때문)
+    - 브랜드 챗봇에서 project_id 가 생성된 후,
+      같은 화면에서 '로고 만들기'를 선택하면 그 project_id 를 들고 이 엔드포인트를 친다.
+    """
+    logo_session_id, config, state = await _prepare_logo_turn(req, db, current_user)
+
+    new_state = await logo_graph.ainvoke(
+        state,
+        config=config,
+    )
+
+    return _to_logo_response(req, new_state, logo_session_id)
+
+
+@router.post("/chat/stream")
+async def chat_logo_stream(
+    req: LogoChatRequest,
+    db: AsyncOrmSession = Depends(get_async_orm_session),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    로고 챗봇 스트리밍(SSE) 엔드포인트.
+
+    - event: node  → 노드 진행 상황
+    - event: token → logo_chat 노드의 응답 토큰
+    - event: final → /logo/chat 과 동일한 LogoChatResponse
+    - event: error → 실패 사유
+    """
+    logo_session_id, config, state = await _prepare_logo_turn(req, db, current_user)
+
+    async def event_stream():
+        try:
+            async for event in stream_graph_events(
+                logo_graph,
+                state,
+                config,
+                token_nodes=("logo_chat",),
+            ):
+                yield event
+
+            snapshot = await logo_graph.aget_state(config)
+            response = _to_logo_response(req, dict(snapshot.values), logo_session_id)
+            yield sse_event("final", response.model_dump())
+        except Exception as e:
+            logger.exception("[logo] chat stream failed")
+            yield sse_event("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
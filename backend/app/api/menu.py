@@ -4,32 +4,51 @@
 # 작성일: 2025-11-17
 # 수정내역
 # - 2025-11-17: 초기 작성
+# - 2026-10-18: current_user 타입을 CurrentUser 스냅샷으로 변경 (principal 캐시)
+# - 2026-10-18: 권한별 메뉴 캐시 + ETag/Cache-Control (304 재검증), 관리자용 캐시 무효화 추가
+# - 2026-10-18: 캐시 무효화 범위(워커 단위) 설명 추가
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response, status
 from sqlalchemy.orm import Session
 
 from app.db.orm import get_orm_session
 from app.schemas.menu import MenuBase
-from app.services.menu_service import get_menus_by_role
-from app.core.deps import get_optional_user, GUEST_ROLE_ID
-from app.models.auth import UserInfo     
+from app.services.menu_service import get_cached_menus, invalidate_menu_cache
+from app.core.deps import get_admin_user, get_optional_user, GUEST_ROLE_ID
+from app.schemas.auth import CurrentUser
 
 router = APIRouter(
     prefix="/menus",
     tags=["menu"],
 )
 
+# 권한(토큰)마다 응답이 다르므로 공유 캐시에는 두지 않고, 브라우저는 매번 ETag 로 재검증
+_CACHE_HEADERS = {
+    "Cache-Control": "private, no-cache",
+    "Vary": "Authorization",
+}
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
 @router.get("", response_model=List[MenuBase])
 def get_menus(
     db: Session = Depends(get_orm_session),
-    current_user: Optional[UserInfo] = Depends(get_optional_user),
+    current_user: Optional[CurrentUser] = Depends(get_optional_user),
+    if_none_match: Optional[str] = Header(default=None),
 ):
     """
     권한별 메뉴 목록 조회 (로그인 여부 자동 인식)
     - 비로그인: role_id = 3 (게스트)
     - 로그인: 현재 유저의 role_id
+    - 권한별로 직렬화된 응답을 캐시하고, If-None-Match 가 ETag 와 같으면 304 를 돌려준다.
     """
     if current_user is None:
         # 비로그인 유저 → 게스트 권한
@@ -38,5 +57,22 @@ def get_menus(
         # 로그인 유저 → 본인의 role_id
         role_id = current_user.role_id
 
-    menus = get_menus_by_role(db, role_id)
-    return menus
+    cached = get_cached_menus(db, role_id)
+    headers = {**_CACHE_HEADERS, "ETag": cached.etag}
+    if _etag_matches(if_none_match, cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+@router.post("/cache/invalidate", status_code=status.HTTP_204_NO_CONTENT)
+def invalidate_menus(
+    role_id: Optional[int] = None,
+    current_user: CurrentUser = Depends(get_admin_user),
+):
+    """
+    메뉴 캐시 무효화 (관리자 전용). role_id 가 없으면 전체.
+    - 이 요청을 처리한 워커(프로세스)의 캐시만 비운다.
+      다른 워커는 menu_cache_ttl_seconds 가 지나야 새 메뉴를 내려준다.
+    """
+    invalidate_menu_cache(role_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,15 +2,19 @@
 # 작성일: 2025-11-18
 # 수정내역
 # - 2025-11-18: 초기 작성
+# - 2026-10-18: current_user 타입을 CurrentUser 스냅샷으로 변경 (principal 캐시)
+# - 2026-10-18: 목록에 실제 로고/숏폼 개수 반환, 키셋 페이지네이션(limit / before_grp_id, X-Next-Cursor)
+# - 2026-10-18: limit 을 주지 않으면 전체 목록 반환 (대시보드 호환)
 
-from typing import List
-from fastapi import APIRouter, Depends, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.orm import Session
 
 from fastapi import HTTPException
+from app.core.config import settings
 from app.core.deps import get_current_user
 from app.db.orm import get_orm_session
-from app.models.auth import UserInfo
+from app.schemas.auth import CurrentUser
 from app.schemas.project import ProjectGrp, ProjectListItem
 from app.services.project_service import create_project_group, get_user_projects, load_project_group_entity, delete_project_group
 
@@ -28,7 +32,7 @@ router = APIRouter(
 def create_project_group_endpoint(
     payload: ProjectGrp,
     db: Session = Depends(get_orm_session),
-    current_user: UserInfo = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     프로젝트 그룹 생성 API
@@ -56,28 +60,32 @@ def create_project_group_endpoint(
     response_model=List[ProjectListItem],
 )
 def get_user_projects_endpoint(
+    response: Response,
+    limit: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=settings.project_list_max_page_size,
+        description="페이지 크기. 없으면 전체 목록",
+    ),
+    before_grp_id: Optional[int] = Query(default=None, description="이전 페이지 응답의 X-Next-Cursor 값"),
     db: Session = Depends(get_orm_session),
-    current_user: UserInfo = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
-    현재 로그인한 사용자의 프로젝트 목록 조회.
-    - 로고/숏폼 개수는 현재 0으로 반환 (나중에 generation_prod 조인하여 추가 가능)
+    현재 로그인한 사용자의 프로젝트 목록 조회 (최신순, 로고/숏폼 개수 포함).
+    - limit 이 없으면 전체 목록을 돌려준다. (기존 대시보드 호환)
+    - limit 이 있고 다음 페이지가 있으면 X-Next-Cursor 헤더에 커서(grp_id)를 내려준다.
+      다음 요청에서 before_grp_id 로 넘기면 이어서 조회한다.
     """
-    projects = get_user_projects(db, current_user.id)
-    
-    # ProjectListItem으로 변환 (로고/숏폼 개수는 추후 추가)
-    result = []
-    for project in projects:
-        result.append(ProjectListItem(
-            grp_id=project.grp_id,
-            grp_nm=project.grp_nm,
-            grp_desc=project.grp_desc,
-            creator_id=project.creator_id,
-            logo_count=0,  # TODO: generation_prod에서 조회
-            shortform_count=0,  # TODO: generation_prod에서 조회
-        ))
-    
-    return result
+    projects, next_cursor = get_user_projects(
+        db,
+        current_user.id,
+        limit=limit,
+        before_grp_id=before_grp_id,
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return projects
 
 
 @router.get(
@@ -87,7 +95,7 @@ def get_user_projects_endpoint(
 def get_project_detail_endpoint(
     project_id: int,
     db: Session = Depends(get_orm_session),
-    current_user: UserInfo = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     프로젝트 상세 조회.
@@ -130,7 +138,7 @@ def get_project_detail_endpoint(
 def delete_project_group_endpoint(
     project_id: int,
     db: Session = Depends(get_orm_session),
-    current_user: UserInfo = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     프로젝트 삭제 (소프트 삭제: del_yn을 'Y'로 변경).
@@ -2,17 +2,26 @@
 # 작성일: 2025-11-19
 # 수정내역
 # - 2025-11-19: 초기 작성
+# - 2026-10-18: async 엔드포인트로 변경
+# - 2026-10-18: 실행 방식(strategy) 선택 추가
+# - 2026-10-18: 단기 메모리(use_memory) 옵션 추가
+# - 2026-10-18: 카테고리 리포트 사전 계산/조회 엔드포인트 추가
+# - 2026-10-18: current_user 타입을 CurrentUser 스냅샷으로 변경 (principal 캐시)
+# - 2026-10-18: 리포트 사전 계산은 관리자 전용, spec 개수/동시 실행 수 상한 추가
 
 from __future__ import annotations
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Literal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
-from app.core.deps import get_current_user
-from app.models.auth import UserInfo
-from app.agents.trend_agent import run_trend_query_for_api
+from app.core.config import settings
+from app.core.deps import get_admin_user, get_current_user
+from app.schemas.auth import CurrentUser
+from app.agents.trend_agent import arun_trend_query_for_api
+from app.services.trend_report_service import ReportSpec, get_trend_report_store, precompute_reports
 
 router = APIRouter(
     prefix="/trend",
@@ -30,10 +39,18 @@ class TrendQueryRequest(BaseModel):
         description="에이전트 모드 (brand | logo | shorts)",
         examples=["brand"],
     )
+    strategy: Optional[Literal["agent", "pipeline"]] = Field(
+        default=None,
+        description="실행 방식 (pipeline: 고정 검색 파이프라인 | agent: ReAct 에이전트). 없으면 mode 별 기본값",
+    )
     project_id: Optional[int] = Field(
         default=None,
         description="옵션: 연결할 프로젝트/브랜드 ID",
     )
+    use_memory: bool = Field(
+        default=False,
+        description="true 면 같은 사용자/프로젝트의 최근 트렌드 질문/답변 몇 개를 후속 질문 문맥으로 사용",
+    )
 
     # 테스트용 브랜드 컨텍스트 (Swagger에서 기본값으로 들어가게)
     brand_name: Optional[str] = Field(
@@ -51,9 +68,9 @@ class TrendQueryResponse(BaseModel):
 
 
 @router.post("/query", response_model=TrendQueryResponse)
-def query_trend(
+async def query_trend(
     payload: TrendQueryRequest,
-    current_user: UserInfo = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     트렌드/마케팅 관련 질문을 LangGraph 트렌드 에이전트에게 전달하는 엔드포인트.
@@ -64,11 +81,72 @@ def query_trend(
     if payload.industry:
         brand_profile["industry"] = payload.industry
 
-    answer = run_trend_query_for_api(
+    answer = await arun_trend_query_for_api(
         query=payload.query,
         mode=payload.mode,
         project_id=payload.project_id,
         brand_profile=brand_profile,
         user_id=current_user.id,
+        strategy=payload.strategy,
+        use_memory=payload.use_memory,
     )
     return TrendQueryResponse(answer=answer)
+
+
+class TrendReportSpec(BaseModel):
+    category: str = Field(..., description="업종 카테고리", examples=["카페"])
+    audience: str = Field(default="", description="타깃 (예: '20대 여성'). 비우면 전체")
+    platform: str = Field(default="", description="플랫폼 (instagram | youtube | tiktok). 비우면 전체")
+
+
+class TrendPrecomputeRequest(BaseModel):
+    specs: List[TrendReportSpec] = Field(..., min_length=1, max_length=settings.trend_report_max_specs)
+    concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=settings.trend_report_max_concurrency,
+        description="동시 실행 수 (없으면 설정값)",
+    )
+    wait: bool = Field(default=False, description="true 면 생성이 끝날 때까지 기다렸다가 결과 집계를 반환")
+
+
+class TrendPrecomputeResponse(BaseModel):
+    accepted: int
+    stats: Optional[Dict[str, Any]] = None
+
+
+class TrendReportItem(BaseModel):
+    category: str
+    audience: str
+    platform: str
+    query: str
+    answer: str
+    created_at: float
+
+
+@router.post("/reports/precompute", response_model=TrendPrecomputeResponse)
+async def precompute_trend_reports(
+    payload: TrendPrecomputeRequest,
+    background_tasks: BackgroundTasks,
+    current_user: CurrentUser = Depends(get_admin_user),
+):
+    """
+    (카테고리, 타깃, 플랫폼) 목록의 트렌드 리포트를 미리 만들어 저장한다.
+    저장된 리포트는 브랜드 프로필이 맞는 trend_search 질의에 바로 사용된다.
+    기본은 백그라운드 실행 (wait=true 면 완료 후 응답).
+    - 유료 LLM/웹 검색 호출을 일괄로 만들기 때문에 관리자만 호출할 수 있다.
+    """
+    specs = [ReportSpec(spec.category, spec.audience, spec.platform) for spec in payload.specs]
+    if payload.wait:
+        stats = await precompute_reports(specs, concurrency=payload.concurrency)
+        return TrendPrecomputeResponse(accepted=len(specs), stats=stats.as_dict())
+
+    background_tasks.add_task(precompute_reports, specs, concurrency=payload.concurrency)
+    return TrendPrecomputeResponse(accepted=len(specs))
+
+
+@router.get("/reports", response_model=List[TrendReportItem])
+async def list_trend_reports(current_user: CurrentUser = Depends(get_current_user)):
+    """저장된 사전 계산 리포트 목록."""
+    rows = await run_in_threadpool(get_trend_report_store().list_all)
+    return [TrendReportItem(**row) for row in rows]
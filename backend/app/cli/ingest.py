@@ -0,0 +1,74 @@
+# 트렌드 RAG 문서 적재 CLI
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성
+#
+# 사용법 (backend 폴더에서):
+#   python -m app.cli.ingest <문서 폴더> [--collection RAG_md] [--chunk-size 1000] [--dry-run]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from app.core.config import settings
+from app.services.ingest_service import ingest_directory
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli.ingest",
+        description="markdown/PDF/HTML 트렌드 문서를 Chroma 컬렉션에 증분 적재합니다.",
+    )
+    parser.add_argument("source_dir", help="적재할 문서 폴더 (또는 파일) 경로")
+    parser.add_argument(
+        "--persist-dir",
+        default=None,
+        help=f"Chroma 저장 경로 (기본값: {settings.vector_store_dir}, 프로젝트 루트 기준)",
+    )
+    parser.add_argument(
+        "--collection",
+        default=None,
+        help=f"컬렉션 이름 (기본값: {settings.vector_store_collection})",
+    )
+    parser.add_argument("--chunk-size", type=int, default=None, help=f"기본값: {settings.ingest_chunk_size}")
+    parser.add_argument("--chunk-overlap", type=int, default=None, help=f"기본값: {settings.ingest_chunk_overlap}")
+    parser.add_argument("--batch-size", type=int, default=None, help=f"기본값: {settings.ingest_batch_size}")
+    parser.add_argument("--concurrency", type=int, default=None, help=f"기본값: {settings.ingest_concurrency}")
+    parser.add_argument("--max-retries", type=int, default=None, help=f"기본값: {settings.ingest_max_retries}")
+    parser.add_argument(
+        "--no-prune",
+        action="store_true",
+        help="파일에서 더 이상 나오지 않는 예전 청크를 삭제하지 않음",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="임베딩/쓰기 없이 집계만 출력")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    stats = asyncio.run(
+        ingest_directory(
+            args.source_dir,
+            persist_directory=args.persist_dir,
+            collection_name=args.collection,
+            chunk_size=args.chunk_size,
+            chunk_overlap=args.chunk_overlap,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            max_retries=args.max_retries,
+            prune=not args.no_prune,
+            dry_run=args.dry_run,
+        )
+    )
+    print(json.dumps(stats.as_dict(), ensure_ascii=False, indent=2))
+    return 1 if stats.files_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# 트렌드 카테고리 리포트 사전 계산 CLI
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성
+#
+# 사용법 (backend 폴더에서):
+#   python -m app.cli.precompute_trends                       # 기본 목록(settings.trend_report_default_specs) + 갱신 주기가 지난 리포트
+#   python -m app.cli.precompute_trends 카페 "베이커리|20대 여성|instagram" [--concurrency 3]
+#   (항목 형식: 카테고리[|타깃[|플랫폼]])
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from app.core.config import settings
+from app.services.trend_report_service import ReportSpec, precompute_reports, refresh_reports
+
+
+def parse_spec(value: str) -> ReportSpec:
+    parts = [part.strip() for part in value.split("|")]
+    if not parts[0] or len(parts) > 3:
+        raise argparse.ArgumentTypeError(f"형식 오류: {value!r} (카테고리[|타깃[|플랫폼]])")
+    return ReportSpec(*parts)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli.precompute_trends",
+        description="(카테고리, 타깃, 플랫폼) 트렌드 리포트를 미리 생성해 저장합니다.",
+    )
+    parser.add_argument(
+        "specs",
+        nargs="*",
+        type=parse_spec,
+        help="카테고리[|타깃[|플랫폼]] 목록. 없으면 기본 목록 + 갱신 주기가 지난 저장 리포트",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help=f"동시 실행 수 (기본값: {settings.trend_report_concurrency})",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    if args.specs:
+        stats = asyncio.run(precompute_reports(args.specs, concurrency=args.concurrency))
+    else:
+        stats = asyncio.run(refresh_reports(concurrency=args.concurrency))
+    print(json.dumps(stats.as_dict(), ensure_ascii=False, indent=2))
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,35 @@
 # 작성일: 2025-10-28
 # 수정내역
 # - 2025-10-28: 초기 작성
+# - 2026-10-18: 브랜드 그래프 턴 이해 모드 설정 추가
+# - 2026-10-18: 의도 사전 분류 임계값 설정 추가
+# - 2026-10-18: 그래프 체크포인터 설정 추가
+# - 2026-10-18: 브랜드 그래프 체크포인트 압축 설정 추가
+# - 2026-10-18: 대화 히스토리 롤링 요약/토큰 예산 설정 추가
+# - 2026-10-18: 벡터스토어 워밍업 설정 추가
+# - 2026-10-18: 임베딩 캐시 설정 추가
+# - 2026-10-18: 트렌드 문서 적재(ingest) 설정 추가
+# - 2026-10-18: 하이브리드(BM25 + 벡터) 검색 설정 추가
+# - 2026-10-18: Reranker 백엔드 선택/캐시 설정 추가
+# - 2026-10-18: 웹 검색(Tavily) 결과 캐시 설정 추가
+# - 2026-10-18: 트렌드 실행 방식(agent/pipeline) 설정 추가
+# - 2026-10-18: 트렌드 답변 시맨틱 캐시 설정 추가
+# - 2026-10-18: 트렌드 근거 문서 저장소 설정 추가
+# - 2026-10-18: 트렌드 단기 메모리 설정 추가 (기본 stateless)
+# - 2026-10-18: 트렌드 카테고리 리포트 사전 계산 설정 추가
+# - 2026-10-18: Oracle 커넥션 풀 설정 추가 (raw 커서 / SQLAlchemy 공용)
+# - 2026-10-18: 인증 유저(principal) 캐시 설정 추가
+# - 2026-10-18: ORM 관계 기본 로딩(raise) 설정 추가
+# - 2026-10-18: 권한별 메뉴 캐시 설정 추가
+# - 2026-10-18: 프로젝트 목록 페이지 크기 설정 추가
+# - 2026-10-18: 트렌드 리포트 사전 계산 spec 수/동시 실행 수 상한 설정 추가
+# - 2026-10-18: 트렌드 리포트 주기 갱신 기본값 끔
+# - 2026-10-18: 프로젝트 목록 기본 페이지 크기 제거 (limit 없으면 전체 목록)
+# - 2026-10-18: 메뉴 캐시 기본 TTL 5분으로 단축
+# - 2026-10-18: 임베딩 캐시 최대 행 수/보관 기간 설정 추가
+# - 2026-10-18: 의도 사전 분류 임계값에서 finalize 제외
+
+from typing import Dict, List, Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,6 +47,50 @@ class Settings(BaseSettings):
     openai_embedding_model: str = "text-embedding-3-small"
     openai_temperature: float = 0.0
     
+    # 브랜드 그래프: 턴 이해 단계 구성
+    # - "fused": brand_understand 한 번의 호출로 의도 분류 + 브랜드 정보 추출
+    # - "split": brand_collect / brand_intention 두 호출을 병렬 실행 후 brand_route 에서 합류 (A/B 비교용)
+    brand_understand_mode: str = "fused"
+
+    # 브랜드 의도 규칙 기반 사전 분류
+    # - 라벨별 확률이 임계값 이상이면 LLM 분류 없이 바로 확정한다.
+    # - 임계값이 없는 라벨은 항상 LLM 으로 넘긴다. (finalize 는 DB 저장으로 이어지므로 규칙으로 확정하지 않음)
+    intent_rule_enabled: bool = True
+    intent_rule_thresholds: Dict[str, float] = {
+        "smalltalk": 0.85,
+        "brand_info": 0.9,
+        "edit_brand": 0.95,
+        "trend_new": 0.85,
+        "trend_retry": 0.9,
+        "trend_refine": 0.95,
+    }
+
+    # LangGraph 체크포인터 (대화 state 저장소)
+    # - "memory": 프로세스 메모리 (개발용, 재시작 시 소실)
+    # - "sqlite": 파일 기반 (같은 서버의 여러 워커가 공유)
+    # - "oracle": graph_checkpoint 테이블 (여러 서버가 공유)
+    checkpointer_backend: str = "sqlite"
+    checkpointer_sqlite_path: str = "data/checkpoints.sqlite"   # 상대 경로 (backend 기준)
+    checkpointer_max_per_thread: int = 20                       # 스레드별 보관할 최근 체크포인트 수 (0 이면 제한 없음)
+    checkpointer_ttl_seconds: int = 60 * 60 * 24 * 7            # 마지막 대화 후 이 시간이 지나면 스레드 삭제 (0 이면 삭제 안 함)
+    checkpointer_maintenance_interval_seconds: int = 60 * 10    # TTL 정리 / 압축 주기
+
+    # 브랜드 그래프 체크포인트 압축
+    # - 최근 brand_checkpoint_keep_last 개만 보관하고, messages 는 이전 체크포인트 대비 델타로 저장
+    brand_checkpoint_compaction: bool = True
+    brand_checkpoint_keep_last: int = 2
+
+    # 대화 히스토리 관리 (챗 노드 프롬프트 크기 제한)
+    # - 모드별 토큰 예산을 넘으면 최근 history_keep_last_turns 턴만 원문으로 두고 나머지는 롤링 요약
+    # - 마지막 턴을 제외한 긴 AI/도구 출력(트렌드 답변 등)은 history_tool_output_max_chars 로 자른다
+    history_keep_last_turns: int = 4
+    history_token_budgets: Dict[str, int] = {
+        "brand": 6000,
+        "logo": 4000,
+        "shorts": 4000,
+    }
+    history_tool_output_max_chars: int = 1500
+
     langsmith_tracing: bool
     langsmith_endpoint: str
     langsmith_api_key: str
@@ -29,17 +102,125 @@ class Settings(BaseSettings):
     oracle_dsn: str = ""
     oracle_schema: str = ""
 
+    # Oracle 커넥션 풀 (app.db.session.oracle_db, SQLAlchemy 엔진도 creator 로 같은 풀 사용)
+    oracle_pool_min: int = 2
+    oracle_pool_max: int = 16
+    oracle_pool_increment: int = 2
+    oracle_pool_idle_timeout_seconds: int = 300     # 이 시간 동안 쓰지 않은 초과분(min 초과) 커넥션은 닫음 (0 이면 유지)
+    oracle_pool_wait_timeout_ms: int = 5000         # 풀이 가득 찼을 때 빌리기 대기 한도 (초과 시 오류)
+    oracle_pool_ping_interval_seconds: int = 60     # 이 시간 이상 놀던 커넥션만 빌릴 때 핑 (매 체크아웃 핑 대신)
+    oracle_stmt_cache_size: int = 50                # 커넥션별 문장 캐시 크기
+    oracle_pool_pre_ping: bool = False              # SQLAlchemy pre-ping (체크아웃마다 왕복 1회, 보통 불필요)
+
+    # ORM 관계 기본 로딩: True 면 lazy="raise" (loader 옵션 없이 관계 접근 시 예외)
+    # - None 이면 app_env 가 local/dev/development/test 일 때만 raise
+    orm_lazy_raise: Optional[bool] = None
+
     # JWT
     jwt_secret_key: str = "" 
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 60
 
+    # 인증 유저(principal) 캐시: (user id, 토큰 iat) -> CurrentUser, 워커 프로세스별
+    # - 유저 변경은 같은 워커에서는 즉시, 다른 워커에서는 TTL 이내에 반영된다
+    principal_cache_ttl_seconds: int = 60
+    principal_cache_size: int = 2048
+
+    # 권한별 메뉴 응답 캐시 (GET /menus, ETag 재검증 / POST /menus/cache/invalidate)
+    # - 무효화는 워커(프로세스) 단위라서 다른 워커에는 최대 TTL 만큼 늦게 반영된다
+    menu_cache_ttl_seconds: int = 5 * 60
+
+    # 프로젝트 목록 (GET /projects/groups, grp_id 키셋 페이지네이션)
+    # - limit 을 주지 않으면 전체 목록, 주면 이 값 이하로 페이지 조회
+    project_list_max_page_size: int = 200
+
     # Trend / RAG / Search
     tavily_api_key: str = ""        
     jina_api_key: str = ""
     jina_model: str = ""  
     vector_store_dir: str = "vector_store/chroma_db"  # 상대 경로 (프로젝트 루트 기준)
     vector_store_collection: str = "RAG_md"            # 기본 컬렉션 이름
+    vector_store_warmup: bool = True                   # 서버 시작 시 기본 벡터스토어 미리 열기
+
+    # 트렌드 RAG 검색 (rag_search_tool)
+    # - 벡터 상위 hybrid_vector_k + BM25 상위 hybrid_bm25_k 를 RRF(k=hybrid_rrf_k) 로 합쳐 rag_top_k 개 사용
+    rag_top_k: int = 8
+    hybrid_search_enabled: bool = True
+    hybrid_vector_k: int = 20
+    hybrid_bm25_k: int = 20
+    hybrid_rrf_k: int = 60
+
+    # 재정렬 (apply_reranker_tool)
+    # - reranker_backend: "jina" (Jina API) / "local" (CPU cross-encoder, sentence-transformers 필요) / "none"
+    reranker_backend: Literal["jina", "local", "none"] = "jina"
+    reranker_top_n: int = 5
+    reranker_local_model: str = "cross-encoder/mmarco-mMiniLMv2-L12-H384-v1"  # 다국어 소형 모델
+    reranker_local_onnx: bool = True      # ONNX 백엔드 우선 시도
+    reranker_batch_size: int = 16
+    reranker_cache_size: int = 512        # (질의, 문서 집합) 결과 캐시 개수
+
+    # 웹 검색(Tavily) 결과 캐시 (정규화 질의 + 검색 파라미터 키, 로컬 SQLite)
+    # - TTL 이내는 캐시 그대로, 이후 stale 기간 동안은 캐시를 주면서 백그라운드 갱신
+    web_search_cache_enabled: bool = True
+    web_search_cache_path: str = "data/web_search_cache.sqlite"  # 상대 경로 (backend 기준)
+    web_search_cache_ttl_seconds: int = 6 * 60 * 60
+    web_search_cache_stale_seconds: int = 24 * 60 * 60
+
+    # 트렌드 질의 실행 방식 (mode 별 기본값, 호출 시 strategy 로 지정 가능)
+    # - "pipeline": RAG/웹 동시 검색 -> 1회 재정렬 -> 1회 합성 / "agent": ReAct 도구 루프
+    trend_strategy_by_mode: Dict[str, Literal["agent", "pipeline"]] = {
+        "brand": "pipeline",
+        "logo": "pipeline",
+        "shorts": "pipeline",
+    }
+    trend_pipeline_web_search: bool = True  # 파이프라인에서 웹 검색도 함께 실행
+
+    # 트렌드 답변 시맨틱 캐시 (같은 mode/브랜드 프로필 지문 + 질의 코사인 유사도 >= threshold, TTL 이내)
+    trend_answer_cache_enabled: bool = True
+    trend_answer_cache_collection: str = "trend_answer_cache"
+    trend_answer_cache_threshold: float = 0.92
+    trend_answer_cache_ttl_seconds: int = 24 * 60 * 60
+
+    # 트렌드 근거 문서 저장소 (retry/refine 턴 재합성용, TrendContext 에는 evidence_id 만 보관)
+    trend_evidence_path: str = "data/trend_evidence.sqlite"  # 상대 경로 (backend 기준)
+    trend_evidence_ttl_seconds: int = 7 * 24 * 60 * 60
+
+    # 트렌드 단기 메모리 (arun_trend_query(use_memory=True) 일 때만 사용, 기본 실행은 stateless)
+    trend_memory_turns: int = 3          # user_id/project_id 별 보관할 최근 질문/답변 수 (0 이면 사용 안 함)
+    trend_memory_max_keys: int = 1000    # 메모리에 유지할 user_id/project_id 키 수 (LRU)
+
+    # 트렌드 카테고리 리포트 사전 계산 (POST /trend/reports/precompute, python -m app.cli.precompute_trends)
+    # - 브랜드 프로필 업종/타깃 + 질문 플랫폼이 맞고 질의 유사도 >= match_threshold 면 trend_search 가 바로 사용
+    trend_report_path: str = "data/trend_reports.sqlite"  # 상대 경로 (backend 기준)
+    trend_report_ttl_seconds: int = 2 * 24 * 60 * 60       # 이보다 오래된 리포트는 사용하지 않음
+    trend_report_match_threshold: float = 0.85
+    trend_report_concurrency: int = 3
+    trend_report_max_concurrency: int = 10   # POST /trend/reports/precompute concurrency 상한
+    trend_report_max_specs: int = 50         # POST /trend/reports/precompute 한 번에 받는 spec 수 상한
+    trend_report_refresh_enabled: bool = False  # 켜면 워커 중 리스를 잡은 하나만 갱신 (CLI/cron 으로 돌려도 됨)
+    trend_report_refresh_interval_seconds: int = 24 * 60 * 60
+    trend_report_default_specs: List[Dict[str, str]] = [
+        {"category": "카페"},
+        {"category": "베이커리"},
+        {"category": "음식점"},
+        {"category": "패션"},
+        {"category": "뷰티"},
+    ]
+
+    # 임베딩 캐시 (get_embeddings() 가 캐시 래퍼를 돌려줌)
+    # - 메모리 LRU embedding_cache_size 개 + 로컬 SQLite (embedding_cache_path 가 비어 있으면 메모리만)
+    embedding_cache_enabled: bool = True
+    embedding_cache_size: int = 4096
+    embedding_cache_path: str = "data/embedding_cache.sqlite"  # 상대 경로 (backend 기준)
+    embedding_cache_max_rows: int = 200_000                    # SQLite 최대 행 수, 넘으면 오래된 것부터 삭제 (0 이면 제한 없음)
+    embedding_cache_ttl_seconds: int = 30 * 24 * 60 * 60       # 이보다 오래된 행 삭제 (0 이면 삭제 안 함)
+
+    # 트렌드 문서 적재 (python -m app.cli.ingest)
+    ingest_chunk_size: int = 1000       # 청크 최대 글자 수
+    ingest_chunk_overlap: int = 150     # 청크 간 겹치는 글자 수
+    ingest_batch_size: int = 128        # 임베딩 API 1회 호출당 청크 수
+    ingest_concurrency: int = 4         # 동시에 실행하는 임베딩 배치 수
+    ingest_max_retries: int = 3         # 배치별 임베딩 재시도 횟수
 
     # File Server
     file_server_url: str = "https://kr.object.ncloudstorage.com/aissemble"  # 파일 서버 기본 URL
@@ -3,16 +3,23 @@
 # 작성일: 2025-11-17
 # 수정내역
 # - 2025-11-17: 초기 작성
+# - 2026-10-18: 인증 유저 조회 캐시 ((user id, iat) 키, 읽기 전용 CurrentUser 스냅샷, 관계 로딩 제외)
+# - 2026-10-18: 유저 조회 loader 옵션을 with_relations 로 통일
+# - 2026-10-18: 관리자 권한 의존성(get_admin_user) 추가
 
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import APIKeyHeader
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from app.core.principal_cache import invalidate_user, principal_cache
 from app.core.security import decode_access_token
 from app.db.orm import get_orm_session
 from app.models.auth import UserInfo
+from app.schemas.auth import CurrentUser
+from app.services.loaders import with_relations
 
 bearer_scheme = APIKeyHeader(
     name="Authorization",
@@ -20,6 +27,7 @@ bearer_scheme = APIKeyHeader(
 )
 
 GUEST_ROLE_ID = 3
+ADMIN_ROLE_IDS = (0, 1)  # 0: SYSTEM, 1: ADMIN
 
 
 def _extract_raw_token(token: Optional[str]) -> Optional[str]:
@@ -40,10 +48,41 @@ def _extract_raw_token(token: Optional[str]) -> Optional[str]:
     return token or None
 
 
+@event.listens_for(UserInfo, "after_update")
+@event.listens_for(UserInfo, "after_delete")
+def _invalidate_cached_user(mapper, connection, target: UserInfo) -> None:
+    # 권한/상태 등 유저 정보가 바뀌면 캐시된 스냅샷을 버린다
+    invalidate_user(target.id)
+
+
+def _load_principal(db: Session, payload: dict) -> Optional[CurrentUser]:
+    """
+    토큰 payload 의 유저를 CurrentUser 스냅샷으로 반환. (없으면 None)
+    - (user id, iat) 키로 principal_cache 를 먼저 본다.
+    - DB 조회 시 role / project_groups 관계는 로딩하지 않는다. (user_info 1회 조회)
+    """
+    user_id = payload.get("sub")
+    if user_id is None:
+        return None
+
+    key = (int(user_id), payload.get("iat"))
+    cached = principal_cache.get(key)
+    if cached is not None:
+        return cached
+
+    user = db.get(UserInfo, key[0], options=with_relations())
+    if user is None:
+        return None
+
+    principal = CurrentUser.model_validate(user)
+    principal_cache.put(key, principal)
+    return principal
+
+
 def get_optional_user(
     token: Optional[str] = Depends(bearer_scheme),
     db: Session = Depends(get_orm_session),
-) -> Optional[UserInfo]:
+) -> Optional[CurrentUser]:
     raw_token = _extract_raw_token(token)
     if not raw_token:
         # 토큰 없으면 비로그인
@@ -54,12 +93,7 @@ def get_optional_user(
     except Exception:
         return None
 
-    user_id = payload.get("sub")
-    if user_id is None:
-        return None
-
-    user = db.get(UserInfo, int(user_id))
-    return user
+    return _load_principal(db, payload)
 
 TEST_LOGIN_ID = "test"
 
@@ -70,6 +104,7 @@ def _get_test_user(db: Session) -> UserInfo:
     """
     user = (
         db.query(UserInfo)
+        .options(*with_relations())
         .filter(UserInfo.login_id == TEST_LOGIN_ID)
         .first()
     )
@@ -83,7 +118,7 @@ def _get_test_user(db: Session) -> UserInfo:
 def get_current_user(
     token: Optional[str] = Depends(bearer_scheme),
     db: Session = Depends(get_orm_session),
-) -> UserInfo:
+) -> CurrentUser:
     raw_token = _extract_raw_token(token)
     if not raw_token:
         raise HTTPException(
@@ -99,14 +134,13 @@ def get_current_user(
             detail="유효하지 않은 토큰입니다.",
         )
 
-    user_id = payload.get("sub")
-    if user_id is None:
+    if payload.get("sub") is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 토큰입니다.",
         )
 
-    user = db.get(UserInfo, int(user_id))
+    user = _load_principal(db, payload)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -114,3 +148,13 @@ def get_current_user(
         )
 
     return user
+
+
+def get_admin_user(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+    """관리자(SYSTEM/ADMIN) 전용 엔드포인트 의존성."""
+    if current_user.role_id not in ADMIN_ROLE_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다.",
+        )
+    return current_user
@@ -0,0 +1,80 @@
+# 인증 유저(principal) 캐시
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 ((user id, 토큰 iat) 키, TTL + 개수 제한 LRU, 유저 변경 시 무효화)
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.core.config import settings
+from app.schemas.auth import CurrentUser
+
+PrincipalKey = Tuple[int, Hashable]
+
+
+class PrincipalCache:
+    """
+    토큰 → 유저 스냅샷 캐시 (프로세스 메모리).
+
+    - 키: (user id, 토큰 iat). 같은 토큰으로 들어오는 요청은 TTL 동안 DB 조회 없이 처리한다.
+    - 유저 정보/권한이 바뀌면 invalidate_user(user_id) 로 해당 유저 항목을 모두 지운다.
+    - 워커 프로세스별 캐시이므로 다른 워커의 변경은 TTL 이 지나야 반영된다. (TTL 을 짧게 유지)
+    """
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[PrincipalKey, Tuple[CurrentUser, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: PrincipalKey) -> Optional[CurrentUser]:
+        now = time.monotonic()
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or item[1] <= now:
+                if item is not None:
+                    del self._items[key]
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: PrincipalKey, user: CurrentUser) -> None:
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._items[key] = (user, time.monotonic() + self.ttl_seconds)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            for key in [key for key in self._items if key[0] == user_id]:
+                del self._items[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._items), "hits": self.hits, "misses": self.misses}
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.principal_cache_size,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+)
+
+
+def invalidate_user(user_id: Optional[int]) -> None:
+    """유저 정보/권한 변경 후 호출. (UserInfo 갱신/삭제 시 ORM 이벤트로도 자동 호출)"""
+    if user_id is not None:
+        principal_cache.invalidate_user(user_id)
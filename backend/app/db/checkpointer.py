@@ -0,0 +1,767 @@
+# LangGraph 체크포인터 (대화 state 저장소)
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 (memory / sqlite / oracle 백엔드, TTL 정리, 스레드별 보관 개수 제한)
+# - 2026-10-18: 브랜드 그래프용 압축 체크포인터 추가 (최근 N개 보관, messages 델타 저장, 백그라운드 압축)
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator, Sequence
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+from sqlalchemy import create_engine, delete, event, exists, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.models.checkpoint import GraphThread, GraphCheckpoint, GraphCheckpointWrite
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Oracle 은 빈 문자열을 NULL 로 저장하므로, 루트 네임스페이스("")는 별도 값으로 저장한다
+_ROOT_NS = "-"
+
+
+def _to_db_ns(checkpoint_ns: str) -> str:
+    return checkpoint_ns or _ROOT_NS
+
+
+def _from_db_ns(checkpoint_ns: str) -> str:
+    return "" if checkpoint_ns == _ROOT_NS else checkpoint_ns
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """
+    보관 개수 / TTL 제한이 있는 InMemorySaver.
+
+    - 스레드(네임스페이스)별로 최근 max_per_thread 개의 체크포인트만 남긴다.
+    - 마지막 저장 후 ttl_seconds 가 지난 스레드는 evict_idle_threads() 에서 삭제한다.
+    - 프로세스 메모리에만 있으므로 개발/테스트용으로만 사용한다.
+    """
+
+    def __init__(self, *, max_per_thread: int, ttl_seconds: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.max_per_thread = max_per_thread
+        self.ttl_seconds = ttl_seconds
+        self._last_seen: Dict[str, datetime] = {}
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+        thread_id = config["configurable"]["thread_id"]
+        self._last_seen[thread_id] = datetime.now()
+        self._trim(thread_id, config["configurable"]["checkpoint_ns"])
+        return next_config
+
+    def delete_thread(self, thread_id: str) -> None:
+        super().delete_thread(thread_id)
+        self._last_seen.pop(thread_id, None)
+
+    def _trim(self, thread_id: str, checkpoint_ns: str) -> None:
+        if self.max_per_thread <= 0:
+            return
+
+        saved = self.storage[thread_id][checkpoint_ns]
+        if len(saved) <= self.max_per_thread:
+            return
+
+        stale_ids = sorted(saved.keys(), reverse=True)[self.max_per_thread:]
+        for checkpoint_id in stale_ids:
+            del saved[checkpoint_id]
+            self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+
+        # 남은 체크포인트가 참조하지 않는 채널 값(blob)도 정리
+        live_versions = set()
+        for checkpoint_b, _, _ in saved.values():
+            checkpoint_: Checkpoint = self.serde.loads_typed(checkpoint_b)
+            for channel, version in checkpoint_["channel_versions"].items():
+                live_versions.add((channel, version))
+
+        for key in list(self.blobs.keys()):
+            if key[0] == thread_id and key[1] == checkpoint_ns and (key[2], key[3]) not in live_versions:
+                del self.blobs[key]
+
+    def evict_idle_threads(self) -> int:
+        if self.ttl_seconds <= 0:
+            return 0
+
+        threshold = datetime.now() - timedelta(seconds=self.ttl_seconds)
+        idle = [thread_id for thread_id, seen in self._last_seen.items() if seen < threshold]
+        for thread_id in idle:
+            self.delete_thread(thread_id)
+        return len(idle)
+
+
+class SqlCheckpointSaver(BaseCheckpointSaver[str]):
+    """
+    SQLAlchemy 엔진 위에 체크포인트를 저장하는 체크포인터.
+
+    - sqlite 파일 / Oracle(graph_checkpoint 테이블) 모두 같은 구현을 사용한다.
+    - 체크포인트는 channel_values 를 포함한 전체 스냅샷을 한 행에 저장한다.
+    - put() 시 스레드(네임스페이스)별로 최근 max_per_thread 개만 남기고 지운다.
+    - evict_idle_threads() 는 graph_thread.update_dt 기준으로 TTL 이 지난 스레드를 삭제한다.
+    - DB 드라이버가 동기이므로 a* 메서드는 스레드풀에서 동기 메서드를 실행한다.
+    """
+
+    def __init__(self, engine: Engine, *, max_per_thread: int, ttl_seconds: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.engine = engine
+        self.max_per_thread = max_per_thread
+        self.ttl_seconds = ttl_seconds
+        self._session_factory = sessionmaker(
+            bind=engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _to_tuple(self, db: Session, row: GraphCheckpoint) -> CheckpointTuple:
+        thread_id = row.thread_id
+        checkpoint_ns = _from_db_ns(row.checkpoint_ns)
+
+        writes = db.scalars(
+            select(GraphCheckpointWrite)
+            .where(
+                GraphCheckpointWrite.thread_id == row.thread_id,
+                GraphCheckpointWrite.checkpoint_ns == row.checkpoint_ns,
+                GraphCheckpointWrite.checkpoint_id == row.checkpoint_id,
+            )
+            .order_by(GraphCheckpointWrite.task_id, GraphCheckpointWrite.write_idx)
+        ).all()
+
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": row.checkpoint_id,
+                }
+            },
+            checkpoint=self._decode_checkpoint(db, row),
+            metadata=self.serde.loads_typed((row.meta_type, row.meta_data or b"")),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": row.parent_checkpoint_id,
+                    }
+                }
+                if row.parent_checkpoint_id
+                else None
+            ),
+            pending_writes=[
+                (w.task_id, w.channel, self.serde.loads_typed((w.value_type, w.value_data or b"")))
+                for w in writes
+            ],
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id: str = config["configurable"]["thread_id"]
+        checkpoint_ns = _to_db_ns(config["configurable"].get("checkpoint_ns", ""))
+
+        stmt = select(GraphCheckpoint).where(
+            GraphCheckpoint.thread_id == thread_id,
+            GraphCheckpoint.checkpoint_ns == checkpoint_ns,
+        )
+        if checkpoint_id := get_checkpoint_id(config):
+            stmt = stmt.where(GraphCheckpoint.checkpoint_id == checkpoint_id)
+        else:
+            stmt = stmt.order_by(GraphCheckpoint.checkpoint_id.desc()).limit(1)
+
+        with self._session_factory() as db:
+            row = db.scalars(stmt).first()
+            if row is None:
+                return None
+            return self._to_tuple(db, row)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        stmt = select(GraphCheckpoint)
+        if config:
+            stmt = stmt.where(GraphCheckpoint.thread_id == config["configurable"]["thread_id"])
+            if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+                stmt = stmt.where(GraphCheckpoint.checkpoint_ns == _to_db_ns(checkpoint_ns))
+            if checkpoint_id := get_checkpoint_id(config):
+                stmt = stmt.where(GraphCheckpoint.checkpoint_id == checkpoint_id)
+        if before and (before_checkpoint_id := get_checkpoint_id(before)):
+            stmt = stmt.where(GraphCheckpoint.checkpoint_id < before_checkpoint_id)
+        stmt = stmt.order_by(GraphCheckpoint.thread_id, GraphCheckpoint.checkpoint_id.desc())
+
+        results: List[CheckpointTuple] = []
+        with self._session_factory() as db:
+            for row in db.scalars(stmt):
+                if limit is not None and len(results) >= limit:
+                    break
+                item = self._to_tuple(db, row)
+                # 메타데이터 필터는 역직렬화 후 비교
+                if filter and not all(item.metadata.get(k) == v for k, v in filter.items()):
+                    continue
+                results.append(item)
+
+        yield from results
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        db_ns = _to_db_ns(checkpoint_ns)
+        parent_checkpoint_id = config["configurable"].get("checkpoint_id")
+        now = datetime.now()
+
+        with self._session_factory() as db, db.begin():
+            stored = self._encode_checkpoint(db, thread_id, db_ns, parent_checkpoint_id, checkpoint)
+            ckpt_type, ckpt_data = self.serde.dumps_typed(stored)
+            meta_type, meta_data = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+
+            thread = db.get(GraphThread, thread_id)
+            if thread is None:
+                db.add(GraphThread(thread_id=thread_id, create_dt=now, update_dt=now))
+            else:
+                thread.update_dt = now
+
+            db.merge(
+                GraphCheckpoint(
+                    thread_id=thread_id,
+                    checkpoint_ns=db_ns,
+                    checkpoint_id=checkpoint["id"],
+                    parent_checkpoint_id=parent_checkpoint_id,
+                    ckpt_type=ckpt_type,
+                    ckpt_data=ckpt_data,
+                    meta_type=meta_type,
+                    meta_data=meta_data,
+                    create_dt=now,
+                )
+            )
+            db.flush()
+            self._trim(db, thread_id, db_ns)
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        db_ns = _to_db_ns(config["configurable"].get("checkpoint_ns", ""))
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+
+        with self._session_factory() as db, db.begin():
+            for idx, (channel, value) in enumerate(writes):
+                write_idx = WRITES_IDX_MAP.get(channel, idx)
+                key = (thread_id, db_ns, checkpoint_id, task_id, write_idx)
+                # 일반 write 는 이미 있으면 유지, 특수 채널(에러/인터럽트 등)은 덮어쓴다
+                if write_idx >= 0 and db.get(GraphCheckpointWrite, key) is not None:
+                    continue
+
+                value_type, value_data = self.serde.dumps_typed(value)
+                db.merge(
+                    GraphCheckpointWrite(
+                        thread_id=thread_id,
+                        checkpoint_ns=db_ns,
+                        checkpoint_id=checkpoint_id,
+                        task_id=task_id,
+                        write_idx=write_idx,
+                        channel=channel,
+                        value_type=value_type,
+                        value_data=value_data,
+                        task_path=task_path or None,
+                    )
+                )
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._session_factory() as db, db.begin():
+            db.execute(delete(GraphCheckpointWrite).where(GraphCheckpointWrite.thread_id == thread_id))
+            db.execute(delete(GraphCheckpoint).where(GraphCheckpoint.thread_id == thread_id))
+            db.execute(delete(GraphThread).where(GraphThread.thread_id == thread_id))
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        # InMemorySaver 와 같은 형식 ("<정수 버전 32자리>.<난수>")
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # ------------------------------------------------------------------
+    # 직렬화 훅 (CompactingSqlCheckpointSaver 에서 재정의)
+    # ------------------------------------------------------------------
+    def _encode_checkpoint(
+        self,
+        db: Session,
+        thread_id: str,
+        db_ns: str,
+        parent_checkpoint_id: Optional[str],
+        checkpoint: Checkpoint,
+    ) -> Checkpoint:
+        return checkpoint
+
+    def _decode_checkpoint(self, db: Session, row: GraphCheckpoint) -> Checkpoint:
+        return self.serde.loads_typed((row.ckpt_type, row.ckpt_data or b""))
+
+    # ------------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------------
+    def _trim(self, db: Session, thread_id: str, db_ns: str) -> int:
+        """스레드(네임스페이스)별로 최근 max_per_thread 개를 넘는 체크포인트를 삭제하고, 삭제한 개수를 반환한다."""
+        if self.max_per_thread <= 0:
+            return 0
+
+        stale_ids = db.scalars(
+            select(GraphCheckpoint.checkpoint_id)
+            .where(
+                GraphCheckpoint.thread_id == thread_id,
+                GraphCheckpoint.checkpoint_ns == db_ns,
+            )
+            .order_by(GraphCheckpoint.checkpoint_id.desc())
+            .offset(self.max_per_thread)
+        ).all()
+        if not stale_ids:
+            return 0
+
+        self._before_delete(db, thread_id, db_ns, set(stale_ids))
+
+        db.execute(
+            delete(GraphCheckpointWrite).where(
+                GraphCheckpointWrite.thread_id == thread_id,
+                GraphCheckpointWrite.checkpoint_ns == db_ns,
+                GraphCheckpointWrite.checkpoint_id.in_(stale_ids),
+            )
+        )
+        db.execute(
+            delete(GraphCheckpoint).where(
+                GraphCheckpoint.thread_id == thread_id,
+                GraphCheckpoint.checkpoint_ns == db_ns,
+                GraphCheckpoint.checkpoint_id.in_(stale_ids),
+            )
+        )
+        return len(stale_ids)
+
+    def _before_delete(self, db: Session, thread_id: str, db_ns: str, stale_ids: set[str]) -> None:
+        """_trim 에서 체크포인트를 지우기 직전에 호출된다."""
+        return None
+
+    def evict_idle_threads(self) -> int:
+        """마지막 저장 후 ttl_seconds 가 지난 스레드를 삭제하고, 삭제한 스레드 수를 반환한다."""
+        if self.ttl_seconds <= 0:
+            return 0
+
+        threshold = datetime.now() - timedelta(seconds=self.ttl_seconds)
+        with self._session_factory() as db:
+            idle = db.scalars(
+                select(GraphThread.thread_id).where(GraphThread.update_dt < threshold)
+            ).all()
+
+        for thread_id in idle:
+            self.delete_thread(thread_id)
+        return len(idle)
+
+    # ------------------------------------------------------------------
+    # async (스레드풀 위임)
+    # ------------------------------------------------------------------
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await run_in_threadpool(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await run_in_threadpool(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await run_in_threadpool(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await run_in_threadpool(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await run_in_threadpool(self.delete_thread, thread_id)
+
+
+# 델타로 저장한 messages 채널 값의 표식 키
+_MESSAGES_DELTA_KEY = "__messages_delta__"
+
+
+class CompactingSqlCheckpointSaver(SqlCheckpointSaver):
+    """
+    체크포인트 쓰기량을 줄이는 SqlCheckpointSaver. (브랜드 그래프용)
+
+    - messages 채널은 부모 체크포인트 대비 델타로 저장한다.
+      {"__messages_delta__": {"base": 부모 ID, "keep": 공통 앞부분 길이, "tail": 이후 메시지}}
+    - 공통 앞부분이 없으면(메시지 삭제/요약 등) 전체 리스트를 그대로 저장한다.
+    - 최근 max_per_thread 개만 남기며, 지워질 체크포인트를 base 로 참조하는 체크포인트는
+      삭제 전에 전체 리스트로 다시 저장(rebase)한다.
+    - compact() 는 설정보다 많이 남은 체크포인트와 고아 write 를 정리하는 백그라운드 작업이다.
+      (thread_like 를 주면 해당 LIKE 패턴의 스레드만 대상으로 한다)
+    """
+
+    _CACHE_SIZE = 256
+
+    def __init__(self, engine: Engine, *, thread_like: Optional[str] = None, **kwargs: Any) -> None:
+        super().__init__(engine, **kwargs)
+        self.thread_like = thread_like
+        # (thread_id, ns, checkpoint_id) -> 복원된 messages (같은 프로세스의 다음 put 에서 재사용)
+        self._messages_cache: "OrderedDict[Tuple[str, str, str], List[Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # messages 복원 / 캐시
+    # ------------------------------------------------------------------
+    def _cache_get(self, key: Tuple[str, str, str]) -> Optional[List[Any]]:
+        with self._cache_lock:
+            messages = self._messages_cache.get(key)
+            if messages is not None:
+                self._messages_cache.move_to_end(key)
+            return messages
+
+    def _cache_put(self, key: Tuple[str, str, str], messages: List[Any]) -> None:
+        with self._cache_lock:
+            self._messages_cache[key] = messages
+            self._messages_cache.move_to_end(key)
+            while len(self._messages_cache) > self._CACHE_SIZE:
+                self._messages_cache.popitem(last=False)
+
+    def _resolve_messages(self, db: Session, thread_id: str, db_ns: str, value: Any) -> Any:
+        """델타 표식이면 base 체크포인트의 messages 에 이어 붙여 전체 리스트로 복원한다."""
+        if not (isinstance(value, dict) and _MESSAGES_DELTA_KEY in value):
+            return value
+
+        delta = value[_MESSAGES_DELTA_KEY]
+        base = self._load_messages(db, thread_id, db_ns, delta["base"]) or []
+        return list(base[: delta["keep"]]) + list(delta["tail"])
+
+    def _load_messages(
+        self,
+        db: Session,
+        thread_id: str,
+        db_ns: str,
+        checkpoint_id: str,
+    ) -> Optional[List[Any]]:
+        key = (thread_id, db_ns, checkpoint_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        row = db.get(GraphCheckpoint, key)
+        if row is None:
+            return None
+
+        stored = self.serde.loads_typed((row.ckpt_type, row.ckpt_data or b""))
+        messages = self._resolve_messages(
+            db, thread_id, db_ns, (stored.get("channel_values") or {}).get("messages")
+        )
+        if not isinstance(messages, list):
+            return None
+
+        self._cache_put(key, messages)
+        return messages
+
+    # ------------------------------------------------------------------
+    # 직렬화 훅
+    # ------------------------------------------------------------------
+    def _encode_checkpoint(
+        self,
+        db: Session,
+        thread_id: str,
+        db_ns: str,
+        parent_checkpoint_id: Optional[str],
+        checkpoint: Checkpoint,
+    ) -> Checkpoint:
+        values: Dict[str, Any] = checkpoint.get("channel_values") or {}
+        messages = values.get("messages")
+        if not isinstance(messages, list):
+            return checkpoint
+
+        self._cache_put((thread_id, db_ns, checkpoint["id"]), list(messages))
+
+        if not parent_checkpoint_id:
+            return checkpoint
+        parent_messages = self._load_messages(db, thread_id, db_ns, parent_checkpoint_id)
+        if not parent_messages:
+            return checkpoint
+
+        keep = 0
+        for old, new in zip(parent_messages, messages):
+            if old != new:
+                break
+            keep += 1
+        if keep == 0:
+            return checkpoint
+
+        delta = {
+            _MESSAGES_DELTA_KEY: {
+                "base": parent_checkpoint_id,
+                "keep": keep,
+                "tail": list(messages[keep:]),
+            }
+        }
+        return {**checkpoint, "channel_values": {**values, "messages": delta}}
+
+    def _decode_checkpoint(self, db: Session, row: GraphCheckpoint) -> Checkpoint:
+        checkpoint = super()._decode_checkpoint(db, row)
+        values: Dict[str, Any] = checkpoint.get("channel_values") or {}
+        if "messages" not in values:
+            return checkpoint
+
+        messages = self._resolve_messages(db, row.thread_id, row.checkpoint_ns, values["messages"])
+        return {**checkpoint, "channel_values": {**values, "messages": messages}}
+
+    # ------------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------------
+    def _before_delete(self, db: Session, thread_id: str, db_ns: str, stale_ids: set[str]) -> None:
+        """지워질 체크포인트를 base 로 참조하는 남은 체크포인트를 전체 리스트로 다시 저장한다."""
+        survivors = db.scalars(
+            select(GraphCheckpoint).where(
+                GraphCheckpoint.thread_id == thread_id,
+                GraphCheckpoint.checkpoint_ns == db_ns,
+                GraphCheckpoint.checkpoint_id.not_in(stale_ids),
+            )
+        ).all()
+
+        for row in survivors:
+            stored = self.serde.loads_typed((row.ckpt_type, row.ckpt_data or b""))
+            values: Dict[str, Any] = stored.get("channel_values") or {}
+            value = values.get("messages")
+            if not (isinstance(value, dict) and _MESSAGES_DELTA_KEY in value):
+                continue
+            if value[_MESSAGES_DELTA_KEY]["base"] not in stale_ids:
+                continue
+
+            messages = self._load_messages(db, thread_id, db_ns, row.checkpoint_id) or []
+            rebased = {**stored, "channel_values": {**values, "messages": messages}}
+            row.ckpt_type, row.ckpt_data = self.serde.dumps_typed(rebased)
+
+        db.flush()
+
+        with self._cache_lock:
+            for checkpoint_id in stale_ids:
+                self._messages_cache.pop((thread_id, db_ns, checkpoint_id), None)
+
+    def delete_thread(self, thread_id: str) -> None:
+        super().delete_thread(thread_id)
+        with self._cache_lock:
+            for key in [k for k in self._messages_cache if k[0] == thread_id]:
+                del self._messages_cache[key]
+
+    def compact(self) -> Dict[str, int]:
+        """
+        백그라운드 압축 작업.
+        - 모든 스레드(네임스페이스)를 최근 max_per_thread 개로 줄인다. (설정을 줄였거나 이전 데이터가 남은 경우)
+        - 체크포인트가 지워진 write(고아 write)를 삭제한다.
+        """
+        stmt = select(GraphCheckpoint.thread_id, GraphCheckpoint.checkpoint_ns).distinct()
+        if self.thread_like:
+            stmt = stmt.where(GraphCheckpoint.thread_id.like(self.thread_like))
+
+        with self._session_factory() as db:
+            pairs = db.execute(stmt).all()
+
+        deleted_checkpoints = 0
+        for thread_id, db_ns in pairs:
+            with self._session_factory() as db, db.begin():
+                deleted_checkpoints += self._trim(db, thread_id, db_ns)
+
+        with self._session_factory() as db, db.begin():
+            result = db.execute(
+                delete(GraphCheckpointWrite).where(
+                    ~exists().where(
+                        GraphCheckpoint.thread_id == GraphCheckpointWrite.thread_id,
+                        GraphCheckpoint.checkpoint_ns == GraphCheckpointWrite.checkpoint_ns,
+                        GraphCheckpoint.checkpoint_id == GraphCheckpointWrite.checkpoint_id,
+                    )
+                )
+            )
+            deleted_writes = result.rowcount or 0
+
+        return {
+            "threads": len(pairs),
+            "checkpoints_deleted": deleted_checkpoints,
+            "writes_deleted": deleted_writes,
+        }
+
+
+@lru_cache
+def _get_sqlite_engine() -> Engine:
+    path = Path(settings.checkpointer_sqlite_path)
+    if not path.is_absolute():
+        path = BASE_DIR / path
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+        future=True,
+    )
+
+    # 여러 uvicorn 워커가 같은 파일을 쓰므로 WAL 모드로 읽기/쓰기 잠금 충돌을 줄인다
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragma(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    GraphThread.metadata.create_all(
+        engine,
+        tables=[
+            GraphThread.__table__,
+            GraphCheckpoint.__table__,
+            GraphCheckpointWrite.__table__,
+        ],
+    )
+    return engine
+
+
+# compact 여부 -> 체크포인터 (프로세스당 종류별 1개)
+_savers: Dict[bool, BaseCheckpointSaver] = {}
+_savers_lock = threading.Lock()
+
+# 브랜드 그래프 thread_id 패턴 (api/brand.py: user-{id}-project-brand-{session})
+BRAND_THREAD_LIKE = "%-project-brand-%"
+
+
+def _create_checkpointer(compact: bool) -> BaseCheckpointSaver:
+    backend = settings.checkpointer_backend
+    options: Dict[str, Any] = {
+        "max_per_thread": settings.checkpointer_max_per_thread,
+        "ttl_seconds": settings.checkpointer_ttl_seconds,
+    }
+    if compact:
+        options["max_per_thread"] = settings.brand_checkpoint_keep_last
+
+    if backend == "memory":
+        # 메모리 백엔드는 채널 값이 버전별로 따로 저장되므로 델타 없이 보관 개수만 줄인다
+        return BoundedMemorySaver(**options)
+
+    if backend == "sqlite":
+        engine = _get_sqlite_engine()
+    elif backend == "oracle":
+        from app.db.orm import engine
+    else:
+        raise ValueError(f"지원하지 않는 checkpointer_backend 입니다: {backend}")
+
+    if compact:
+        return CompactingSqlCheckpointSaver(engine, thread_like=BRAND_THREAD_LIKE, **options)
+    return SqlCheckpointSaver(engine, **options)
+
+
+def get_checkpointer(*, compact: bool = False) -> BaseCheckpointSaver:
+    """
+    settings.checkpointer_backend 에 맞는 체크포인터를 돌려준다. (프로세스당 종류별 1개, 그래프끼리 공유)
+
+    - "memory": BoundedMemorySaver (재시작 시 소실, 워커 간 공유 불가)
+    - "sqlite": checkpointer_sqlite_path 파일 (같은 서버의 워커끼리 공유)
+    - "oracle": graph_checkpoint 테이블 (산출물/db/스크립트.sql 로 생성, 서버 간 공유)
+
+    compact=True 이면 브랜드 그래프용 압축 체크포인터
+    (최근 brand_checkpoint_keep_last 개만 보관, messages 델타 저장)를 돌려준다.
+    """
+    with _savers_lock:
+        if compact not in _savers:
+            _savers[compact] = _create_checkpointer(compact)
+        return _savers[compact]
+
+
+def run_checkpoint_maintenance_once() -> None:
+    """만들어진 체크포인터마다 TTL 정리 + (지원 시) 압축을 한 번 실행한다."""
+    with _savers_lock:
+        savers = list(_savers.values())
+
+    for saver in savers:
+        evicted = saver.evict_idle_threads()
+        if evicted:
+            logger.info("[checkpointer] idle thread %d개 삭제", evicted)
+
+        if isinstance(saver, CompactingSqlCheckpointSaver):
+            stats = saver.compact()
+            if stats["checkpoints_deleted"] or stats["writes_deleted"]:
+                logger.info("[checkpointer] 압축 완료: %s", stats)
+
+
+async def run_checkpoint_maintenance(interval_seconds: int) -> None:
+    """
+    TTL 정리 / 압축을 주기적으로 실행하는 백그라운드 루프.
+    (main.lifespan 에서 asyncio task 로 실행)
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(run_checkpoint_maintenance_once)
+        except Exception:
+            logger.exception("[checkpointer] 정리 작업 실패")
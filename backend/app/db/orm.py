@@ -3,15 +3,32 @@
 # 작성일: 2025-11-17
 # 수정내역
 # - 2025-11-17: 초기 작성
+# - 2026-10-18: async 엔드포인트용 세션 의존성(get_async_orm_session) 추가
+# - 2026-10-18: 별도 QueuePool 대신 app.db.session 의 Oracle 풀을 creator 로 공유 (pre-ping 은 설정)
+# - 2026-10-18: 관계 기본 로딩 전략(RELATIONSHIP_LAZY) 추가 (개발 환경은 raise)
 
-from typing import Generator
+from typing import Any, AsyncGenerator, Callable, Generator, TypeVar
 
 from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
 from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
+from app.db.session import oracle_db
 
-DATABASE_URL = f"oracle+oracledb://{settings.oracle_user}:{settings.oracle_password}@{settings.oracle_dsn}"
+# 접속 정보는 oracle_db 풀이 가지고 있으므로 URL 에는 드라이버만 지정
+DATABASE_URL = "oracle+oracledb://"
+
+# ORM 관계(relationship) 기본 로딩 전략
+# - 관계는 필요한 서비스 함수가 loader 옵션으로 명시한다 (app.services.loaders)
+# - 개발 환경에서는 "raise": 명시하지 않은 관계 접근(N+1)이 바로 예외로 드러난다
+ORM_LAZY_RAISE = (
+    settings.orm_lazy_raise
+    if settings.orm_lazy_raise is not None
+    else settings.app_env in ("local", "dev", "development", "test")
+)
+RELATIONSHIP_LAZY = "raise" if ORM_LAZY_RAISE else "select"
 
 # 모든 ORM 모델이 상속할 Base 클래스
 class Base(DeclarativeBase):
@@ -22,9 +39,14 @@ class Base(DeclarativeBase):
     pass
 
 # 엔진 생성
+# - 커넥션은 oracle_db 풀에서 빌리고(creator), 세션 종료 시 close() 로 풀에 돌려준다.
+# - SQLAlchemy 쪽 풀은 두지 않는다(NullPool). 풀이 두 겹이면 커넥션 수가 따로 잡힌다.
+# - 죽은 커넥션 감지는 oracledb 풀의 ping_interval 로 하고, pre-ping 은 설정으로만 켠다.
 engine = create_engine(
     DATABASE_URL,
-    pool_pre_ping=True, # 죽은 커넥션 자동 감지
+    creator=oracle_db.acquire,
+    poolclass=NullPool,
+    pool_pre_ping=settings.oracle_pool_pre_ping,
     future=True, # SQLAlchemy 2.x 스타일
 )
 
@@ -46,4 +68,54 @@ def get_orm_session() -> Generator[Session, None, None]:
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+T = TypeVar("T")
+
+
+class AsyncOrmSession:
+    """
+    async 엔드포인트에서 ORM 세션을 쓰기 위한 래퍼.
+
+    - Instant Client(thick 모드)를 초기화하면 python-oracledb 의 asyncio 드라이버를 쓸 수 없으므로,
+      동기 Session 은 그대로 두고 세션을 쓰는 함수를 스레드풀에서 실행한다.
+    - 서비스 함수는 기존 시그니처(db 가 첫 번째 인자) 그대로 사용한다.
+      예) await db.run(load_brand_profile_for_agent, project_id)
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await run_in_threadpool(fn, self.session, *args, **kwargs)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.session.close)
+
+
+async def get_async_orm_session() -> AsyncGenerator[AsyncOrmSession, None]:
+    """
+    FastAPI 의존성용 async ORM 세션.
+    - async def 라우터에서 Depends(get_async_orm_session)으로 주입해서 사용.
+    """
+    db = AsyncOrmSession(SessionLocal())
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+async def run_in_orm_session(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    새 세션을 열어 fn(db, ...) 을 스레드풀에서 실행하고 닫는다.
+    - 의존성 수명이 끝난 뒤(스트리밍 응답 등)에 DB 작업이 필요할 때 사용.
+    """
+    def _run() -> T:
+        db = SessionLocal()
+        try:
+            return fn(db, *args, **kwargs)
+        finally:
+            db.close()
+
+    return await run_in_threadpool(_run)
@@ -3,11 +3,13 @@
 # 작성일: 2025-10-28
 # 수정내역
 # - 2025-10-28: 초기 작성
+# - 2026-10-18: 풀 크기/타임아웃/문장 캐시/핑 설정화, SQLAlchemy 엔진과 풀 공유 (creator), 풀 통계 추가
 
 import oracledb
 import logging
+import threading
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Any, Dict, Generator, Optional
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -27,34 +29,80 @@ except Exception as e:
 
 
 class OracleDB:
+    """
+    프로세스 공용 Oracle 커넥션 풀 (python-oracledb).
+
+    - raw 커서 사용처(get_db_session)와 SQLAlchemy 엔진(app.db.orm, creator=acquire)이 같은 풀을 쓴다.
+    - 풀 크기/타임아웃/문장 캐시/핑 주기는 settings.oracle_pool_* 로 조정한다.
+    - lifespan 에서 init_pool() 을 호출하지만, CLI 등에서 먼저 쓰면 첫 acquire 시 만들어진다.
+    """
+
     def __init__(self):
         self._pool: Optional[oracledb.ConnectionPool] = None
+        self._lock = threading.Lock()
 
     def init_pool(self):
         if self._pool is not None:
             return
-        try:
-            self._pool = oracledb.create_pool(
-                user=settings.oracle_user,
-                password=settings.oracle_password,
-                dsn=settings.oracle_dsn,
-                min=1,
-                max=4,
-                increment=1
-            )
-            logger.info("Oracle connection pool initialized successfully")
-        except Exception as e:
-            logger.exception("Failed to initialize Oracle connection pool")
-            raise e
+        with self._lock:
+            if self._pool is not None:
+                return
+            try:
+                self._pool = oracledb.create_pool(
+                    user=settings.oracle_user,
+                    password=settings.oracle_password,
+                    dsn=settings.oracle_dsn,
+                    min=settings.oracle_pool_min,
+                    max=settings.oracle_pool_max,
+                    increment=settings.oracle_pool_increment,
+                    timeout=settings.oracle_pool_idle_timeout_seconds,
+                    getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+                    wait_timeout=settings.oracle_pool_wait_timeout_ms,
+                    ping_interval=settings.oracle_pool_ping_interval_seconds,
+                    stmtcachesize=settings.oracle_stmt_cache_size,
+                )
+                logger.info(
+                    "Oracle connection pool initialized successfully (min=%s, max=%s)",
+                    settings.oracle_pool_min,
+                    settings.oracle_pool_max,
+                )
+            except Exception as e:
+                logger.exception("Failed to initialize Oracle connection pool")
+                raise e
 
     def get_connection(self) -> oracledb.Connection:
+        return self.acquire()
+
+    def acquire(self) -> oracledb.Connection:
+        """풀에서 커넥션을 빌린다. close() 하면 풀로 돌아간다."""
         if self._pool is None:
-            raise RuntimeError("Oracle connection pool is not initialized")
+            self.init_pool()
         return self._pool.acquire()
-    
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 사용 현황 (진단용)."""
+        if self._pool is None:
+            return {"initialized": False}
+        pool = self._pool
+        return {
+            "initialized": True,
+            "min": pool.min,
+            "max": pool.max,
+            "increment": pool.increment,
+            "opened": pool.opened,
+            "busy": pool.busy,
+            "idle": pool.opened - pool.busy,
+            "idle_timeout_seconds": pool.timeout,
+            "wait_timeout_ms": pool.wait_timeout,
+            "ping_interval_seconds": pool.ping_interval,
+            "stmt_cache_size": pool.stmtcachesize,
+        }
+
     def close_pool(self):
-        if self._pool:
-            self._pool.close()
+        with self._lock:
+            if self._pool:
+                self._pool.close()
+                self._pool = None
 
 oracle_db = OracleDB()
 
@@ -3,6 +3,8 @@
 # 수정내역
 # - 2025-11-20: 초기 작성
 # - 2025-11-20: smalltalk 모드 추가
+# - 2026-10-18: async 노드로 변경 (llm.ainvoke)
+# - 2026-10-18: 전체 히스토리 대신 prepare_chat_history(롤링 요약 + 토큰 예산) 사용
 
 from __future__ import annotations
 
@@ -12,6 +14,8 @@ from langchain_core.messages import SystemMessage, AnyMessage
 from langgraph.types import Command
 from langgraph.graph import END
 
+from app.graphs.nodes.common.history_utils import prepare_chat_history, HISTORY_META_KEY
+
 if TYPE_CHECKING:
     from app.agents.state import AppState, BrandProfile
     from langchain_core.language_models.chat_models import BaseChatModel
@@ -142,7 +146,7 @@ def make_brand_chat_node(llm: "BaseChatModel"):
     llm 인스턴스를 주입받아 brand_chat 노드를 만들어 주는 팩토리.
     """
 
-    def brand_chat(state: "AppState") -> Command[Literal["__end__"]]:
+    async def brand_chat(state: "AppState") -> Command[Literal["__end__"]]:
         """
         브랜드 관련 대화를 진행하는 메인 챗 노드.
 
@@ -151,7 +155,6 @@ def make_brand_chat_node(llm: "BaseChatModel"):
         - state.meta.intent.label == "smalltalk" 이면
           → 브랜드 컨설턴트가 아니라 일상 대화 파트너 모드로 응답.
         """
-        messages: List[AnyMessage] = list(state.get("messages") or [])
         brand_profile = state.get("brand_profile") or {}
 
         meta: Dict[str, Any] = dict(state.get("meta") or {})
@@ -218,13 +221,17 @@ def make_brand_chat_node(llm: "BaseChatModel"):
 
             system = SystemMessage(content=system_content)
 
+        # 오래된 대화는 요약으로 접고, 최근 턴만 원문으로 넘긴다
+        history_messages, history_meta = await prepare_chat_history(state, llm, mode="brand")
+        meta[HISTORY_META_KEY] = history_meta
+
         chat_messages: List[AnyMessage] = [system]
-        chat_messages.extend(messages)
+        chat_messages.extend(history_messages)
 
-        ai_msg = llm.invoke(chat_messages)
+        ai_msg = await llm.ainvoke(chat_messages)
 
         return Command(
-            update={"messages": [ai_msg]},
+            update={"messages": [ai_msg], "meta": meta},
             goto=END,
         )
 
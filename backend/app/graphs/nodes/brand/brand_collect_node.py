@@ -3,16 +3,19 @@
 # 수정내역
 # - 2025-11-20: 초기 작성
 # - 2025-11-20: smalltalk 모드 추가
+# - 2026-10-18: brand_intention 과 병렬 실행되도록 추출 결과만 turn_analysis 에 기록
+# - 2026-10-18: 규칙 기반 사전 분류로 정보가 없는 발화는 추출 생략
+# - 2026-10-18: async 노드로 변경 (llm.ainvoke)
 
 from __future__ import annotations
 
 import json
-from typing import Dict, Any, TYPE_CHECKING, Literal
+from typing import Dict, Any, TYPE_CHECKING
 
 from langchain_core.messages import SystemMessage, HumanMessage
-from langgraph.types import Command
 
 from app.graphs.nodes.common.message_utils import get_last_user_message
+from app.graphs.nodes.brand.brand_intent_rules import pre_classify_intent, NO_EXTRACTION_LABELS
 
 if TYPE_CHECKING:
     from app.agents.state import AppState, BrandProfile
@@ -101,30 +104,31 @@ def make_brand_collect_node(llm: "BaseChatModel"):
 
     이런 식으로 사용.
     """
-    def brand_collect(state: "AppState") -> Command[Literal["brand_intention"]]:
+    async def brand_collect(state: "AppState") -> Dict[str, Any]:
         """
-        마지막 사용자 발화에서 브랜드 정보를 추출해
-        state.brand_profile 에 누적/병합하는 노드.
-        """
-        # 1) 의도가 smalltalk 이면 아무 것도 하지 않고 반환
-        meta: Dict[str, Any] = dict(state.get("meta") or {})
-        intent_label = None
-        intent_info = meta.get("intent") or {}
-        if isinstance(intent_info, dict):
-            il = intent_info.get("label")
-            if isinstance(il, str):
-                intent_label = il
-
-        if intent_label == "smalltalk":
-            # 일상 대화일 때는 brand_profile 을 건드리지 않고 그대로 brand_intention 으로 넘김
-            return Command(update={}, goto="brand_intention")
+        마지막 사용자 발화에서 브랜드 정보 업데이트를 추출해
+        state.turn_analysis["collect"] 에 기록하는 노드.
 
+        - brand_intention 과 병렬로 실행되며,
+          실제 brand_profile 병합은 두 결과를 합치는 brand_route 노드가 담당한다.
+          (smalltalk 로 분류되면 brand_route 에서 업데이트를 버린다)
+        """
         user_text = get_last_user_message(state)
         if not user_text:
-            # 유저 발화가 없으면 상태 변경 없이 brand_intention 으로 넘김
-            return Command(update={}, goto="brand_intention")
+            # 유저 발화가 없으면 업데이트 없음
+            return {"turn_analysis": {"collect": {"updates": {}}}}
 
         current_profile: Dict[str, Any] = dict(state.get("brand_profile") or {})
+
+        # 인사처럼 브랜드 정보가 없는 발화가 확실하면 추출 호출을 건너뛴다
+        rule_result = pre_classify_intent(
+            user_text,
+            brand_profile=current_profile,
+            trend_context=state.get("trend_context") or {},
+        )
+        if rule_result is not None and rule_result.label in NO_EXTRACTION_LABELS:
+            return {"turn_analysis": {"collect": {"updates": {}}}}
+
         current_profile_json = json.dumps(current_profile, ensure_ascii=False)
 
         system_prompt = _BRAND_COLLECT_SYSTEM_PROMPT + f"""
@@ -142,39 +146,19 @@ def make_brand_collect_node(llm: "BaseChatModel"):
             HumanMessage(content=user_text),
         ]
 
-        ai_msg = llm.invoke(messages)
+        ai_msg = await llm.ainvoke(messages)
         raw = (ai_msg.content or "").strip()
 
         try:
             parsed = json.loads(raw)
         except json.JSONDecodeError:
-            new_meta = dict(state.get("meta") or {})
-            new_meta.setdefault("brand_collect", {})
-            new_meta["brand_collect"]["last_raw"] = raw
-
-            return Command(
-                update={"meta": new_meta},
-                goto="brand_intention",
-            )
-
-        updates = parsed.get("brand_profile_updates") or {}
-        if not isinstance(updates, dict) or not updates:
-            # 업데이트가 없으면 아무 변화 없음
-            return Command(update={}, goto="brand_intention")
-
-        merged_profile = _merge_brand_profile(current_profile, updates)
-
-        new_meta = dict(state.get("meta") or {})
-        new_meta.setdefault("brand_collect", {})
-        new_meta["brand_collect"]["last_updates"] = updates
-
-        return Command(
-            update={
-                "brand_profile": merged_profile,
-                "meta": new_meta,
-            },
-            goto="brand_intention",
-        )
+            return {"turn_analysis": {"collect": {"updates": {}, "last_raw": raw}}}
+
+        updates = parsed.get("brand_profile_updates") if isinstance(parsed, dict) else None
+        if not isinstance(updates, dict):
+            updates = {}
+
+        return {"turn_analysis": {"collect": {"updates": updates}}}
 
     return brand_collect
 
@@ -0,0 +1,231 @@
+# 브랜드 의도 규칙 기반 사전 분류기
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 (키워드/정규식 + 로컬 점수 모델로 LLM 호출 전 단락 처리)
+# - 2026-10-18: 브랜드 정보가 섞인 발화는 단락 처리하지 않음, finalize 부정 표현 가드 추가
+# - 2026-10-18: 한국어 인사말은 단어 전체일 때만 매칭 ("하이볼", "반갑다는" 오분류 수정)
+# - 2026-10-18: finalize 는 규칙으로 확정하지 않고 항상 LLM 으로 넘김 (저장 오발동 방지), 철회 표현 가드 보강
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple
+
+from app.core.config import settings
+
+
+# 라벨별 (정규식, 가중치) 목록
+# - 사용자의 발화에서 패턴이 하나 매칭될 때마다 해당 라벨 점수에 가중치를 더한다.
+_LABEL_PATTERNS: Dict[str, List[Tuple[re.Pattern[str], float]]] = {
+    "smalltalk": [
+        # 한국어 인사말은 뒤에 공백/문장부호/끝이 올 때만 (예: "하이볼", "반갑다는" 은 인사가 아님)
+        (
+            re.compile(
+                r"^\s*(안녕(하세요|하십니까)?|하이|헬로|반가워요?|반갑(습니다|네요)?|ㅎㅇ|hi|hello|hey)"
+                r"(?=[\s!~.,?]|$)",
+                re.I,
+            ),
+            3.0,
+        ),
+        (re.compile(r"^\s*(고마워요?|고맙습니다|감사(합니다|해요)?|수고(하셨어요|하세요)?|ㄱㅅ|ㅇㅋ|오케이|네+|넵|응+)[\s!~.]*$"), 3.0),
+        (re.compile(r"(피곤|심심|졸려|배고|날씨|주말|퇴근|출근|기분|힘들|우울)"), 1.5),
+        (re.compile(r"(ㅋㅋ|ㅎㅎ|ㅠㅠ|ㅜㅜ)"), 0.8),
+    ],
+    "brand_info": [
+        (re.compile(r"(브랜드\s*(이름|명)|상호|가게\s*이름|업종|타깃|타겟|고객층|슬로건|한\s*줄\s*소개|색감|컬러|색상|키워드|톤앤매너|분위기)"), 1.5),
+        (re.compile(r"(이에요|예요|입니다|이고요|하려고|할\s*거|준비\s*중|운영\s*중|오픈|창업)"), 1.0),
+        (re.compile(r"(카페|베이커리|빵집|음식점|식당|패션|뷰티|미용실|네일|꽃집|학원|온라인\s*교육)"), 0.8),
+    ],
+    "edit_brand": [
+        (re.compile(r"(바꿀게|바꿔|바꾸고|변경|수정할|수정해|정정)"), 2.0),
+        (re.compile(r"말고"), 0.8),
+    ],
+    "trend_new": [
+        (re.compile(r"(트렌드|유행|요즘\s*뜨는|인기\s*있는|시장\s*조사|경쟁사|사례)"), 2.0),
+        (re.compile(r"(알려\s*줘|알려\s*주세요|정리해\s*줘|찾아\s*줘|궁금)"), 0.5),
+    ],
+    "trend_retry": [
+        (re.compile(r"(다른|더|추가|또)\s*(예시|아이디어|추천|스타일|사례)"), 2.5),
+        (re.compile(r"(비슷한\s*조건|같은\s*조건|하나\s*더|더\s*보여)"), 2.0),
+    ],
+    "trend_refine": [
+        (re.compile(r"(보다는|대신|말고).{0,20}(다시|추천|위주|느낌)"), 2.0),
+        (re.compile(r"(더|좀\s*더)\s*(밝|어둡|미니멀|고급|심플|귀엽|차분|화려)"), 1.5),
+    ],
+    "finalize": [
+        (re.compile(r"(확정|마무리|최종\s*정리|이대로\s*(저장|진행|갈게|할게|해\s*주)|저장해\s*줘|끝낼게)"), 3.5),
+    ],
+}
+
+# finalize 부정/보류 표현 (예: "확정 안 했어요", "아직 확정 전", "근데 색상은 바꿔줘")
+# - 매칭되면 finalize 는 후보에서 제외한다.
+_FINALIZE_NEGATION = re.compile(
+    r"(아직|아니|취소|잠깐|잠시만|보류|안\s*(했|할|해|하)|못\s*(했|하|해)|하지\s*마|말고"
+    r"|(확정|저장|마무리)\s*(전|하기\s*전)"
+    r"|(근데|그런데|하지만|다만).{0,30}(바꿔|바꾸|변경|수정))"
+)
+
+# 규칙으로는 확정하지 않고 항상 LLM 분류로 넘기는 라벨
+# - finalize 는 persist_brand(프로젝트 DB 저장)로 이어지므로 오탐 비용이 크다.
+_LLM_ONLY_LABELS = ("finalize",)
+
+# 브랜드 프로필 필드를 가리키는 표현
+# - 이런 표현이 있으면 인사/확정처럼 보여도 브랜드 정보 추출을 건너뛰지 않는다.
+_BRAND_FIELD_KEYWORDS = re.compile(
+    r"(이름|상호|가게|매장|브랜드|업종|카테고리|타깃|타겟|고객|연령|성별|슬로건|키워드|톤|분위기|색상|색감|컬러|"
+    r"카페|베이커리|빵집|음식점|식당|패션|뷰티|미용실|네일|꽃집|학원|창업|오픈)"
+)
+
+# 이 라벨 패턴이 하나라도 매칭되면 발화에 브랜드 정보가 있다고 본다
+_BRAND_FACT_LABELS = ("brand_info", "edit_brand")
+
+# 라벨별 기본 점수(사전 확률 역할). 아무 패턴도 없으면 brand_info 쪽으로 약하게 기운다.
+_LABEL_BIAS: Dict[str, float] = {
+    "smalltalk": 0.0,
+    "brand_info": 0.5,
+    "edit_brand": 0.0,
+    "trend_new": 0.0,
+    "trend_retry": 0.0,
+    "trend_refine": 0.0,
+    "finalize": 0.0,
+}
+
+# softmax 온도 (작을수록 점수 차이를 더 크게 본다)
+_TEMPERATURE = 0.5
+
+# 짧은 발화는 정보량이 적어서 smalltalk 일 가능성을 조금 올린다
+_SHORT_TEXT_LEN = 12
+
+# 이 라벨들은 brand_profile 추출이 필요 없으므로,
+# 사전 분류로 확정되면 브랜드 정보 추출 LLM 호출도 건너뛸 수 있다.
+# (finalize 는 사전 분류로 확정하지 않으므로 여기 없음)
+NO_EXTRACTION_LABELS = ("smalltalk", "trend_retry")
+
+
+@dataclass(frozen=True)
+class RuleIntentResult:
+    """규칙 기반 사전 분류 결과."""
+    label: str
+    confidence: float
+    scores: Dict[str, float] = field(default_factory=dict)
+    carries_brand_facts: bool = False
+
+    def as_meta(self) -> Dict[str, Any]:
+        """meta["intent"] / turn_analysis["intent"] 에 그대로 넣을 수 있는 형태."""
+        return {
+            "label": self.label,
+            "reason": f"규칙 기반 사전 분류 (confidence={self.confidence:.2f})",
+            "raw": "",
+            "source": "rule",
+            "confidence": round(self.confidence, 4),
+        }
+
+
+def score_intent(
+    text: str,
+    *,
+    brand_profile: Optional[Dict[str, Any]] = None,
+    trend_context: Optional[Dict[str, Any]] = None,
+) -> RuleIntentResult:
+    """
+    발화를 일곱 가지 라벨에 대해 점수화하고 softmax 확률이 가장 높은 라벨을 반환한다.
+
+    - 이전 트렌드 결과가 없으면 trend_retry / trend_refine 은 후보에서 제외
+    - brand_profile 이 비어 있으면 edit_brand 는 후보에서 제외
+    - 부정/보류 표현("아직", "안 했어요", "근데 …바꿔")이 있으면 finalize 는 후보에서 제외
+    """
+    normalized = (text or "").strip()
+
+    raw_scores: Dict[str, float] = dict(_LABEL_BIAS)
+    matched_labels = set()
+    for label, patterns in _LABEL_PATTERNS.items():
+        for pattern, weight in patterns:
+            if pattern.search(normalized):
+                raw_scores[label] += weight
+                matched_labels.add(label)
+
+    carries_brand_facts = bool(
+        matched_labels.intersection(_BRAND_FACT_LABELS) or _BRAND_FIELD_KEYWORDS.search(normalized)
+    )
+
+    if len(normalized) <= _SHORT_TEXT_LEN:
+        raw_scores["smalltalk"] += 0.5
+
+    has_trend = bool((trend_context or {}).get("last_query") or (trend_context or {}).get("last_result_summary"))
+    if not has_trend:
+        raw_scores.pop("trend_retry", None)
+        raw_scores.pop("trend_refine", None)
+    if not brand_profile:
+        raw_scores.pop("edit_brand", None)
+    if _FINALIZE_NEGATION.search(normalized):
+        raw_scores.pop("finalize", None)
+
+    max_score = max(raw_scores.values())
+    exp_scores = {
+        label: math.exp((score - max_score) / _TEMPERATURE)
+        for label, score in raw_scores.items()
+    }
+    total = sum(exp_scores.values())
+    probs = {label: value / total for label, value in exp_scores.items()}
+
+    best_label = max(probs, key=probs.get)
+    return RuleIntentResult(
+        label=best_label,
+        confidence=probs[best_label],
+        scores=probs,
+        carries_brand_facts=carries_brand_facts,
+    )
+
+
+def pre_classify_intent(
+    text: str,
+    *,
+    brand_profile: Optional[Dict[str, Any]] = None,
+    trend_context: Optional[Dict[str, Any]] = None,
+) -> Optional[RuleIntentResult]:
+    """
+    LLM 호출 전 단계의 사전 분류.
+
+    - settings.intent_rule_enabled 가 꺼져 있거나
+    - 가장 높은 라벨의 확률이 settings.intent_rule_thresholds 의 임계값보다 낮으면
+    - 가장 높은 라벨이 finalize 이면 (DB 저장으로 이어지므로 항상 LLM 이 판단)
+    - 추출이 필요 없는 라벨(NO_EXTRACTION_LABELS)인데 발화에 브랜드 정보가 섞여 있으면
+    None 을 반환한다. (이 경우 LLM 분류로 넘어간다)
+
+    인사말 오분류 회귀 예시 ("하이볼", "반갑다는" 은 인사가 아님):
+    >>> pre_classify_intent("하이볼 가게에요") is None
+    True
+    >>> pre_classify_intent("반갑다는 느낌의 이름이면 좋겠어요") is None
+    True
+    >>> pre_classify_intent("안녕하세요!").label
+    'smalltalk'
+
+    확정 요청은 철회 여부와 상관없이 LLM 으로 넘긴다:
+    >>> pre_classify_intent("확정할게요") is None
+    True
+    >>> score_intent("확정할게요 아니 취소").label != "finalize"
+    True
+    >>> score_intent("확정할게요 잠깐만").label != "finalize"
+    True
+    """
+    if not settings.intent_rule_enabled or not text:
+        return None
+
+    result = score_intent(
+        text,
+        brand_profile=brand_profile,
+        trend_context=trend_context,
+    )
+
+    if result.label in _LLM_ONLY_LABELS:
+        return None
+
+    threshold = settings.intent_rule_thresholds.get(result.label)
+    if threshold is None or result.confidence < threshold:
+        return None
+    if result.label in NO_EXTRACTION_LABELS and result.carries_brand_facts:
+        return None
+
+    return result
@@ -3,6 +3,11 @@
 # 수정내역
 # - 2025-11-20: 초기 작성
 # - 2025-11-20: smalltalk 모드 추가
+# - 2026-10-18: 필수 필드 검증/분기 로직을 공통 함수로 분리
+# - 2026-10-18: brand_collect 와 병렬 실행되도록 분류 결과만 turn_analysis 에 기록
+# - 2026-10-18: LLM 호출 전 규칙 기반 사전 분류 추가
+# - 2026-10-18: async 노드로 변경 (llm.ainvoke)
+# - 2026-10-18: resolve_intent_goto 에서 쓰지 않는 brand_profile 인자 제거
 
 from __future__ import annotations
 
@@ -10,9 +15,9 @@ import json
 from typing import TYPE_CHECKING, Dict, Any, Literal
 
 from langchain_core.messages import SystemMessage, HumanMessage
-from langgraph.types import Command
 
 from app.graphs.nodes.common.message_utils import get_last_user_message
+from app.graphs.nodes.brand.brand_intent_rules import pre_classify_intent
 
 if TYPE_CHECKING:
     from app.agents.state import AppState
@@ -103,6 +108,72 @@ _INTENTION_SYSTEM_PROMPT = """\
 """
 
 
+# 분류 가능한 의도 라벨 (프롬프트의 일곱 가지와 동일)
+INTENT_LABELS = (
+    "smalltalk",
+    "brand_info",
+    "edit_brand",
+    "trend_new",
+    "trend_retry",
+    "trend_refine",
+    "finalize",
+)
+
+BrandRoute = Literal["brand_chat", "trend_search", "trend_refine", "persist_brand"]
+
+
+def validate_brand_profile(brand_profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    필수 필드(브랜드 이름, 업종) 검증 결과를 meta["validation"] 형태로 만든다.
+    """
+    # BrandProfile 스키마 기준: brand_name, category
+    brand_name = (brand_profile.get("brand_name") or "").strip()
+    category = (brand_profile.get("category") or "").strip()
+
+    required_missing = []
+    if not brand_name:
+        required_missing.append("brand_name")
+    if not category:
+        required_missing.append("category")
+
+    return {
+        # 예: ["brand_name"], ["category"], ["brand_name", "category"]
+        "required_missing": required_missing,
+        # 둘 다 채워져 있으면 True
+        "is_valid": not required_missing,
+    }
+
+
+def resolve_intent_goto(label: str, *, is_valid: bool) -> BrandRoute:
+    """
+    의도 라벨에 따라 다음에 실행할 노드 이름을 결정한다.
+
+    - is_valid 는 이번 발화의 업데이트가 반영된 프로필의 필수 필드 검증 결과여야 한다.
+    """
+    if label in ("trend_new", "trend_retry"):
+        return "trend_search"
+
+    if label == "trend_refine":
+        return "trend_refine"
+
+    if label == "edit_brand":
+        # 브랜드 정보 일부를 수정하고 싶은 의도.
+        # 이번 발화의 수정 내용은 brand_collect / brand_understand 에서
+        # 이미 반영되었으므로, 바뀐 내용을 바탕으로 일반 대화 플로우로 보낸다.
+        return "brand_chat"
+
+    if label == "finalize":
+        # 최종 정리를 원하는 의도
+        # - 필수 필드가 모두 채워졌으면 persist_brand 로 넘겨서
+        #   DB 저장 요청 패킷(meta.persist_request)을 만들고,
+        # - 아직 필수 필드가 부족하면 brand_chat 으로 보내
+        #   부족한 정보를 먼저 물어보도록 한다.
+        return "persist_brand" if is_valid else "brand_chat"
+
+    # smalltalk / brand_info / 기타
+    return "brand_chat"
+
+
 def make_brand_intention_node(llm: "BaseChatModel"):
     """
     llm 인스턴스를 주입받아 brand_intention 노드를 만들어 주는 팩토리.
@@ -115,22 +186,33 @@ def make_brand_intention_node(llm: "BaseChatModel"):
     이런 식으로 사용할 예정.
     """
 
-    def brand_intention(state: "AppState",) -> Command[Literal["brand_chat", "trend_search", "trend_refine", "brand_collect", "persist_brand",]]:
+    async def brand_intention(state: "AppState") -> Dict[str, Any]:
         """
         마지막 사용자 발화를 보고 의도를 분류해
-        state.meta["intent"] 에 저장하고,
-        다음에 실행할 노드를 Command.goto 로 결정하는 노드.
+        state.turn_analysis["intent"] 에 기록하는 노드.
+
+        - brand_collect 와 병렬로 실행되며,
+          실제 분기(Command.goto)는 두 결과를 합치는 brand_route 노드가 담당한다.
         """
         user_text = get_last_user_message(state)
         if not user_text:
             # 유저 발화가 없으면 의도 분류할 수 없으니
-            # 상태 변경 없이 brand_chat 으로 넘긴다.
-            return Command(update={}, goto="brand_chat")
+            # 기본값(brand_info)만 남기고 brand_route 에서 brand_chat 으로 보낸다.
+            return {"turn_analysis": {"intent": {"label": "brand_info", "reason": "", "raw": ""}}}
 
         # 참고용 컨텍스트 (필수는 아님)
         brand_profile: Dict[str, Any] = dict(state.get("brand_profile") or {})
         trend_context: Dict[str, Any] = dict(state.get("trend_context") or {})
 
+        # 확신도가 높은 발화(인사 등)는 규칙 기반 사전 분류로 바로 확정 (확정/저장 요청은 항상 LLM)
+        rule_result = pre_classify_intent(
+            user_text,
+            brand_profile=brand_profile,
+            trend_context=trend_context,
+        )
+        if rule_result is not None:
+            return {"turn_analysis": {"intent": rule_result.as_meta()}}
+
         profile_snippet = json.dumps(brand_profile, ensure_ascii=False)[:400]
         last_trend_summary = (trend_context.get("last_result_summary") or "")[:400]
 
@@ -150,7 +232,7 @@ def make_brand_intention_node(llm: "BaseChatModel"):
             HumanMessage(content=user_text),
         ]
 
-        ai_msg = llm.invoke(messages)
+        ai_msg = await llm.ainvoke(messages)
         raw = (ai_msg.content or "").strip()
 
         # 기본값은 brand_info 로 둔다 (예전 동작과 최대한 비슷하게)
@@ -163,17 +245,7 @@ def make_brand_intention_node(llm: "BaseChatModel"):
             intent_val = parsed.get("intent")
             if isinstance(intent_val, str):
                 intent_val = intent_val.strip()
-            allowed = (
-                "smalltalk",
-                "brand_info",
-                "edit_brand", 
-                "trend_new",
-                "trend_retry",
-                "trend_refine",
-                "finalize",
-            )
-
-            if intent_val in allowed:
+            if intent_val in INTENT_LABELS:
                 label = intent_val
             reason_val = parsed.get("reason")
             if isinstance(reason_val, str):
@@ -196,80 +268,14 @@ def make_brand_intention_node(llm: "BaseChatModel"):
             else:
                 label = "brand_info"
 
-        new_meta: Dict[str, Any] = dict(state.get("meta") or {})
-        new_meta["intent"] = {
-            "label": label,
-            "reason": reason,
-            "raw": raw,
+        return {
+            "turn_analysis": {
+                "intent": {
+                    "label": label,
+                    "reason": reason,
+                    "raw": raw,
+                },
+            },
         }
 
-        # --- 필수 필드 검증 (브랜드 이름, 업종) ---
-        brand_profile_for_validation: Dict[str, Any] = dict(
-            state.get("brand_profile") or {}
-        )
-        # BrandProfile 스키마 기준: brand_name, category
-        brand_name = (brand_profile_for_validation.get("brand_name") or "").strip()
-        category = (brand_profile_for_validation.get("category") or "").strip()
-
-        required_missing = []
-        if not brand_name:
-            required_missing.append("brand_name")
-        if not category:
-            required_missing.append("category")
-
-        validation = {
-            # 예: ["brand_name"], ["category"], ["brand_name", "category"]
-            "required_missing": required_missing,
-            # 둘 다 채워져 있으면 True
-            "is_valid": not required_missing,
-        }
-
-        new_meta["validation"] = validation
-
-        is_valid = bool(validation.get("is_valid"))
-
-        # 여기가 핵심: intent 에 따라 다음 노드 결정
-        goto: Literal["brand_chat", "trend_search", "trend_refine", "brand_collect", "persist_brand",]
-
-        if label in ("trend_new", "trend_retry"):
-            goto = "trend_search"
-
-        elif label == "trend_refine":
-            goto = "trend_refine"
-
-        elif label == "edit_brand":
-            # 브랜드 정보 일부를 수정하고 싶은 의도.
-            # 단, 아직 brand_profile 이 거의 비어 있으면
-            # "수정"이 아니라 사실상 "처음 설명"에 가깝기 때문에
-            # 무한 루프를 막기 위해 brand_chat 으로 보낸다.
-            has_any_profile = bool(brand_profile_for_validation)
-            if not has_any_profile:
-                # 수집된 브랜드 정보가 사실상 없는 상태에서 edit 이 나오면
-                # 일단 일반 대화/추가 설명 플로우로 보낸다.
-                goto = "brand_chat"
-            else:
-                # 이미 어느 정도 brand_profile 이 쌓여 있는 상태에서만
-                # 다시 수집 단계로 보내서 upsert 하도록 한다.
-                goto = "brand_collect"
-
-        elif label == "finalize":
-            # 최종 정리를 원하는 의도
-            # - 필수 필드가 모두 채워졌으면 persist_brand 로 넘겨서
-            #   DB 저장 요청 패킷(meta.persist_request)을 만들고,
-            # - 아직 필수 필드가 부족하면 brand_chat 으로 보내
-            #   부족한 정보를 먼저 물어보도록 한다.
-            if is_valid:
-                goto = "persist_brand"
-            else:
-                goto = "brand_chat"
-
-        else:
-            # smalltalk / brand_info / 기타
-            goto = "brand_chat"
-
-        return Command(
-            update={"meta": new_meta},
-            goto=goto,
-        )
-
     return brand_intention
\ No newline at end of file
@@ -0,0 +1,76 @@
+# 브랜드 병렬 분석 결과 합류(join) 노드
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 (brand_collect / brand_intention 병렬 실행 후 분기)
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Any, Literal
+
+from langgraph.types import Command
+
+from app.graphs.nodes.brand.brand_collect_node import _merge_brand_profile
+from app.graphs.nodes.brand.brand_intention_node import (
+    validate_brand_profile,
+    resolve_intent_goto,
+)
+
+if TYPE_CHECKING:
+    from app.agents.state import AppState
+
+
+def make_brand_route_node():
+    """
+    brand_collect 와 brand_intention 이 모두 끝난 뒤 실행되는 합류 노드 팩토리.
+
+    - 두 노드는 서로의 결과를 읽지 않으므로 병렬로 실행하고,
+      이 노드에서 결과를 합쳐 brand_profile / meta 를 갱신한 다음
+      Command.goto 로 다음 노드를 결정한다.
+    """
+
+    def brand_route(state: "AppState") -> Command[Literal["brand_chat", "trend_search", "trend_refine", "persist_brand"]]:
+        analysis: Dict[str, Any] = dict(state.get("turn_analysis") or {})
+        collect_info: Dict[str, Any] = dict(analysis.get("collect") or {})
+        intent_info: Dict[str, Any] = dict(analysis.get("intent") or {})
+
+        label = intent_info.get("label") or "brand_info"
+
+        # 일상 대화일 때는 brand_profile 을 건드리지 않는다
+        updates: Dict[str, Any] = {}
+        if label != "smalltalk":
+            updates = dict(collect_info.get("updates") or {})
+
+        current_profile: Dict[str, Any] = dict(state.get("brand_profile") or {})
+        merged_profile = _merge_brand_profile(current_profile, updates)
+
+        new_meta: Dict[str, Any] = dict(state.get("meta") or {})
+        new_meta["intent"] = {
+            **intent_info,
+            "label": label,
+            "reason": intent_info.get("reason") or "",
+            "raw": intent_info.get("raw") or "",
+        }
+
+        collect_meta: Dict[str, Any] = dict(new_meta.get("brand_collect") or {})
+        if updates:
+            collect_meta["last_updates"] = updates
+        if collect_info.get("last_raw"):
+            collect_meta["last_raw"] = collect_info["last_raw"]
+        if collect_meta:
+            new_meta["brand_collect"] = collect_meta
+
+        validation = validate_brand_profile(merged_profile)
+        new_meta["validation"] = validation
+
+        goto = resolve_intent_goto(
+            label,
+            is_valid=bool(validation.get("is_valid")),
+        )
+
+        update: Dict[str, Any] = {"meta": new_meta}
+        if updates:
+            update["brand_profile"] = merged_profile
+
+        return Command(update=update, goto=goto)
+
+    return brand_route
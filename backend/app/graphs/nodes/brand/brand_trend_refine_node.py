@@ -2,6 +2,8 @@
 # 작성일: 2025-11-20
 # 수정내역
 # - 2025-11-20: 초기 작성
+# - 2026-10-18: async 노드로 변경 (llm.ainvoke)
+# - 2026-10-18: needs_new_search 판단 추가 (false 면 trend_search 가 기존 근거로 재합성)
 
 from __future__ import annotations
 
@@ -37,6 +39,7 @@ _TREND_REFINE_SYSTEM_PROMPT = """\
     "사용자가 요청한 조건 1",
     "사용자가 요청한 조건 2"
   ],
+  "needs_new_search": false,
   "reason": "왜 이렇게 수정했는지에 대한 한국어 설명"
 }
 
@@ -47,7 +50,10 @@ _TREND_REFINE_SYSTEM_PROMPT = """\
 2) constraints:
    - 사용자가 추가로 요구한 조건/제약사항을 리스트로 정리한다.
    - 예: "색감은 더 밝게", "10대 타깃은 제외", "너무 고급스러움은 피하기"
-3) reason:
+3) needs_new_search:
+   - 이전 추천의 근거 자료만으로는 답할 수 없는 새 주제/플랫폼/기간/업종 등이 요구되면 true.
+   - 톤, 색감, 표현 방식, 제외 조건처럼 같은 자료에서 다르게 골라 쓰면 되는 수정이면 false.
+4) reason:
    - 왜 이런 방향으로 질의를 수정했는지 한국어 한두 문장으로 설명한다.
 
 주의:
@@ -64,7 +70,7 @@ def make_brand_trend_refine_node(llm: "BaseChatModel"):
       바로 뒤에서 trend_search 노드가 다시 호출될 수 있도록 준비한다.
     """
 
-    def trend_refine(state: "AppState") -> Command[Literal["trend_search"]]:
+    async def trend_refine(state: "AppState") -> Command[Literal["trend_search"]]:
         """
         마지막 사용자 발화를 피드백으로 받아,
         - trend_context.last_query 를 수정하고
@@ -82,6 +88,7 @@ def make_brand_trend_refine_node(llm: "BaseChatModel"):
         if not last_query and not last_summary:
             trend_context["last_query"] = user_text
             trend_context.setdefault("constraints", [])
+            trend_context["needs_new_search"] = True
             trend_context["round"] = int(trend_context.get("round") or 0) + 1
 
             return Command(
@@ -103,15 +110,16 @@ def make_brand_trend_refine_node(llm: "BaseChatModel"):
 
         messages = [
             SystemMessage(content=system_prompt),
-            HumanMessage(content="위 정보를 바탕으로 new_query, constraints, reason 을 JSON 으로 만들어줘."),
+            HumanMessage(content="위 정보를 바탕으로 new_query, constraints, needs_new_search, reason 을 JSON 으로 만들어줘."),
         ]
 
-        ai_msg = llm.invoke(messages)
+        ai_msg = await llm.ainvoke(messages)
         raw = (ai_msg.content or "").strip()
 
         new_query = last_query or user_text
         new_constraints: List[str] = []
         reason = ""
+        needs_new_search = True
 
         # JSON 파싱 시도
         try:
@@ -125,6 +133,10 @@ def make_brand_trend_refine_node(llm: "BaseChatModel"):
                 if isinstance(cs, list):
                     new_constraints = [str(c).strip() for c in cs if str(c).strip()]
 
+                ns = parsed.get("needs_new_search")
+                if isinstance(ns, bool):
+                    needs_new_search = ns
+
                 rs = parsed.get("reason")
                 if isinstance(rs, str):
                     reason = rs.strip()
@@ -139,6 +151,7 @@ def make_brand_trend_refine_node(llm: "BaseChatModel"):
         trend_context["constraints"] = merged_constraints
         trend_context["round"] = int(trend_context.get("round") or 0) + 1
         trend_context["last_refine_reason"] = reason
+        trend_context["needs_new_search"] = needs_new_search
 
         return Command(
             update={
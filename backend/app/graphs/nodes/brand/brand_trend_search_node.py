@@ -2,6 +2,10 @@
 # 작성일: 2025-11-20
 # 수정내역
 # - 2025-11-20: 초기 작성
+# - 2026-10-18: async 노드로 변경 (arun_trend_query_for_api)
+# - 2026-10-18: messages 전체 대신 트렌드 답변만 업데이트
+# - 2026-10-18: trend_retry 의도는 트렌드 답변 캐시를 우회
+# - 2026-10-18: retry/refine 은 trend_context.evidence_id 의 근거 문서로 재합성, refine 질의 반영
 
 
 from __future__ import annotations
@@ -12,7 +16,7 @@ from langchain_core.messages import AIMessage
 from langgraph.types import Command
 
 from app.graphs.nodes.common.message_utils import get_last_user_message
-from app.agents.trend_agent import run_trend_query_for_api
+from app.agents.trend_agent import arefine_trend_answer, arun_trend_query
 
 if TYPE_CHECKING:
     from app.agents.state import AppState
@@ -23,10 +27,12 @@ def make_brand_trend_search_node(llm: "BaseChatModel"):
     """
     브랜드 에이전트에서 사용할 트렌드 검색 노드 팩토리.
     - llm 인자는 시그니처 통일을 위한 것이고, 이 노드 내부에서는 사용하지 않는다.
-    - 실제 트렌드 분석은 app.agents.trend_agent.run_trend_query_for_api 가 담당한다.
+    - 실제 트렌드 분석은 app.agents.trend_agent.arun_trend_query 가 담당한다.
+    - trend_retry / trend_refine 은 이전 답변의 근거 문서(evidence_id)를 재사용해
+      검색 없이 LLM 1회로 다시 답한다. (refine 에서 새 자료가 필요하면 추가 검색)
     """
 
-    def trend_search(state: "AppState") -> Command[Literal["brand_chat"]]:
+    async def trend_search(state: "AppState") -> Command[Literal["brand_chat"]]:
         """
         사용자의 마지막 발화를 트렌드 질의로 삼아 trend_agent 를 호출하고,
         결과를 messages 및 trend_context 에 반영하는 노드.
@@ -41,28 +47,56 @@ def make_brand_trend_search_node(llm: "BaseChatModel"):
         brand_profile: Dict[str, Any] = dict(state.get("brand_profile") or {})
         user_id = state.get("user_id")
 
-        # trend_agent 의 범용 함수 호출
-        answer = run_trend_query_for_api(
-            query=user_text,
-            mode=mode,
-            project_id=project_id,
-            brand_profile=brand_profile or None,
-            user_id=user_id,
-        )
+        trend_context: Dict[str, Any] = dict(state.get("trend_context") or {})
+        intent_label = (dict(state.get("meta") or {}).get("intent") or {}).get("label")
+
+        result = None
+        query = user_text
+        if intent_label == "trend_retry" and trend_context.get("last_query"):
+            # "다른 추천": 같은 근거로 이전 답변과 겹치지 않게 다시 답변
+            query = trend_context["last_query"]
+            result = await arefine_trend_answer(
+                query,
+                evidence_id=trend_context.get("evidence_id"),
+                brand_profile=brand_profile or None,
+                constraints=trend_context.get("constraints") or None,
+                previous_answer=trend_context.get("last_result_summary"),
+            )
+        elif intent_label == "trend_refine" and trend_context.get("last_query"):
+            # trend_refine 노드가 수정해 둔 질의/조건 사용
+            query = trend_context["last_query"]
+            result = await arefine_trend_answer(
+                query,
+                evidence_id=trend_context.get("evidence_id"),
+                brand_profile=brand_profile or None,
+                constraints=trend_context.get("constraints") or None,
+                fetch_new=bool(trend_context.get("needs_new_search", True)),
+            )
+
+        if result is None:
+            # 새 질의이거나 근거가 만료된 경우: 전체 검색
+            # ("다른 추천" 요청(trend_retry)은 캐시된 이전 답변을 다시 주면 안 된다)
+            result = await arun_trend_query(
+                query=query,
+                mode=mode,
+                project_id=project_id,
+                brand_profile=brand_profile or None,
+                user_id=user_id,
+                use_cache=intent_label not in ("trend_retry", "trend_refine"),
+            )
+        answer = result.answer
 
         # trend_context 업데이트
-        trend_context: Dict[str, Any] = dict(state.get("trend_context") or {})
-        trend_context["last_query"] = user_text
+        trend_context["last_query"] = query
         trend_context["last_result_summary"] = answer
+        trend_context["evidence_id"] = result.evidence_id
 
         # 트렌드 결과를 히스토리에 AIMessage 로 추가
-        messages = list(state.get("messages") or [])
-        messages.append(AIMessage(content=answer))
-
+        # (messages 는 add_messages 리듀서라 새 메시지만 넘긴다. 전체 리스트를 다시 쓰면 체크포인트가 커진다)
         return Command(
             update={
                 "trend_context": trend_context,
-                "messages": messages,
+                "messages": [AIMessage(content=answer)],
             },
             goto="brand_chat",
         )
@@ -0,0 +1,198 @@
+# 브랜드 턴 이해 노드 (의도 분류 + 브랜드 정보 추출 통합)
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 (brand_collect + brand_intention 을 한 번의 LLM 호출로 통합)
+# - 2026-10-18: 규칙 기반 사전 분류로 정보 추출이 필요 없는 발화는 LLM 호출 생략
+# - 2026-10-18: async 노드로 변경 (structured_llm.ainvoke)
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING, Dict, Any, Literal, Optional
+
+from pydantic import BaseModel, Field
+from langchain_core.messages import SystemMessage, HumanMessage
+from langgraph.types import Command
+
+from app.graphs.nodes.common.message_utils import get_last_user_message
+from app.graphs.nodes.brand.brand_collect_node import _merge_brand_profile
+from app.graphs.nodes.brand.brand_intent_rules import pre_classify_intent, NO_EXTRACTION_LABELS
+from app.graphs.nodes.brand.brand_intention_node import (
+    validate_brand_profile,
+    resolve_intent_goto,
+)
+
+if TYPE_CHECKING:
+    from app.agents.state import AppState
+    from langchain_core.language_models.chat_models import BaseChatModel
+
+logger = logging.getLogger(__name__)
+
+
+class BrandProfileUpdates(BaseModel):
+    """이번 발화에서 새로 채워지거나 수정된 브랜드 프로필 필드."""
+    brand_name: Optional[str] = None
+    category: Optional[str] = None
+    tone_mood: Optional[str] = None
+    core_keywords: Optional[str] = None
+    slogan: Optional[str] = None
+    target_age: Optional[str] = None
+    target_gender: Optional[str] = None
+    avoided_trends: Optional[str] = None
+    preferred_colors: Optional[str] = None
+
+
+class BrandTurnUnderstanding(BaseModel):
+    """brand_understand 노드의 structured output 스키마."""
+    intent: Literal[
+        "smalltalk",
+        "brand_info",
+        "edit_brand",
+        "trend_new",
+        "trend_retry",
+        "trend_refine",
+        "finalize",
+    ] = Field(description="사용자 발화의 의도 라벨")
+    reason: str = Field(default="", description="분류 이유 (한국어, 한두 문장)")
+    brand_profile_updates: BrandProfileUpdates = Field(
+        default_factory=BrandProfileUpdates,
+        description="이번 발화에서 새로 말했거나 수정한 브랜드 정보만",
+    )
+
+
+_BRAND_UNDERSTAND_SYSTEM_PROMPT = """\
+너는 한국 소상공인/1인 창업자를 돕는 '브랜드 챗봇'의 발화 분석기야.
+사용자의 최신 발화 하나를 보고 아래 두 가지를 동시에 정리해.
+
+[1. 의도(intent) 분류] - 아래 일곱 가지 중 하나만 선택
+
+- "smalltalk": 브랜드/마케팅/트렌드와 상관없는 일상 대화
+  (예: "오늘 너무 피곤하네요.", "요즘 날씨 너무 춥지 않나요?")
+- "brand_info": 브랜드 이름, 업종, 타깃, 톤앤매너, 키워드, 슬로건, 색감 등을
+  새로 설명하거나 추가로 알려주는 발화 (이미 말한 정보를 반복하는 것도 포함)
+- "edit_brand": 이미 정리된 브랜드 정보 중 일부를 다른 값으로 바꾸고 싶은 발화
+  (예: "업종을 카페 말고 베이커리로 정정할게요.")
+- "trend_new": 트렌드/시장/경쟁사/사례를 처음 물어보는 질문
+  (예: "요즘 카페 로고 디자인 트렌드가 어떤지 알려줘.")
+- "trend_retry": 직전 트렌드 추천과 같은 조건으로 다른 예시/추가 추천을 원할 때
+  (예: "비슷한 조건으로 다른 아이디어도 더 줄 수 있어?")
+- "trend_refine": 트렌드 추천을 받은 뒤 조건을 바꿔서 다시 추천받고 싶을 때
+  (예: "MZ 타깃보다는 40대 위주로 다시 추천해 줄래?")
+- "finalize": 지금까지 정리된 브랜드 정보로 마무리/확정하고 싶을 때
+  (예: "이제 이 브랜드 컨셉으로 확정할게요.")
+
+reason 에는 왜 그렇게 분류했는지 한국어로 간단히 설명해.
+
+[2. 브랜드 프로필 업데이트(brand_profile_updates)]
+
+- brand_name: 브랜드 이름
+- category: 업종/카테고리 (예: 카페, 음식점, 패션, 뷰티, 온라인 교육 등)
+- tone_mood: 브랜드 톤/무드 (예: 힙한, 고급스러운, 따뜻한, 캐주얼한 등)
+- core_keywords: 핵심 키워드들 (여러 개면 콤마로 구분한 하나의 문자열)
+- slogan: 슬로건 또는 한 줄 소개
+- target_age: 타깃 연령대 (자유 텍스트)
+- target_gender: 타깃 성별 (예: "여성 위주", "남녀공용" 등)
+- avoided_trends: 피하고 싶은 분위기/트렌드
+- preferred_colors: 선호 색상/색감
+
+규칙:
+- 사용자가 이번 발화에서 **새로 말한 것 / 수정 의도가 있는 것**만 채워.
+- 애매하거나 추측인 값은 넣지 말고 비워 둬.
+- intent 가 "smalltalk" 이면 brand_profile_updates 는 비워 둬.
+"""
+
+
+def make_brand_understand_node(llm: "BaseChatModel"):
+    """
+    llm 인스턴스를 주입받아 brand_understand 노드를 만들어 주는 팩토리.
+
+    brand_collect(브랜드 정보 추출) 와 brand_intention(의도 분류) 을
+    structured output 한 번으로 처리한다.
+    """
+    structured_llm = llm.with_structured_output(BrandTurnUnderstanding)
+
+    async def brand_understand(state: "AppState") -> Command[Literal["brand_chat", "trend_search", "trend_refine", "persist_brand"]]:
+        """
+        마지막 사용자 발화에서 의도와 브랜드 정보 업데이트를 함께 추출해
+        state.brand_profile / state.meta 에 반영하고,
+        다음에 실행할 노드를 Command.goto 로 결정하는 노드.
+        """
+        user_text = get_last_user_message(state)
+        if not user_text:
+            return Command(update={}, goto="brand_chat")
+
+        current_profile: Dict[str, Any] = dict(state.get("brand_profile") or {})
+        trend_context: Dict[str, Any] = dict(state.get("trend_context") or {})
+
+        profile_json = json.dumps(current_profile, ensure_ascii=False)
+        last_trend_summary = (trend_context.get("last_result_summary") or "")[:400]
+
+        system_prompt = _BRAND_UNDERSTAND_SYSTEM_PROMPT + f"""
+
+[현재까지 알고 있는 브랜드 프로필]
+{profile_json}
+
+[직전 트렌드 요약 (있다면)]
+{last_trend_summary}
+"""
+
+        messages = [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_text),
+        ]
+
+        new_meta: Dict[str, Any] = dict(state.get("meta") or {})
+        new_meta.pop("brand_understand", None)
+
+        # 인사처럼 브랜드 정보 추출이 필요 없는 발화가 확실하면 LLM 을 부르지 않는다
+        rule_result = pre_classify_intent(
+            user_text,
+            brand_profile=current_profile,
+            trend_context=trend_context,
+        )
+        if rule_result is not None and rule_result.label in NO_EXTRACTION_LABELS:
+            intent_meta = rule_result.as_meta()
+            result = BrandTurnUnderstanding(intent=rule_result.label, reason=intent_meta["reason"])
+        else:
+            intent_meta = None
+            try:
+                result = await structured_llm.ainvoke(messages)
+            except Exception as e:
+                # structured output 실패 시 예전 기본값(brand_info, 업데이트 없음)으로 진행
+                logger.warning("[brand_understand] structured output 실패: %s", e)
+                result = BrandTurnUnderstanding(intent="brand_info", reason="")
+                new_meta["brand_understand"] = {"error": str(e)}
+
+        label = result.intent
+        updates: Dict[str, Any] = {}
+        if label != "smalltalk":
+            updates = result.brand_profile_updates.model_dump(exclude_none=True)
+
+        merged_profile = _merge_brand_profile(current_profile, updates)
+
+        new_meta["intent"] = intent_meta or {
+            "label": label,
+            "reason": result.reason.strip(),
+            "raw": result.model_dump_json(),
+        }
+        if updates:
+            collect_meta: Dict[str, Any] = dict(new_meta.get("brand_collect") or {})
+            collect_meta["last_updates"] = updates
+            new_meta["brand_collect"] = collect_meta
+
+        validation = validate_brand_profile(merged_profile)
+        new_meta["validation"] = validation
+
+        goto = resolve_intent_goto(
+            label,
+            is_valid=bool(validation.get("is_valid")),
+        )
+
+        update: Dict[str, Any] = {"meta": new_meta}
+        if updates:
+            update["brand_profile"] = merged_profile
+
+        return Command(update=update, goto=goto)
+
+    return brand_understand
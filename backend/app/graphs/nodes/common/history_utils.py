@@ -0,0 +1,165 @@
+# 챗 노드 공통 대화 히스토리 관리 (롤링 요약 + 토큰 예산)
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from langchain_core.messages import AnyMessage, HumanMessage, SystemMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langgraph.constants import TAG_NOSTREAM
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from app.agents.state import AppState
+    from langchain_core.language_models.chat_models import BaseChatModel
+
+logger = logging.getLogger(__name__)
+
+# meta 안에서 히스토리 상태를 보관하는 키
+# - summary          : 지금까지 접힌 오래된 대화의 요약
+# - summarized_count : messages 앞에서부터 요약에 포함된 메시지 수
+HISTORY_META_KEY = "history"
+
+_DEFAULT_TOKEN_BUDGET = 6000
+
+_SUMMARY_SYSTEM_PROMPT = """\
+너는 대화 기록을 압축하는 요약 담당자야.
+[기존 요약]과 [새로 접을 대화]를 합쳐서, 다음 답변에 필요한 내용만 남긴 하나의 요약을 만들어.
+
+규칙:
+- 사용자가 말한 브랜드 정보, 선호/비선호, 결정된 사항, 아직 답하지 않은 질문은 반드시 남긴다.
+- 트렌드 검색 결과는 핵심 결론과 추천만 한두 줄로 남긴다.
+- 인사/맞장구처럼 이후 대화에 영향이 없는 내용은 버린다.
+- 한국어 개조식으로, 최대 15줄.
+- 요약 외의 다른 말은 출력하지 않는다.
+"""
+
+
+def _turn_starts(messages: List[AnyMessage]) -> List[int]:
+    """사용자 발화(HumanMessage)가 시작되는 인덱스 목록 = 턴 경계."""
+    return [idx for idx, msg in enumerate(messages) if isinstance(msg, HumanMessage)]
+
+
+def _message_text(msg: AnyMessage) -> str:
+    content = getattr(msg, "content", "")
+    if isinstance(content, str):
+        return content
+    return str(content)
+
+
+def _trim_long_outputs(messages: List[AnyMessage], max_chars: int) -> List[AnyMessage]:
+    """
+    사용자 발화가 아닌 긴 메시지(트렌드 답변, 도구 결과 등)를 max_chars 로 자른다.
+    - 원본 state 는 건드리지 않고 복사본을 만든다.
+    """
+    if max_chars <= 0:
+        return list(messages)
+
+    trimmed: List[AnyMessage] = []
+    for msg in messages:
+        text = _message_text(msg)
+        if isinstance(msg, HumanMessage) or len(text) <= max_chars:
+            trimmed.append(msg)
+            continue
+        trimmed.append(msg.model_copy(update={"content": text[:max_chars] + "\n...(이하 생략)"}))
+    return trimmed
+
+
+def _format_for_summary(messages: List[AnyMessage], max_chars: int) -> str:
+    role_names = {"human": "사용자", "ai": "어시스턴트", "tool": "도구", "system": "시스템"}
+    lines = []
+    for msg in _trim_long_outputs(messages, max_chars):
+        role = role_names.get(getattr(msg, "type", ""), "기타")
+        lines.append(f"{role}: {_message_text(msg)}")
+    return "\n".join(lines)
+
+
+async def _summarize(
+    llm: "BaseChatModel",
+    previous_summary: str,
+    messages: List[AnyMessage],
+) -> str:
+    prompt = [
+        SystemMessage(content=_SUMMARY_SYSTEM_PROMPT),
+        HumanMessage(
+            content=(
+                f"[기존 요약]\n{previous_summary or '(없음)'}\n\n"
+                f"[새로 접을 대화]\n{_format_for_summary(messages, settings.history_tool_output_max_chars)}"
+            )
+        ),
+    ]
+    # 요약 토큰이 사용자 스트리밍(token 이벤트)에 섞이지 않도록 nostream 태그
+    ai_msg = await llm.ainvoke(prompt, config={"tags": [TAG_NOSTREAM]})
+    return _message_text(ai_msg).strip()
+
+
+async def prepare_chat_history(
+    state: "AppState",
+    llm: "BaseChatModel",
+    *,
+    mode: str,
+) -> Tuple[List[AnyMessage], Dict[str, Any]]:
+    """
+    챗 노드가 LLM 에 넘길 히스토리를 만든다.
+
+    - 요약 이후의 메시지가 mode 별 토큰 예산(settings.history_token_budgets) 안이면 그대로 사용
+    - 넘치면 최근 settings.history_keep_last_turns 턴만 원문으로 남기고,
+      그 앞의 대화는 meta["history"]["summary"] 에 롤링 요약으로 접는다.
+    - 마지막 턴을 제외한 긴 AI/도구 출력은 settings.history_tool_output_max_chars 로 자른다.
+    - 그래도 넘치면 오래된 턴부터 뺀다. (마지막 턴은 항상 유지)
+
+    반환값: (프롬프트용 메시지 리스트, 갱신된 meta["history"])
+    요약이 있으면 리스트 맨 앞에 요약 SystemMessage 가 들어간다.
+    """
+    messages: List[AnyMessage] = list(state.get("messages") or [])
+    meta: Dict[str, Any] = dict(state.get("meta") or {})
+    history: Dict[str, Any] = dict(meta.get(HISTORY_META_KEY) or {})
+
+    summary: str = history.get("summary") or ""
+    summarized_count = int(history.get("summarized_count") or 0)
+    if summarized_count > len(messages):
+        # 히스토리가 외부에서 줄어든 경우(체크포인트 초기화 등) 요약을 버리고 다시 시작
+        summary, summarized_count = "", 0
+
+    budget = settings.history_token_budgets.get(mode, _DEFAULT_TOKEN_BUDGET)
+    recent = messages[summarized_count:]
+
+    if count_tokens_approximately(recent) > budget:
+        starts = [idx for idx in _turn_starts(messages) if idx >= summarized_count]
+        keep_turns = max(settings.history_keep_last_turns, 1)
+        if len(starts) > keep_turns:
+            cut = starts[-keep_turns]
+            try:
+                summary = await _summarize(llm, summary, messages[summarized_count:cut])
+                summarized_count = cut
+            except Exception as e:
+                # 요약 실패 시 이번 턴은 잘라내기만으로 예산을 맞춘다
+                logger.warning("[history] 요약 실패: %s", e)
+                cut = summarized_count
+            recent = messages[cut:]
+
+    # 마지막 턴(방금 들어온 발화와 이번 턴의 트렌드 결과 등)은 자르지 않는다
+    starts = _turn_starts(recent)
+    last_turn_start = starts[-1] if starts else 0
+    recent = _trim_long_outputs(recent[:last_turn_start], settings.history_tool_output_max_chars) + recent[last_turn_start:]
+
+    summary_messages: List[AnyMessage] = []
+    if summary:
+        summary_messages.append(SystemMessage(content=f"[이전 대화 요약]\n{summary}"))
+
+    while count_tokens_approximately(summary_messages + recent) > budget:
+        starts = _turn_starts(recent)
+        if len(starts) < 2:
+            break
+        recent = recent[starts[1]:]
+
+    new_history = {
+        "summary": summary,
+        "summarized_count": summarized_count,
+    }
+    return summary_messages + recent, new_history
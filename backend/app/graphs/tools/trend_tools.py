@@ -3,71 +3,128 @@
 # 수정내역
 # - 2025-11-18: 초기 작성
 # - 2025-11-19: 로직 수정
+# - 2026-10-18: 도구를 async 로 변경 (asimilarity_search, Tavily ainvoke, acompress_documents)
+# - 2026-10-18: 호출마다 Chroma 를 새로 열지 않고 vector_service 공용 레지스트리 사용
+# - 2026-10-18: rag_search_tool 을 하이브리드(BM25 + 벡터, RRF) 검색 + 메타데이터 필터로 변경
+# - 2026-10-18: apply_reranker_tool 을 rerank_service(백엔드 선택 + 결과 캐시) 로 변경
+# - 2026-10-18: 모듈 전역 _last_docs 제거, 검색 결과를 실행 단위 state(retrieved_docs) 로 보관
+# - 2026-10-18: 웹 검색을 web_search_service(공용 클라이언트 + TTL 캐시) 로 변경
+# - 2026-10-18: 웹 결과 변환/근거 포맷 함수 분리 (트렌드 파이프라인 모드와 공용)
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
 import logging
 
-from pathlib import Path
-
+from langchain.tools import ToolRuntime
 from langchain_core.tools import tool
 from langchain_core.documents import Document
-from langchain_chroma import Chroma
-from langchain_community.tools.tavily_search import TavilySearchResults
-from langchain_community.document_compressors import JinaRerank
+from langchain_core.messages import ToolMessage
+from langgraph.types import Command
 
 from app.core.config import settings
-from app.llm.client import get_embeddings
+from app.services.rerank_service import rerank_documents
+from app.services.retrieval_service import hybrid_search
+from app.services.web_search_service import web_search
 
 logger = logging.getLogger(__name__)
 
-# 최근 검색 문서 캐시 (Rerank용)
-_last_docs: List[Document] = []
 
 
-def _get_vectorstore() -> Chroma:
+def _tool_result(runtime: ToolRuntime, content: str, docs: Optional[List[Document]] = None) -> Command:
     """
-    트렌드 RAG용 Chroma 벡터스토어 생성/획득.
-    - 실제로는 초기화/인덱싱 코드를 따로 두는 게 좋지만
-      지금은 agent 테스트용으로 간단히 구성합니다.
+    도구 응답 메시지 + (있으면) 검색 문서를 state 에 반영하는 Command.
+    - 검색 문서는 AppState.retrieved_docs 에 이어 붙는다. (실행 단위로 격리, reranker 입력)
     """
-    embeddings = get_embeddings()
-    
-    # config에서 벡터스토어 설정 가져오기
-    project_root = Path(__file__).parent.parent.parent.parent.parent  # c:/backend/
-    vector_store_path = project_root / settings.vector_store_dir
-    
-    return Chroma(
-        collection_name=settings.vector_store_collection,
-        embedding_function=embeddings,
-        persist_directory=str(vector_store_path),
-    )
+    update: dict = {"messages": [ToolMessage(content=content, tool_call_id=runtime.tool_call_id)]}
+    if docs:
+        update["retrieved_docs"] = docs
+    return Command(update=update)
+
+
+def web_results_to_documents(results: List[dict]) -> List[Document]:
+    """Tavily 결과 dict 리스트 -> Document 리스트 (metadata source="TAVILY")."""
+    docs: List[Document] = []
+    for item in results:
+        docs.append(
+            Document(
+                page_content=item.get("content") or "",
+                metadata={
+                    "source": "TAVILY",
+                    "title": item.get("title") or "",
+                    "url": item.get("url") or "",
+                },
+            )
+        )
+    return docs
+
+
+def format_evidence(docs: List[Document], label: str = "RERANKED") -> str:
+    """RAG/웹 문서를 LLM 에 넘길 근거 블록 문자열로 만든다."""
+    blocks: List[str] = []
+    for idx, doc in enumerate(docs, start=1):
+        meta = doc.metadata or {}
+        source = (meta.get("source") or "RAG").upper()
+        title = meta.get("title") or ""
+
+        header = f"[{label} {idx}] {source}"
+        if title:
+            header += f": {title}"
+
+        block_lines = [header]
+
+        if source == "TAVILY" and meta.get("url"):
+            block_lines.append(f"URL: {meta.get('url')}")
+
+        block_lines.append(doc.page_content)
+        blocks.append("\n".join(block_lines))
+
+    return "\n\n---\n\n".join(blocks)
 
 
 @tool("rag_search_tool", return_direct=False)
-def rag_search_tool(query: str) -> str:
+async def rag_search_tool(
+    query: str,
+    category: Optional[str] = None,
+    platform: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    runtime: ToolRuntime = None,
+) -> Command:
     """
     내부 트렌드/마케팅 자료를 우선 검색하는 도구입니다.
 
-    - vector store: trend_rag (Chroma)
+    - 키워드(BM25) + 벡터 하이브리드 검색이라 브랜드명/해시태그/복합어도 정확히 찾습니다.
+    - 선택 필터 (알 때만 지정):
+      category: 자료 분류 (예: "마케팅", "디자인")
+      platform: 플랫폼 (예: "instagram", "youtube", "tiktok")
+      date_from / date_to: 자료 작성 시점 범위 ("2026", "2026-03", "2026-03-01")
     - 사용 시점:
       1. 사용자의 질문을 그대로 RAG 검색
-      2. 검색된 문서들을 _last_docs에 캐시
+      2. 검색된 문서들은 이번 실행의 재정렬 대상으로 보관
       3. LLM이 이를 바탕으로 1차 답변을 구성하거나,
          필요시 추가 도구(tavily_web_search_tool, apply_reranker_tool)를 호출할 수 있습니다.
     """
-    global _last_docs
-
-    logger.info("[도구:rag_search_tool] 쿼리: %s", query)
+    logger.info(
+        "[도구:rag_search_tool] 쿼리: %s (category=%s, platform=%s, date=%s~%s)",
+        query,
+        category,
+        platform,
+        date_from,
+        date_to,
+    )
 
-    vs = _get_vectorstore()
-    docs = vs.similarity_search(query, k=8)
-    _last_docs = docs
+    docs = await hybrid_search(
+        query,
+        category=category,
+        platform=platform,
+        date_from=date_from,
+        date_to=date_to,
+    )
 
     if not docs:
-        return "RAG 검색 결과가 없습니다. 필요한 경우 tavily_web_search_tool을 사용해 주세요."
+        return _tool_result(runtime, "RAG 검색 결과가 없습니다. 필요한 경우 tavily_web_search_tool을 사용해 주세요.")
 
     blocks: List[str] = []
     for idx, doc in enumerate(docs, start=1):
@@ -76,11 +133,11 @@ def rag_search_tool(query: str) -> str:
         header = f"[RAG {idx}] {title}" if title else f"[RAG {idx}]"
         blocks.append(f"{header}\n{doc.page_content}")
 
-    return "\n\n---\n\n".join(blocks)
+    return _tool_result(runtime, "\n\n---\n\n".join(blocks), docs)
 
 
 @tool("tavily_web_search_tool", return_direct=False)
-def tavily_web_search_tool(query: str) -> str:
+async def tavily_web_search_tool(query: str, runtime: ToolRuntime = None) -> Command:
     """
     웹 트렌드 보완 검색 도구입니다.
 
@@ -88,106 +145,64 @@ def tavily_web_search_tool(query: str) -> str:
     - 내부 RAG 검색 결과가 부족할 때만 사용하세요.
     - 최신 트렌드, 통계, 사례 등이 필요할 때 유용합니다.
     """
-    global _last_docs
-
     if not settings.tavily_api_key:
         logger.warning("[도구:tavily_web_search_tool] Tavily API Key가 설정되어 있지 않습니다.")
-        return "Tavily API Key가 설정되지 않아 웹 검색을 사용할 수 없습니다."
+        return _tool_result(runtime, "Tavily API Key가 설정되지 않아 웹 검색을 사용할 수 없습니다.")
 
     logger.info("[도구:tavily_web_search_tool] 쿼리: %s", query)
 
-    tavily = TavilySearchResults(
-        tavily_api_key=settings.tavily_api_key,
-        max_results=5,
-        search_depth="advanced",
-    )
-    results = tavily.invoke({"query": query})
+    try:
+        results = await web_search(query, max_results=5, search_depth="advanced")
+    except Exception as e:
+        logger.error("[도구:tavily_web_search_tool] 검색 실패: %s", e)
+        return _tool_result(runtime, "웹 검색 중 오류가 발생했습니다.")
 
-    docs: List[Document] = []
+    docs = web_results_to_documents(results)
     blocks: List[str] = []
-
-    for idx, item in enumerate(results, start=1):
-        title = item.get("title") or ""
-        url = item.get("url") or ""
-        content = item.get("content") or ""
-
-        meta = {
-            "source": "TAVILY",
-            "title": title,
-            "url": url,
-        }
-        doc = Document(page_content=content, metadata=meta)
-        docs.append(doc)
+    for idx, doc in enumerate(docs, start=1):
+        title = doc.metadata["title"]
+        url = doc.metadata["url"]
 
         header = f"[WEB {idx}] {title}".strip() or f"[WEB {idx}]"
         block_lines = [header]
         if url:
             block_lines.append(f"URL: {url}")
-        block_lines.append(content)
+        block_lines.append(doc.page_content)
         blocks.append("\n".join(block_lines))
 
-    # 기존 RAG 결과에 웹 결과를 추가
-    _last_docs.extend(docs)
-
     if not docs:
-        return "웹 검색 결과가 없습니다."
+        return _tool_result(runtime, "웹 검색 결과가 없습니다.")
 
-    return "\n\n---\n\n".join(blocks)
+    # 기존 RAG 결과에 웹 결과를 추가 (retrieved_docs 리듀서가 이어 붙임)
+    return _tool_result(runtime, "\n\n---\n\n".join(blocks), docs)
 
 
 @tool("apply_reranker_tool", return_direct=False)
-def apply_reranker_tool(query: str) -> str:
+async def apply_reranker_tool(query: str, runtime: ToolRuntime = None) -> str:
     """
-    Jina Rerank를 사용해 RAG + 웹 검색 결과를 재정렬하는 도구입니다.
+    RAG + 웹 검색 결과를 질문과의 관련도 순으로 재정렬하는 도구입니다.
 
     사용 규칙:
     - rag_search_tool, tavily_web_search_tool 사용 이후에 호출
-    - _last_docs에 쌓여 있는 문서를 대상으로 재정렬
+    - 이번 실행에서 검색 도구들이 모은 문서를 대상으로 재정렬
     - 최종 답변 생성 전 마지막 단계로 사용하는 것이 좋습니다.
     """
-    global _last_docs
+    retrieved: List[Document] = list(runtime.state.get("retrieved_docs") or [])
 
-    logger.info("[도구:apply_reranker_tool] 재정렬 대상 문서 수: %d", len(_last_docs))
+    logger.info("[도구:apply_reranker_tool] 재정렬 대상 문서 수: %d", len(retrieved))
 
-    if not _last_docs:
+    if not retrieved:
         return "Reranker 결과: 재정렬할 문서가 없습니다. 먼저 rag_search_tool 또는 tavily_web_search_tool을 사용하세요."
 
-    if not settings.jina_api_key:
-        logger.error("[도구:apply_reranker_tool] Jina API Key가 설정되어 있지 않습니다.")
-        return "Jina API Key가 설정되지 않아 Reranker를 사용할 수 없습니다."
+    try:
+        docs = await rerank_documents(query, retrieved)
+    except RuntimeError as e:
+        logger.error("[도구:apply_reranker_tool] %s", e)
+        return str(e)
 
-    compressor = JinaRerank(
-        jina_api_key=settings.jina_api_key,
-        model="jina-reranker-v2-base-multilingual",
-        top_n=5,
-    )
+    logger.info("[도구:apply_reranker_tool] Rerank 완료: %d → %d", len(retrieved), len(docs))
 
-    docs = compressor.compress_documents(
-        documents=_last_docs,
-        query=query,
-    )
-
-    logger.info("[도구:apply_reranker_tool] Rerank 완료: %d → %d", len(_last_docs), len(docs))
-
-    blocks: List[str] = []
-    for idx, doc in enumerate(docs, start=1):
-        meta = doc.metadata or {}
-        source = (meta.get("source") or "RAG").upper()
-        title = meta.get("title") or ""
-
-        header = f"[RERANKED {idx}] {source}"
-        if title:
-            header += f": {title}"
-
-        block_lines = [header]
-
-        if source == "TAVILY" and meta.get("url"):
-            block_lines.append(f"URL: {meta.get('url')}")
-
-        block_lines.append(doc.page_content)
-        blocks.append("\n".join(block_lines))
-
-    return "\n\n---\n\n".join(blocks)
+    return format_evidence(docs)
 
 
 TOOLS = [
@@ -4,11 +4,14 @@
 # 수정내역
 # - 2025-11-17: 초기 작성
 # - 2025-11-18: 임베딩 모델 추가
+# - 2026-10-18: 임베딩 캐시 래퍼 적용
+# - 2026-10-18: 임베딩 캐시 최대 행 수/보관 기간 전달
 
 from typing import Literal
 
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from app.core.config import settings
+from app.llm.embedding_cache import CachedEmbeddings
 from functools import lru_cache
 # lru_cache: 함수의 리턴 값을 캐싱해두는 데코레이터
 
@@ -41,8 +44,20 @@ def get_fast_chat_model():
 def get_embeddings():
     """
     공통 Embeddings 인스턴스.
+    embedding_cache_enabled 이면 같은 텍스트의 임베딩을 다시 요청하지 않도록 캐시 래퍼로 감싼다.
     """
-    return OpenAIEmbeddings(
+    embeddings = OpenAIEmbeddings(
         model=settings.openai_embedding_model,
         api_key=settings.openai_api_key,
-    )
\ No newline at end of file
+    )
+    if not settings.embedding_cache_enabled:
+        return embeddings
+
+    return CachedEmbeddings(
+        embeddings,
+        model=settings.openai_embedding_model,
+        max_entries=settings.embedding_cache_size,
+        sqlite_path=settings.embedding_cache_path or None,
+        max_rows=settings.embedding_cache_max_rows,
+        ttl_seconds=settings.embedding_cache_ttl_seconds,
+    )
@@ -0,0 +1,243 @@
+# 임베딩 캐시 (메모리 LRU + 로컬 SQLite)
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성
+# - 2026-10-18: SQLite 캐시 크기 제한 (최대 행 수 / 보관 기간, 저장 시 주기적 정리)
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_embedding_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC, 공백 정리)."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    임베딩 결과를 캐시하는 Embeddings 래퍼.
+
+    - 키: sha256(모델명 + 정규화된 텍스트)
+    - 1차: 프로세스 메모리 LRU (max_entries 개)
+    - 2차: 로컬 SQLite 파일 (sqlite_path 가 비어 있으면 사용 안 함), 재시작/워커 간 공유
+    - 캐시에 없는 텍스트만 모아서 원래 임베딩 모델을 한 번 호출한다.
+    - SQLite 는 max_rows 개 / ttl_seconds 이내만 보관한다. (열 때와 prune_every 건 저장마다 정리, 오래된 것부터 삭제)
+    - stats() 로 메모리/디스크 적중, 미스 횟수를 확인할 수 있다.
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        *,
+        model: str,
+        max_entries: int = 4096,
+        sqlite_path: Optional[str] = None,
+        max_rows: int = 0,
+        ttl_seconds: int = 0,
+        prune_every: int = 1000,
+    ) -> None:
+        self.underlying = underlying
+        self.model = model
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.ttl_seconds = ttl_seconds
+        self.prune_every = max(1, prune_every)
+        self._stored_since_prune = 0
+
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "pruned": 0}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if sqlite_path:
+            path = Path(sqlite_path)
+            if not path.is_absolute():
+                path = BASE_DIR / path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    model     TEXT NOT NULL,
+                    dim       INTEGER NOT NULL,
+                    vector    BLOB NOT NULL,
+                    create_dt TEXT NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_embedding_cache_create_dt ON embedding_cache (create_dt)"
+            )
+            self._conn.commit()
+            self.prune()
+
+    # ------------------------------------------------------------------
+    # 캐시 조회/저장
+    # ------------------------------------------------------------------
+    def _key(self, text: str) -> str:
+        raw = f"{self.model}\x00{normalize_embedding_text(text)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+                    self._counters["memory_hits"] += 1
+
+            missing = [key for key in dict.fromkeys(keys) if key not in found]
+            if missing and self._conn is not None:
+                placeholders = ",".join("?" for _ in missing)
+                rows = self._conn.execute(
+                    f"SELECT cache_key, vector FROM embedding_cache WHERE cache_key IN ({placeholders})",
+                    missing,
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("f", blob).tolist()
+                    found[key] = vector
+                    self._remember(key, vector)
+                    self._counters["disk_hits"] += 1
+
+            self._counters["misses"] += len([key for key in dict.fromkeys(keys) if key not in found])
+        return found
+
+    def _store(self, items: Dict[str, List[float]]) -> None:
+        if not items:
+            return
+        with self._lock:
+            for key, vector in items.items():
+                self._remember(key, vector)
+
+            if self._conn is not None:
+                now = datetime.now().isoformat(timespec="seconds")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embedding_cache (cache_key, model, dim, vector, create_dt) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (key, self.model, len(vector), array("f", vector).tobytes(), now)
+                        for key, vector in items.items()
+                    ],
+                )
+                self._conn.commit()
+                self._stored_since_prune += len(items)
+
+        if self._stored_since_prune >= self.prune_every:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        SQLite 캐시에서 보관 기간이 지난 행과 max_rows 를 넘는 오래된 행을 삭제한다.
+        삭제한 행 수를 반환. (0 인 설정은 해당 제한을 쓰지 않음)
+        """
+        if self._conn is None or (self.max_rows <= 0 and self.ttl_seconds <= 0):
+            return 0
+
+        deleted = 0
+        with self._lock:
+            self._stored_since_prune = 0
+            if self.ttl_seconds > 0:
+                cutoff = (datetime.now() - timedelta(seconds=self.ttl_seconds)).isoformat(timespec="seconds")
+                deleted += self._conn.execute(
+                    "DELETE FROM embedding_cache WHERE create_dt < ?", (cutoff,)
+                ).rowcount
+            if self.max_rows > 0:
+                (count,) = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()
+                if count > self.max_rows:
+                    deleted += self._conn.execute(
+                        "DELETE FROM embedding_cache WHERE cache_key IN ("
+                        "SELECT cache_key FROM embedding_cache ORDER BY create_dt LIMIT ?)",
+                        (count - self.max_rows,),
+                    ).rowcount
+            self._conn.commit()
+            self._counters["pruned"] += deleted
+
+        if deleted:
+            logger.info("[embedding_cache] 오래된 캐시 %d건 삭제", deleted)
+        return deleted
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                **self._counters,
+                "memory_entries": len(self._memory),
+            }
+
+    # ------------------------------------------------------------------
+    # Embeddings 인터페이스
+    # ------------------------------------------------------------------
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in texts]
+        found = self._lookup(keys)
+
+        todo = {key: text for key, text in zip(keys, texts) if key not in found}
+        if todo:
+            vectors = self.underlying.embed_documents(list(todo.values()))
+            computed = dict(zip(todo.keys(), vectors))
+            self._store(computed)
+            found.update(computed)
+
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        found = self._lookup([key])
+        if key in found:
+            return found[key]
+
+        vector = self.underlying.embed_query(text)
+        self._store({key: vector})
+        return vector
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in texts]
+        found = await run_in_threadpool(self._lookup, keys)
+
+        todo = {key: text for key, text in zip(keys, texts) if key not in found}
+        if todo:
+            vectors = await self.underlying.aembed_documents(list(todo.values()))
+            computed = dict(zip(todo.keys(), vectors))
+            await run_in_threadpool(self._store, computed)
+            found.update(computed)
+
+        return [found[key] for key in keys]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        found = await run_in_threadpool(self._lookup, [key])
+        if key in found:
+            return found[key]
+
+        vector = await self.underlying.aembed_query(text)
+        await run_in_threadpool(self._store, {key: vector})
+        return vector
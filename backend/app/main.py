@@ -5,7 +5,13 @@
 # - 2025-10-28: 초기 작성
 # - 2025-11-18: 세션 발급 테스트 추가
 # - 2025-11-19: 트렌드 에이전트 테스트 엔드포인트 추가
+# - 2026-10-18: 체크포인터 TTL 정리 백그라운드 작업 추가
+# - 2026-10-18: 시작 시 벡터스토어 워밍업
+# - 2026-10-18: 시작 시 BM25 인덱스 워밍업
+# - 2026-10-18: 트렌드 카테고리 리포트 주기 갱신 백그라운드 작업 추가
+# - 2026-10-18: CORS 노출 헤더 추가 (X-Next-Cursor, ETag)
 
+import asyncio
 import os
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
@@ -22,8 +28,13 @@ from app.api.logo import router as logo_router
 from app.api.shorts import router as shorts_router
 
 from app.db.session import oracle_db
+from app.db.checkpointer import run_checkpoint_maintenance
+from app.services.vector_service import warm_up_vectorstores
+from app.services.retrieval_service import warm_up_keyword_index
+from app.services.trend_report_service import run_trend_report_refresh
 
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 
 # 앱 라이프사이클 관리 
 # 앱 시작 시 Oracle DB 풀 초기화
@@ -44,7 +55,27 @@ async def lifespan(app: FastAPI):
         print("Oracle pool initialized on startup.")
     except Exception as e:
         print(f"[WARN] Oracle pool init failed: {e}")
+
+    # 트렌드 RAG 벡터스토어를 미리 열어 첫 질의 지연 제거
+    if settings.vector_store_warmup:
+        await run_in_threadpool(warm_up_vectorstores)
+        if settings.hybrid_search_enabled:
+            await run_in_threadpool(warm_up_keyword_index)
+
+    # 체크포인터: TTL 이 지난 대화 스레드 주기적 정리
+    maintenance_task = asyncio.create_task(
+        run_checkpoint_maintenance(settings.checkpointer_maintenance_interval_seconds)
+    )
+    # 트렌드 카테고리 리포트: 갱신 주기가 지난 사전 계산 리포트 다시 생성
+    report_task = None
+    if settings.trend_report_refresh_enabled:
+        report_task = asyncio.create_task(
+            run_trend_report_refresh(settings.trend_report_refresh_interval_seconds)
+        )
     yield # yield 앞은 startup, 뒤는 shutdown 시점
+    maintenance_task.cancel()
+    if report_task is not None:
+        report_task.cancel()
     # 종료 시 DB 풀 종료
     try:
         oracle_db.close_pool()
@@ -66,6 +97,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "ETag"],
     )
 
     app.include_router(health_router)
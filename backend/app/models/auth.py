@@ -3,6 +3,7 @@
 # 작성일: 2025-11-17
 # 수정내역
 # - 2025-11-17: 초기 작성
+# - 2026-10-18: 관계 기본 로딩을 RELATIONSHIP_LAZY (개발: raise / 운영: select) 로 변경, 필요한 곳에서 loader 옵션으로 지정
 
 from __future__ import annotations
 
@@ -17,7 +18,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.orm import Base
+from app.db.orm import Base, RELATIONSHIP_LAZY
 
 from typing import TYPE_CHECKING
 
@@ -50,14 +51,14 @@ class Role(Base):
     # user_info와 1:N
     users: Mapped[list["UserInfo"]] = relationship(
         back_populates="role",
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
 
     # role_menu와 1:N (권한별 메뉴 매핑)
     role_menus: Mapped[list["RoleMenu"]] = relationship(
         back_populates="role",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
 
 
@@ -120,13 +121,13 @@ class UserInfo(Base):
     # 권한 관계 (N:1)
     role: Mapped["Role"] = relationship(
         back_populates="users",
-        lazy="joined",
+        lazy=RELATIONSHIP_LAZY,
     )
 
     # 이 유저가 생성한 프로젝트 그룹들 (1:N)
     project_groups: Mapped[list["ProdGroup"]] = relationship(
         back_populates="creator",
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
 
 class Menu(Base):
@@ -171,7 +172,7 @@ class Menu(Base):
     role_menus: Mapped[list["RoleMenu"]] = relationship(
         back_populates="menu",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
 
 
@@ -198,9 +199,9 @@ class RoleMenu(Base):
     # 각각 role_mst, menu 쪽과 N:1
     role: Mapped[Role] = relationship(
         back_populates="role_menus",
-        lazy="joined",
+        lazy=RELATIONSHIP_LAZY,
     )
     menu: Mapped[Menu] = relationship(
         back_populates="role_menus",
-        lazy="joined",
+        lazy=RELATIONSHIP_LAZY,
     )
\ No newline at end of file
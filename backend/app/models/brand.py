@@ -2,7 +2,7 @@ from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
-from app.db.orm import Base
+from app.db.orm import Base, RELATIONSHIP_LAZY
 
 class BrandInfo(Base):
     """
@@ -42,4 +42,5 @@ class BrandInfo(Base):
         "ProdGroup",
         back_populates="brand_info",
         uselist=False,
+        lazy=RELATIONSHIP_LAZY,
     )
\ No newline at end of file
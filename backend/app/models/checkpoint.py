@@ -0,0 +1,159 @@
+# LangGraph 체크포인트 저장 모델
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 (graph_thread / graph_checkpoint / graph_checkpoint_write)
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import (
+    String,
+    Integer,
+    DateTime,
+    LargeBinary,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.orm import Base
+
+
+class GraphThread(Base):
+    """
+    그래프 대화 스레드 테이블 (graph_thread)
+
+    - thread_id : LangGraph thread_id (예: user-1-project-brand-<uuid>)
+    - create_dt : 첫 체크포인트 저장 시각
+    - update_dt : 마지막 체크포인트 저장 시각 (TTL 정리 기준)
+    """
+    __tablename__ = "graph_thread"
+
+    thread_id: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="스레드ID",
+    )
+    create_dt: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        comment="생성일",
+    )
+    update_dt: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        index=True,
+        comment="수정일",
+    )
+
+
+class GraphCheckpoint(Base):
+    """
+    그래프 체크포인트 테이블 (graph_checkpoint)
+
+    - (thread_id, checkpoint_ns, checkpoint_id) 가 PK
+    - ckpt_data / meta_data 는 LangGraph serde 로 직렬화한 바이트
+      (None 은 빈 바이트로 직렬화되는데 Oracle 은 빈 BLOB 을 NULL 로 저장하므로 nullable)
+    """
+    __tablename__ = "graph_checkpoint"
+
+    thread_id: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="스레드ID",
+    )
+    checkpoint_ns: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="체크포인트 네임스페이스",
+    )
+    checkpoint_id: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="체크포인트ID",
+    )
+    parent_checkpoint_id: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="부모 체크포인트ID",
+    )
+    ckpt_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="체크포인트 직렬화 타입",
+    )
+    ckpt_data: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        comment="체크포인트 데이터",
+    )
+    meta_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="메타데이터 직렬화 타입",
+    )
+    meta_data: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        comment="메타데이터",
+    )
+    create_dt: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        comment="생성일",
+    )
+
+
+class GraphCheckpointWrite(Base):
+    """
+    그래프 체크포인트 중간 쓰기 테이블 (graph_checkpoint_write)
+
+    - 노드 실행 중 저장된 pending write
+    - (thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx) 가 PK
+    """
+    __tablename__ = "graph_checkpoint_write"
+
+    thread_id: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="스레드ID",
+    )
+    checkpoint_ns: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="체크포인트 네임스페이스",
+    )
+    checkpoint_id: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="체크포인트ID",
+    )
+    task_id: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="태스크ID",
+    )
+    write_idx: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        comment="쓰기 순번",
+    )
+    channel: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="채널명",
+    )
+    value_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="값 직렬화 타입",
+    )
+    value_data: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        comment="값 데이터",
+    )
+    task_path: Mapped[str | None] = mapped_column(
+        String(1000),
+        nullable=True,
+        comment="태스크 경로",
+    )
@@ -2,18 +2,24 @@
 # 작성일: 2025-11-18
 # 수정내역
 # - 2025-11-18: 초기 작성
+# - 2026-10-18: 관계 기본 로딩을 RELATIONSHIP_LAZY (개발: raise / 운영: select) 로 변경, 필요한 곳에서 loader 옵션으로 지정
+# - 2026-10-18: 생성 결과물 테이블(GenerationProd) 모델 추가
 
 from __future__ import annotations
 
+from datetime import datetime
+
 from sqlalchemy import (
     String,
     Integer,
+    DateTime,
     ForeignKey,
+    func,
     text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.orm import Base
+from app.db.orm import Base, RELATIONSHIP_LAZY
 from app.models.auth import UserInfo
 
 
@@ -62,11 +68,106 @@ class ProdGroup(Base):
     # 여기서 UserInfo 쪽 project_groups 와 연결
     creator: Mapped["UserInfo"] = relationship(
         back_populates="project_groups",
-        lazy="joined",
+        lazy=RELATIONSHIP_LAZY,
     )
 
     brand_info = relationship(
         "BrandInfo",
         back_populates="group",
         uselist=False,
-    )
\ No newline at end of file
+        lazy=RELATIONSHIP_LAZY,
+    )
+
+
+# prod_type.type_id
+LOGO_TYPE_ID = 1       # 로고
+SHORTFORM_TYPE_ID = 2  # 숏폼
+
+
+class GenerationProd(Base):
+    """
+    생성 결과물 테이블 (generation_prod)
+
+    - prod_id     : 결과물 번호 (PK, 시퀀스+트리거)
+    - type_id     : 결과물 타입 (prod_type.type_id, 1: 로고 / 2: 숏폼)
+    - grp_id      : 프로젝트 그룹 ID (prod_grp.grp_id)
+    - file_path   : 파일 경로
+    - del_yn      : 삭제 여부 (기본 'N')
+    """
+    __tablename__ = "generation_prod"
+
+    prod_id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        comment="결과물 번호",
+    )
+    type_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="타입번호",
+    )
+    grp_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("prod_grp.grp_id"),
+        nullable=False,
+        comment="그룹번호",
+    )
+    file_path: Mapped[str] = mapped_column(
+        String(1000),
+        nullable=False,
+        comment="파일경로",
+    )
+    view_cnt: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("0"),
+        comment="조회수",
+    )
+    ref_cnt: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("0"),
+        comment="참조수",
+    )
+    like_cnt: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("0"),
+        comment="좋아요수",
+    )
+    pub_yn: Mapped[str] = mapped_column(
+        String(1),
+        nullable=False,
+        server_default=text("'Y'"),
+        comment="공개여부",
+    )
+    create_user: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("user_info.id"),
+        nullable=False,
+        comment="생성자",
+    )
+    create_dt: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.sysdate(),
+        nullable=False,
+        comment="생성일",
+    )
+    update_user: Mapped[int | None] = mapped_column(
+        Integer,
+        ForeignKey("user_info.id"),
+        nullable=True,
+        comment="수정자",
+    )
+    update_dt: Mapped[datetime | None] = mapped_column(
+        DateTime,
+        server_default=func.sysdate(),
+        nullable=True,
+        comment="수정일",
+    )
+    del_yn: Mapped[str] = mapped_column(
+        String(1),
+        nullable=False,
+        server_default=text("'N'"),
+        comment="삭제여부",
+    )
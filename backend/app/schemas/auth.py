@@ -3,6 +3,7 @@
 # 작성일: 2025-11-17
 # 수정내역
 # - 2025-11-17: 초기 작성
+# - 2026-10-18: 인증 유저 스냅샷(CurrentUser) 추가
 
 from pydantic import BaseModel, Field
 
@@ -18,6 +19,23 @@ class UserBase(BaseModel):
     class Config:
         from_attributes = True  # ORM 객체에서 바로 변환 가능
 
+# 인증된 요청의 유저 스냅샷 (get_current_user / get_optional_user 반환값)
+class CurrentUser(BaseModel):
+    """
+    요청 처리 중 사용하는 읽기 전용 유저 정보.
+    - ORM 세션과 무관하므로 principal 캐시에 그대로 보관/공유한다.
+    - 권한/프로젝트 등 관계 데이터가 필요하면 서비스에서 id 로 따로 조회한다.
+    """
+    id: int
+    login_id: str
+    nickname: str
+    status: str = "Y"
+    role_id: int
+
+    class Config:
+        from_attributes = True
+        frozen = True
+
 # 회원가입 요청용
 class UserCreate(BaseModel):
     """
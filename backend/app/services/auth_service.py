@@ -5,7 +5,9 @@ from sqlalchemy.orm import Session
 
 from app.models.auth import UserInfo
 from app.schemas.auth import UserCreate
+from app.core.principal_cache import invalidate_user
 from app.core.security import get_password_hash, verify_password
+from app.services.loaders import with_relations
 
 def get_user_by_login_id(db: Session, login_id: str) -> Optional[UserInfo]:
     """
@@ -13,6 +15,7 @@ def get_user_by_login_id(db: Session, login_id: str) -> Optional[UserInfo]:
     """
     return (
         db.query(UserInfo)
+        .options(*with_relations())
         .filter(UserInfo.login_id == login_id)
         .first()
     )
@@ -47,6 +50,9 @@ def create_user(db: Session, user_in: UserCreate) -> UserInfo:
     db.commit()
     db.refresh(user)
 
+    # 같은 id 로 캐시된 유저 스냅샷이 남아 있지 않도록 정리
+    invalidate_user(user.id)
+
     return user
 
 def authenticate_user(db: Session, login_id: str, password: str) -> Optional[UserInfo]:
@@ -2,6 +2,7 @@
 # 작성일: 2025-11-23
 # 수정내역
 # - 2025-11-23: 브랜드 프로젝트 저장 래퍼 추가
+# - 2026-10-18: current_user 타입을 CurrentUser 스냅샷으로 변경 (principal 캐시)
 
 from __future__ import annotations
 
@@ -10,7 +11,7 @@ from typing import Dict, Any, Optional
 from sqlalchemy.orm import Session
 
 from app.models.project import ProdGroup
-from app.models.auth import UserInfo
+from app.schemas.auth import CurrentUser
 from app.agents.state import AppState, BrandProfile
 from app.services.project_service import persist_brand_project
 
@@ -18,7 +19,7 @@ from app.services.project_service import persist_brand_project
 def persist_brand_from_graph_state(
     db: Session,
     *,
-    current_user: UserInfo,
+    current_user: CurrentUser,
     state: AppState,
 ) -> Optional[ProdGroup]:
     """
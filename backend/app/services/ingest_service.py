@@ -0,0 +1,446 @@
+# 트렌드 RAG 문서 적재 서비스
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 (markdown/PDF/HTML 적재, 청크 해시 기반 증분 upsert)
+# - 2026-10-18: markdown front matter(category/platform/date) 를 metadata 로 저장, 적재 후 BM25 인덱스 무효화
+# - 2026-10-18: 적재 후 컬렉션 버전 마커 갱신 (다른 프로세스의 BM25 인덱스도 재생성)
+# - 2026-10-18: 예전 청크 삭제를 새 청크 upsert 성공 이후로 이동, 원본 파일이 사라진 문서 청크 정리
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from langchain_text_splitters import Language, RecursiveCharacterTextSplitter
+
+from app.core.config import settings
+from app.llm.client import get_embeddings
+from app.services.retrieval_service import date_to_int, mark_collection_changed
+from app.services.vector_service import get_vectorstore
+
+logger = logging.getLogger(__name__)
+
+MARKDOWN_SUFFIXES = {".md", ".markdown", ".txt"}
+HTML_SUFFIXES = {".html", ".htm"}
+PDF_SUFFIXES = {".pdf"}
+SUPPORTED_SUFFIXES = MARKDOWN_SUFFIXES | HTML_SUFFIXES | PDF_SUFFIXES
+
+# 적재 문서 공통 metadata["source"] (트렌드 도구에서 웹 결과 "TAVILY" 와 구분)
+RAG_SOURCE = "RAG"
+
+_MD_TITLE_RE = re.compile(r"^\s*#\s+(.+)$", re.MULTILINE)
+_FRONT_MATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+# front matter 에서 metadata 로 옮기는 키 (검색 필터용)
+FRONT_MATTER_KEYS = ("category", "platform", "date", "title")
+
+
+@dataclass
+class IngestStats:
+    """적재 결과 집계."""
+    files: int = 0
+    files_failed: int = 0
+    chunks: int = 0
+    added: int = 0
+    skipped: int = 0
+    deleted: int = 0
+    failed_files: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "files": self.files,
+            "files_failed": self.files_failed,
+            "chunks": self.chunks,
+            "added": self.added,
+            "skipped": self.skipped,
+            "deleted": self.deleted,
+            "failed_files": list(self.failed_files),
+        }
+
+
+# ----------------------------------------------------------------------
+# 파일 읽기
+# ----------------------------------------------------------------------
+class _HTMLTextExtractor(HTMLParser):
+    """script/style 을 제외한 본문 텍스트와 <title> 추출."""
+
+    _SKIP_TAGS = {"script", "style", "noscript", "head"}
+    _BLOCK_TAGS = {"p", "div", "br", "li", "tr", "section", "article", "h1", "h2", "h3", "h4", "h5", "h6"}
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.parts: List[str] = []
+        self.title = ""
+        self._skip_depth = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "title":
+            self._in_title = True
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+        if tag in self._BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        if tag in self._BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif not self._skip_depth:
+            self.parts.append(data)
+
+    def text(self) -> str:
+        lines = (line.strip() for line in "".join(self.parts).splitlines())
+        return "\n".join(line for line in lines if line)
+
+
+def _parse_front_matter(text: str) -> Tuple[Dict[str, Any], str]:
+    """
+    문서 맨 앞 "---" 블록의 "key: value" 를 읽는다. (YAML 전체가 아닌 한 줄 값만 지원)
+    반환값: (FRONT_MATTER_KEYS 에 해당하는 값, front matter 를 뺀 본문)
+    """
+    match = _FRONT_MATTER_RE.match(text)
+    if not match:
+        return {}, text
+
+    meta: Dict[str, Any] = {}
+    for line in match.group(1).splitlines():
+        key, sep, value = line.partition(":")
+        key = key.strip().lower()
+        value = value.strip().strip("\"'")
+        if sep and key in FRONT_MATTER_KEYS and value:
+            meta[key] = value
+
+    if "date" in meta and date_to_int(meta["date"]) is not None:
+        meta["date_int"] = date_to_int(meta["date"])
+    return meta, text[match.end():]
+
+
+def _read_markdown(path: Path) -> Tuple[str, List[Tuple[str, Dict[str, Any]]]]:
+    meta, text = _parse_front_matter(path.read_text(encoding="utf-8", errors="ignore"))
+    title = meta.pop("title", "")
+    if not title:
+        match = _MD_TITLE_RE.search(text)
+        title = match.group(1).strip() if match else path.stem
+    return title, [(text, meta)]
+
+
+def _read_html(path: Path) -> Tuple[str, List[Tuple[str, Dict[str, Any]]]]:
+    parser = _HTMLTextExtractor()
+    parser.feed(path.read_text(encoding="utf-8", errors="ignore"))
+    parser.close()
+    return parser.title.strip() or path.stem, [(parser.text(), {})]
+
+
+def _read_pdf(path: Path) -> Tuple[str, List[Tuple[str, Dict[str, Any]]]]:
+    try:
+        from pypdf import PdfReader
+    except ImportError as e:
+        raise RuntimeError("PDF 적재에는 pypdf 패키지가 필요합니다. (pip install pypdf)") from e
+
+    reader = PdfReader(str(path))
+    title = ""
+    if reader.metadata and reader.metadata.title:
+        title = str(reader.metadata.title).strip()
+
+    pages: List[Tuple[str, Dict[str, Any]]] = []
+    for page_no, page in enumerate(reader.pages, start=1):
+        pages.append((page.extract_text() or "", {"page": page_no}))
+    return title or path.stem, pages
+
+
+def load_source_file(path: Path) -> Tuple[str, List[Tuple[str, Dict[str, Any]]]]:
+    """
+    파일 하나를 읽어 (제목, [(본문, 추가 metadata), ...]) 로 돌려준다.
+    - PDF 는 페이지 단위, 나머지는 파일 전체가 하나의 본문
+    """
+    suffix = path.suffix.lower()
+    if suffix in PDF_SUFFIXES:
+        return _read_pdf(path)
+    if suffix in HTML_SUFFIXES:
+        return _read_html(path)
+    return _read_markdown(path)
+
+
+def iter_source_files(root: Path) -> Iterator[Path]:
+    """root 아래의 지원 확장자 파일을 경로 순서대로 하나씩 돌려준다."""
+    if root.is_file():
+        if root.suffix.lower() in SUPPORTED_SUFFIXES:
+            yield root
+        return
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and path.suffix.lower() in SUPPORTED_SUFFIXES:
+            yield path
+
+
+# ----------------------------------------------------------------------
+# 청크 / 해시
+# ----------------------------------------------------------------------
+def _make_splitter(path: Path, chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    if path.suffix.lower() in {".md", ".markdown"}:
+        return RecursiveCharacterTextSplitter.from_language(
+            Language.MARKDOWN,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+        )
+    return RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+
+def chunk_id(doc_path: str, content: str, doc_meta: Optional[Dict[str, Any]] = None) -> str:
+    """
+    청크 ID = sha256(상대 경로 + 문서 metadata + 청크 본문).
+    본문과 제목/front matter 가 같으면 재실행 시 같은 ID.
+    """
+    meta_part = json.dumps(doc_meta or {}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(f"{doc_path}\x00{meta_part}\x00{content}".encode("utf-8")).hexdigest()
+
+
+def build_chunks(
+    path: Path,
+    doc_path: str,
+    *,
+    chunk_size: int,
+    chunk_overlap: int,
+) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """파일 하나를 (청크ID, 본문, metadata) 리스트로 만든다. 같은 파일 안의 중복 청크는 한 번만."""
+    title, sections = load_source_file(path)
+    splitter = _make_splitter(path, chunk_size, chunk_overlap)
+
+    chunks: List[Tuple[str, str, Dict[str, Any]]] = []
+    seen: set[str] = set()
+    for text, extra in sections:
+        for content in splitter.split_text(text):
+            content = content.strip()
+            if not content:
+                continue
+            cid = chunk_id(doc_path, content, {"title": title, **extra})
+            if cid in seen:
+                continue
+            seen.add(cid)
+            chunks.append(
+                (
+                    cid,
+                    content,
+                    {
+                        "source": RAG_SOURCE,
+                        "title": title,
+                        "path": doc_path,
+                        "chunk_index": len(chunks),
+                        **extra,
+                    },
+                )
+            )
+    return chunks
+
+
+# ----------------------------------------------------------------------
+# 임베딩 + upsert
+# ----------------------------------------------------------------------
+async def _embed_with_retry(
+    texts: List[str],
+    semaphore: asyncio.Semaphore,
+    max_retries: int,
+) -> List[List[float]]:
+    embeddings = get_embeddings()
+    attempt = 0
+    while True:
+        async with semaphore:
+            try:
+                return await embeddings.aembed_documents(texts)
+            except Exception as e:
+                attempt += 1
+                if attempt > max_retries:
+                    raise
+                delay = min(2 ** attempt, 30)
+                logger.warning("[ingest] 임베딩 실패 (%d/%d), %ds 후 재시도: %s", attempt, max_retries, delay, e)
+        await asyncio.sleep(delay)
+
+
+async def _flush(
+    collection,
+    pending: List[Tuple[str, str, Dict[str, Any]]],
+    *,
+    batch_size: int,
+    semaphore: asyncio.Semaphore,
+    max_retries: int,
+) -> int:
+    """대기 중인 청크를 batch_size 단위로 동시에 임베딩하고 컬렉션에 upsert."""
+    if not pending:
+        return 0
+
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    vectors = await asyncio.gather(
+        *(_embed_with_retry([content for _, content, _ in batch], semaphore, max_retries) for batch in batches)
+    )
+
+    for batch, batch_vectors in zip(batches, vectors):
+        await asyncio.to_thread(
+            collection.upsert,
+            ids=[cid for cid, _, _ in batch],
+            documents=[content for _, content, _ in batch],
+            metadatas=[meta for _, _, meta in batch],
+            embeddings=batch_vectors,
+        )
+    return len(pending)
+
+
+_ORPHAN_PAGE_SIZE = 1000
+
+
+async def _find_orphan_ids(collection, base: Path, seen_paths: set) -> List[str]:
+    """적재 문서(source=RAG) 중 base 아래 원본 파일이 더 이상 없는 청크ID."""
+    orphan_ids: List[str] = []
+    offset = 0
+    while True:
+        page = await asyncio.to_thread(
+            collection.get,
+            where={"source": RAG_SOURCE},
+            include=["metadatas"],
+            limit=_ORPHAN_PAGE_SIZE,
+            offset=offset,
+        )
+        ids = page.get("ids") or []
+        if not ids:
+            break
+        for cid, meta in zip(ids, page.get("metadatas") or []):
+            doc_path = (meta or {}).get("path")
+            if doc_path and doc_path not in seen_paths and not (base / doc_path).exists():
+                orphan_ids.append(cid)
+        offset += len(ids)
+    return orphan_ids
+
+
+async def ingest_directory(
+    source_dir: str | Path,
+    *,
+    persist_directory: Optional[str] = None,
+    collection_name: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+    chunk_overlap: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    prune: bool = True,
+    dry_run: bool = False,
+) -> IngestStats:
+    """
+    source_dir 아래 markdown/PDF/HTML 문서를 트렌드 RAG 컬렉션에 증분 적재한다.
+
+    - 파일을 하나씩 읽어 청크로 나누고, 청크ID(경로+본문 해시)가 이미 컬렉션에 있으면 건너뛴다.
+    - 새 청크는 batch_size 개씩 최대 concurrency 개 배치를 동시에 임베딩 (실패 시 지수 백오프 재시도)
+    - prune=True 면 같은 파일에서 더 이상 나오지 않는 예전 청크를 삭제한다.
+      (그 파일의 새 청크 upsert 가 성공한 뒤에 삭제하므로 임베딩 실패 시 예전 청크가 남는다)
+    - prune=True 이고 source_dir 가 폴더면, 원본 파일이 폴더에서 사라진 문서의 청크도 삭제한다.
+      (컬렉션이 source_dir 한 곳의 문서를 담는다고 가정)
+    - dry_run=True 면 임베딩/쓰기 없이 집계만 한다.
+    """
+    root = Path(source_dir).resolve()
+    if not root.exists():
+        raise FileNotFoundError(f"적재할 경로가 없습니다: {root}")
+
+    chunk_size = chunk_size or settings.ingest_chunk_size
+    chunk_overlap = settings.ingest_chunk_overlap if chunk_overlap is None else chunk_overlap
+    batch_size = batch_size or settings.ingest_batch_size
+    concurrency = concurrency or settings.ingest_concurrency
+    max_retries = settings.ingest_max_retries if max_retries is None else max_retries
+
+    collection = get_vectorstore(persist_directory, collection_name)._collection
+    semaphore = asyncio.Semaphore(concurrency)
+    base = root if root.is_dir() else root.parent
+
+    stats = IngestStats()
+    pending: List[Tuple[str, str, Dict[str, Any]]] = []
+    # pending 의 새 청크가 upsert 된 뒤에 지울 예전 청크ID
+    pending_stale: List[str] = []
+    seen_paths = set()
+    flush_at = batch_size * concurrency
+
+    async def flush() -> None:
+        nonlocal pending, pending_stale
+        stats.added += await _flush(
+            collection, pending, batch_size=batch_size, semaphore=semaphore, max_retries=max_retries
+        )
+        if pending_stale:
+            await asyncio.to_thread(collection.delete, ids=pending_stale)
+            stats.deleted += len(pending_stale)
+        pending, pending_stale = [], []
+
+    try:
+        for path in iter_source_files(root):
+            doc_path = path.relative_to(base).as_posix()
+            seen_paths.add(doc_path)
+            try:
+                chunks = await asyncio.to_thread(
+                    build_chunks,
+                    path,
+                    doc_path,
+                    chunk_size=chunk_size,
+                    chunk_overlap=chunk_overlap,
+                )
+                existing = await asyncio.to_thread(collection.get, where={"path": doc_path}, include=[])
+            except Exception as e:
+                logger.error("[ingest] 파일 처리 실패: %s (%s)", doc_path, e)
+                stats.files_failed += 1
+                stats.failed_files.append(doc_path)
+                continue
+
+            stats.files += 1
+            stats.chunks += len(chunks)
+
+            existing_ids = set(existing.get("ids") or [])
+            new_chunks = [chunk for chunk in chunks if chunk[0] not in existing_ids]
+            stats.skipped += len(chunks) - len(new_chunks)
+
+            stale_ids = existing_ids - {cid for cid, _, _ in chunks}
+
+            logger.info(
+                "[ingest] %s: 청크 %d (신규 %d, 유지 %d, 삭제 %d)",
+                doc_path,
+                len(chunks),
+                len(new_chunks),
+                len(chunks) - len(new_chunks),
+                len(stale_ids) if prune else 0,
+            )
+
+            if dry_run:
+                stats.added += len(new_chunks)
+                stats.deleted += len(stale_ids) if prune else 0
+                continue
+
+            pending.extend(new_chunks)
+            if prune:
+                pending_stale.extend(sorted(stale_ids))
+            if len(pending) >= flush_at:
+                await flush()
+
+        if not dry_run:
+            await flush()
+
+        if prune and root.is_dir():
+            orphan_ids = await _find_orphan_ids(collection, base, seen_paths)
+            if orphan_ids:
+                logger.info("[ingest] 원본 파일이 없는 청크 삭제: %d", len(orphan_ids))
+                if not dry_run:
+                    await asyncio.to_thread(collection.delete, ids=orphan_ids)
+                stats.deleted += len(orphan_ids)
+    finally:
+        # 중간에 실패해도 이미 반영된 추가/삭제는 다른 프로세스 BM25 인덱스에 알린다
+        if not dry_run and (stats.added or stats.deleted):
+            mark_collection_changed(persist_directory, collection_name)
+
+    logger.info("[ingest] 완료: %s", stats.as_dict())
+    return stats
@@ -0,0 +1,33 @@
+# ORM 관계 로딩 옵션 (쿼리 모양 지정)
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 (서비스 함수별로 필요한 관계만 loader 옵션으로 지정)
+
+from __future__ import annotations
+
+from typing import List
+
+from sqlalchemy.orm import joinedload, lazyload, raiseload, selectinload
+from sqlalchemy.orm.attributes import QueryableAttribute
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.db.orm import ORM_LAZY_RAISE
+
+
+def with_relations(*relations: QueryableAttribute) -> List[LoaderOption]:
+    """
+    이 쿼리가 실제로 쓰는 관계만 함께 로딩하는 loader 옵션 목록.
+
+    - N:1 / 1:1 관계는 joinedload, 1:N 관계는 selectinload
+    - 나머지 관계는 로딩하지 않는다. (개발 환경은 접근 시 예외, 운영은 lazy select)
+
+    예)
+        db.query(ProdGroup).options(*with_relations(ProdGroup.brand_info))
+        db.query(Menu).options(*with_relations())   # 관계 없이 컬럼만
+    """
+    options: List[LoaderOption] = [
+        selectinload(rel) if rel.property.uselist else joinedload(rel)
+        for rel in relations
+    ]
+    options.append(raiseload("*") if ORM_LAZY_RAISE else lazyload("*"))
+    return options
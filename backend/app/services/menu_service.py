@@ -3,9 +3,23 @@
 # 작성일: 2025-11-17
 # 수정내역
 # - 2025-11-17: 초기 작성
+# - 2026-10-18: 메뉴 컬럼만 로딩 (관계 로딩 제외)
+# - 2026-10-18: 권한별 메뉴 응답 캐시 (직렬화 JSON + ETag, TTL / 명시적 무효화)
+# - 2026-10-18: 무효화 세대(generation) 번호로 조회 중 무효화된 결과 저장 방지, 커밋 후 한 번 더 무효화
 
-from sqlalchemy.orm import Session
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from app.core.config import settings
 from app.models.auth import Menu, RoleMenu
+from app.schemas.menu import MenuBase
+from app.services.loaders import with_relations
 
 def get_menus_by_role(db: Session, role_id: int) -> list[Menu]:
     """
@@ -13,9 +27,11 @@ def get_menus_by_role(db: Session, role_id: int) -> list[Menu]:
     - role_menu 조인
     - 삭제되지 않은 메뉴(del_yn = 'N')만 조회
     - menu_order로 정렬
+    - 메뉴 컬럼만 로딩 (role_menu -> role -> user 관계로 번지지 않도록)
     """
     return (
         db.query(Menu)
+        .options(*with_relations())
         .join(RoleMenu, RoleMenu.menu_id == Menu.menu_id)
         .filter(
             RoleMenu.role_id == role_id,
@@ -23,4 +39,82 @@ def get_menus_by_role(db: Session, role_id: int) -> list[Menu]:
         )
         .order_by(Menu.menu_order.asc().nulls_last())
         .all()
-    )
\ No newline at end of file
+    )
+
+
+@dataclass(frozen=True)
+class CachedMenus:
+    """직렬화된 메뉴 목록(JSON bytes)과 ETag."""
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+_menu_cache: Dict[int, CachedMenus] = {}
+_menu_cache_lock = threading.Lock()
+# 무효화할 때마다 1 증가. 조회 시작 시점과 값이 다르면 조회 결과를 캐시에 넣지 않는다.
+_menu_cache_generation = 0
+
+
+def get_cached_menus(db: Session, role_id: int) -> CachedMenus:
+    """
+    권한별 메뉴 응답 캐시.
+    - TTL(settings.menu_cache_ttl_seconds) 이내면 DB 조회 없이 직렬화된 JSON 을 그대로 돌려준다.
+    - ETag 는 JSON 내용의 해시라서, 메뉴가 바뀌지 않았으면 재조회 후에도 같은 값이다.
+    - DB 조회 도중 무효화가 일어나면 (변경 전 데이터일 수 있으므로) 결과를 캐시에 넣지 않는다.
+    - 캐시/무효화는 프로세스(워커) 단위다. 다른 워커는 TTL 이 지나야 반영된다.
+    """
+    now = time.monotonic()
+    with _menu_cache_lock:
+        cached = _menu_cache.get(role_id)
+        generation = _menu_cache_generation
+    if cached is not None and cached.expires_at > now:
+        return cached
+
+    menus = get_menus_by_role(db, role_id)
+    body = json.dumps(
+        [MenuBase.model_validate(menu).model_dump(mode="json") for menu in menus],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    cached = CachedMenus(
+        body=body,
+        etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        expires_at=now + settings.menu_cache_ttl_seconds,
+    )
+    with _menu_cache_lock:
+        if generation == _menu_cache_generation:
+            _menu_cache[role_id] = cached
+    return cached
+
+
+def invalidate_menu_cache(role_id: Optional[int] = None) -> None:
+    """메뉴/권한별 메뉴 변경 후 호출. role_id 가 없으면 전체 삭제. (이 프로세스의 캐시만)"""
+    global _menu_cache_generation
+    with _menu_cache_lock:
+        _menu_cache_generation += 1
+        if role_id is None:
+            _menu_cache.clear()
+        else:
+            _menu_cache.pop(role_id, None)
+
+
+@event.listens_for(Menu, "after_insert")
+@event.listens_for(Menu, "after_update")
+@event.listens_for(Menu, "after_delete")
+@event.listens_for(RoleMenu, "after_insert")
+@event.listens_for(RoleMenu, "after_update")
+@event.listens_for(RoleMenu, "after_delete")
+def _invalidate_on_change(mapper, connection, target) -> None:
+    # 같은 프로세스에서의 ORM 변경은 바로 반영 (다른 워커는 TTL 이내)
+    invalidate_menu_cache()
+    # flush 시점에는 아직 커밋 전이라 다른 세션이 변경 전 데이터를 다시 채울 수 있으므로 커밋 후 한 번 더
+    session = object_session(target)
+    if session is not None:
+        session.info["menu_cache_dirty"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session) -> None:
+    if session.info.pop("menu_cache_dirty", False):
+        invalidate_menu_cache()
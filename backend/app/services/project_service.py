@@ -2,13 +2,18 @@
 # 작성일: 2025-11-18
 # 수정내역
 # - 2025-11-18: 초기 작성
+# - 2026-10-18: 조회 시 관계를 로딩하지 않도록 loader 옵션 지정 (with_relations)
+# - 2026-10-18: 프로젝트 목록에 로고/숏폼 개수 추가 (generation_prod 집계 1회), grp_id 키셋 페이지네이션
+# - 2026-10-18: limit 없으면 전체 목록 조회, 개수 집계 IN 목록 1000개 단위 분할
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.models.project import ProdGroup
+from app.models.project import GenerationProd, LOGO_TYPE_ID, ProdGroup, SHORTFORM_TYPE_ID
 from app.models.brand import BrandInfo
-from app.schemas.project import ProjectGrp
+from app.schemas.project import ProjectGrp, ProjectListItem
 from app.agents.state import BrandProfile
+from app.services.loaders import with_relations
 
 
 def create_project_group(
@@ -39,6 +44,7 @@ def load_project_group_entity(
     """
     return (
         db.query(ProdGroup)
+        .options(*with_relations())
         .filter(ProdGroup.grp_id == project_id)
         .first()
     )
@@ -53,28 +59,78 @@ def load_brand_info_entity(
     """
     return (
         db.query(BrandInfo)
+        .options(*with_relations())
         .filter(BrandInfo.grp_id == project_id)
         .first()
     )
 
+# Oracle IN 목록 최대 개수
+_IN_CLAUSE_LIMIT = 1000
+
+
 def get_user_projects(
     db: Session,
     user_id: int,
-) -> list[ProdGroup]:
+    *,
+    limit: int | None = None,
+    before_grp_id: int | None = None,
+) -> tuple[list[ProjectListItem], int | None]:
     """
-    특정 사용자가 생성한 프로젝트 목록 조회.
+    특정 사용자가 생성한 프로젝트 목록 조회 (로고/숏폼 개수 포함).
     - del_yn = 'N'인 것만 조회
-    - grp_id 내림차순 정렬 (최신순)
+    - grp_id 내림차순 정렬 (최신순), 키셋 페이지네이션: before_grp_id 보다 작은 grp_id 부터 limit 개
+      (limit 이 None 이면 전체)
+    - 개수는 이 페이지의 grp_id 들에 대해 generation_prod 를 (grp_id, type_id) 로 집계
+      (Oracle IN 목록 1000개 제한 때문에 1000개 단위로 나눠 조회)
+    - (목록, 다음 페이지 커서) 반환. 다음 페이지가 없으면 커서는 None
     """
-    return (
+    query = (
         db.query(ProdGroup)
+        .options(*with_relations())
         .filter(
             ProdGroup.creator_id == user_id,
             ProdGroup.del_yn == "N",
         )
-        .order_by(ProdGroup.grp_id.desc())
-        .all()
     )
+    if before_grp_id is not None:
+        query = query.filter(ProdGroup.grp_id < before_grp_id)
+
+    query = query.order_by(ProdGroup.grp_id.desc())
+    next_cursor = None
+    if limit is None:
+        projects = query.all()
+    else:
+        # 한 개 더 읽어서 다음 페이지 여부 판단
+        projects = query.limit(limit + 1).all()
+        next_cursor = projects[limit - 1].grp_id if len(projects) > limit else None
+        projects = projects[:limit]
+
+    counts: dict[tuple[int, int], int] = {}
+    grp_ids = [project.grp_id for project in projects]
+    for start in range(0, len(grp_ids), _IN_CLAUSE_LIMIT):
+        rows = db.execute(
+            select(GenerationProd.grp_id, GenerationProd.type_id, func.count())
+            .where(
+                GenerationProd.grp_id.in_(grp_ids[start:start + _IN_CLAUSE_LIMIT]),
+                GenerationProd.type_id.in_([LOGO_TYPE_ID, SHORTFORM_TYPE_ID]),
+                GenerationProd.del_yn == "N",
+            )
+            .group_by(GenerationProd.grp_id, GenerationProd.type_id)
+        ).all()
+        counts.update({(grp_id, type_id): count for grp_id, type_id, count in rows})
+
+    items = [
+        ProjectListItem(
+            grp_id=project.grp_id,
+            grp_nm=project.grp_nm,
+            grp_desc=project.grp_desc,
+            creator_id=project.creator_id,
+            logo_count=counts.get((project.grp_id, LOGO_TYPE_ID), 0),
+            shortform_count=counts.get((project.grp_id, SHORTFORM_TYPE_ID), 0),
+        )
+        for project in projects
+    ]
+    return items, next_cursor
 
 
 def delete_project_group(
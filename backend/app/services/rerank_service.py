@@ -0,0 +1,217 @@
+# 트렌드 RAG 재정렬(Rerank) 서비스
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 (Jina / 로컬 cross-encoder / none 선택, 결과 캐시)
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.llm.embedding_cache import normalize_embedding_text
+
+logger = logging.getLogger(__name__)
+
+# (문서 인덱스, 점수) 리스트
+RankedIndices = List[Tuple[int, float]]
+
+
+class Reranker(ABC):
+    """재정렬 백엔드 공통 인터페이스."""
+
+    name: str = ""
+
+    @abstractmethod
+    async def ascore(self, query: str, docs: Sequence[Document], top_n: int) -> RankedIndices:
+        """상위 top_n 개의 (입력 docs 인덱스, 점수) 를 점수 내림차순으로 돌려준다."""
+
+
+class NoopReranker(Reranker):
+    """재정렬 없이 입력 순서 그대로 상위 top_n 개."""
+
+    name = "none"
+
+    async def ascore(self, query: str, docs: Sequence[Document], top_n: int) -> RankedIndices:
+        return [(idx, 0.0) for idx in range(min(top_n, len(docs)))]
+
+
+class JinaReranker(Reranker):
+    """Jina Rerank API. 클라이언트는 프로세스에서 한 번만 만든다."""
+
+    name = "jina"
+
+    def __init__(self, model: str) -> None:
+        from langchain_community.document_compressors import JinaRerank
+
+        if not settings.jina_api_key:
+            raise RuntimeError("Jina API Key가 설정되지 않아 Reranker를 사용할 수 없습니다.")
+        self.client = JinaRerank(jina_api_key=settings.jina_api_key, model=model)
+
+    async def ascore(self, query: str, docs: Sequence[Document], top_n: int) -> RankedIndices:
+        # JinaRerank 는 동기 requests 세션만 제공
+        results = await run_in_threadpool(self.client.rerank, list(docs), query, top_n=top_n)
+        return [(item["index"], float(item["relevance_score"])) for item in results]
+
+
+class LocalCrossEncoderReranker(Reranker):
+    """
+    CPU cross-encoder (sentence-transformers CrossEncoder).
+    - settings.reranker_local_onnx=True 면 ONNX 백엔드를 먼저 시도하고, 안 되면 torch 로 연다.
+    - 모델은 첫 호출 시 로드, 점수 계산은 스레드풀에서 batch 단위로 실행
+    """
+
+    name = "local"
+
+    def __init__(self, model: str, *, batch_size: int, use_onnx: bool) -> None:
+        self.model_name = model
+        self.batch_size = batch_size
+        self.use_onnx = use_onnx
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._model is not None:
+            return self._model
+        with self._lock:
+            if self._model is not None:
+                return self._model
+            try:
+                from sentence_transformers import CrossEncoder
+            except ImportError as e:
+                raise RuntimeError(
+                    "로컬 Reranker 에는 sentence-transformers 패키지가 필요합니다. "
+                    "(pip install \"sentence-transformers[onnx]\")"
+                ) from e
+
+            if self.use_onnx:
+                try:
+                    self._model = CrossEncoder(self.model_name, device="cpu", backend="onnx")
+                    logger.info("[rerank] 로컬 cross-encoder 로드 (onnx): %s", self.model_name)
+                    return self._model
+                except Exception as e:
+                    logger.warning("[rerank] ONNX 로드 실패, torch 로 재시도: %s", e)
+
+            self._model = CrossEncoder(self.model_name, device="cpu")
+            logger.info("[rerank] 로컬 cross-encoder 로드 (torch): %s", self.model_name)
+            return self._model
+
+    def _score_sync(self, query: str, docs: Sequence[Document], top_n: int) -> RankedIndices:
+        model = self._load()
+        scores = model.predict(
+            [(query, doc.page_content) for doc in docs],
+            batch_size=self.batch_size,
+            show_progress_bar=False,
+        )
+        ranked = sorted(enumerate(float(score) for score in scores), key=lambda item: item[1], reverse=True)
+        return ranked[:top_n]
+
+    async def ascore(self, query: str, docs: Sequence[Document], top_n: int) -> RankedIndices:
+        return await run_in_threadpool(self._score_sync, query, docs, top_n)
+
+
+@lru_cache
+def get_reranker() -> Reranker:
+    """settings.reranker_backend 에 맞는 재정렬 백엔드 (프로세스 공용)."""
+    backend = settings.reranker_backend
+    if backend == "local":
+        return LocalCrossEncoderReranker(
+            settings.reranker_local_model,
+            batch_size=settings.reranker_batch_size,
+            use_onnx=settings.reranker_local_onnx,
+        )
+    if backend == "jina":
+        return JinaReranker(settings.jina_model or "jina-reranker-v2-base-multilingual")
+    return NoopReranker()
+
+
+# ----------------------------------------------------------------------
+# 결과 캐시: (백엔드, 질의, top_n, 문서 해시 목록) -> 문서 해시별 점수
+# ----------------------------------------------------------------------
+_cache: "OrderedDict[str, List[Tuple[str, float]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _doc_hash(doc: Document) -> str:
+    return hashlib.sha256(doc.page_content.encode("utf-8")).hexdigest()
+
+
+def _cache_key(backend: str, query: str, top_n: int, doc_hashes: Sequence[str]) -> str:
+    raw = "\x00".join([backend, normalize_embedding_text(query), str(top_n), *sorted(doc_hashes)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[List[Tuple[str, float]]]:
+    with _cache_lock:
+        value = _cache.get(key)
+        if value is not None:
+            _cache.move_to_end(key)
+        return value
+
+
+def _cache_put(key: str, value: List[Tuple[str, float]]) -> None:
+    with _cache_lock:
+        _cache[key] = value
+        _cache.move_to_end(key)
+        while len(_cache) > settings.reranker_cache_size:
+            _cache.popitem(last=False)
+
+
+async def rerank_documents(
+    query: str,
+    docs: Sequence[Document],
+    *,
+    top_n: Optional[int] = None,
+) -> List[Document]:
+    """
+    docs 를 query 기준으로 재정렬해 상위 top_n 개를 돌려준다.
+    - 결과 문서 metadata["relevance_score"] 에 점수를 넣는다.
+    - 같은 (질의, 문서 집합) 은 캐시된 순위를 재사용한다. (문서 입력 순서는 무관)
+    """
+    top_n = top_n or settings.reranker_top_n
+    if not docs:
+        return []
+
+    # 본문이 같은 문서는 하나만 (RAG/웹 결과 중복 제거)
+    unique: Dict[str, Document] = {}
+    for doc in docs:
+        unique.setdefault(_doc_hash(doc), doc)
+    hashes = list(unique.keys())
+    candidates = list(unique.values())
+
+    reranker = get_reranker()
+    if isinstance(reranker, NoopReranker):
+        # 입력 순서에 의존하므로 캐시하지 않는다
+        return [
+            Document(id=doc.id, page_content=doc.page_content, metadata=dict(doc.metadata or {}))
+            for doc in candidates[:top_n]
+        ]
+
+    key = _cache_key(reranker.name, query, top_n, hashes)
+    ranked = _cache_get(key)
+    if ranked is None:
+        scored = await reranker.ascore(query, candidates, top_n)
+        ranked = [(hashes[idx], score) for idx, score in scored]
+        _cache_put(key, ranked)
+    else:
+        logger.info("[rerank] 캐시 적중 (%s, 문서 %d)", reranker.name, len(candidates))
+
+    results: List[Document] = []
+    for doc_hash, score in ranked:
+        doc = unique[doc_hash]
+        results.append(
+            Document(
+                id=doc.id,
+                page_content=doc.page_content,
+                metadata={**(doc.metadata or {}), "relevance_score": score},
+            )
+        )
+    return results
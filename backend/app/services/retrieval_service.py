@@ -0,0 +1,379 @@
+# 트렌드 RAG 하이브리드 검색 서비스 (BM25 + 벡터, RRF)
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성
+# - 2026-10-18: BM25 인덱스 캐시를 문서 수 대신 컬렉션 버전(적재 시각 마커 파일) 기준으로 갱신
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from app.core.config import settings
+from app.services.vector_service import resolve_store_key, get_vectorstore
+
+logger = logging.getLogger(__name__)
+
+# ----------------------------------------------------------------------
+# 토크나이저
+# ----------------------------------------------------------------------
+_TOKEN_RE = re.compile(r"#?(?:[0-9a-z]+|[가-힣]+)")
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+# 긴 조사부터 떼어낸다 (형태소 분석기 없이 복합어/조사 변형을 맞추기 위한 최소 처리)
+_JOSA_SUFFIXES = (
+    "으로부터", "에서부터", "이라고", "에게서",
+    "으로", "에서", "에게", "까지", "부터", "처럼", "보다", "이랑", "하고", "라고", "이나",
+    "은", "는", "이", "가", "을", "를", "의", "에", "와", "과", "도", "로", "만", "나",
+)
+
+
+def _strip_josa(token: str) -> str:
+    for suffix in _JOSA_SUFFIXES:
+        if len(token) - len(suffix) >= 2 and token.endswith(suffix):
+            return token[: -len(suffix)]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    한국어 대응 BM25 토크나이저.
+
+    - 영문/숫자: 소문자 단어 그대로
+    - 해시태그: "#태그" 원형과 "태그" 둘 다
+    - 한글: 조사를 뗀 어간 + 음절 bigram (띄어쓰기/복합어 차이 보완. 예: "숏폼마케팅" ~ "숏폼 마케팅")
+    """
+    tokens: List[str] = []
+    for raw in _TOKEN_RE.findall((text or "").lower()):
+        if raw.startswith("#"):
+            tokens.append(raw)
+            raw = raw[1:]
+            if not raw:
+                continue
+
+        if not _HANGUL_RE.search(raw):
+            tokens.append(raw)
+            continue
+
+        if raw in _JOSA_SUFFIXES:
+            # "instagram에서" 처럼 영문 뒤에 붙은 조사
+            continue
+        stem = _strip_josa(raw)
+        tokens.append(stem)
+        if len(stem) > 2:
+            tokens.extend(stem[i:i + 2] for i in range(len(stem) - 1))
+    return tokens
+
+
+# ----------------------------------------------------------------------
+# 메타데이터 필터
+# ----------------------------------------------------------------------
+def date_to_int(value: Any, *, upper: bool = False) -> Optional[int]:
+    """
+    "2026-03-01" / "2026.03" / "2026" -> YYYYMMDD 정수.
+    월/일이 없으면 upper=False 는 00, upper=True 는 99 로 채운다. (범위 필터용)
+    """
+    digits = re.findall(r"\d+", str(value or ""))
+    if not digits or len(digits[0]) != 4:
+        return None
+    pad = 99 if upper else 0
+    year = int(digits[0])
+    month = int(digits[1]) if len(digits) > 1 else pad
+    day = int(digits[2]) if len(digits) > 2 else pad
+    return year * 10000 + month * 100 + day
+
+
+def build_filter(
+    *,
+    category: Optional[str] = None,
+    platform: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+) -> Dict[str, Any]:
+    """검색 필터 dict (값이 있는 항목만). date_* 는 YYYYMMDD 정수로 변환."""
+    flt: Dict[str, Any] = {}
+    if category:
+        flt["category"] = category
+    if platform:
+        flt["platform"] = platform
+    if date_from and date_to_int(date_from) is not None:
+        flt["date_from"] = date_to_int(date_from)
+    if date_to and date_to_int(date_to, upper=True) is not None:
+        flt["date_to"] = date_to_int(date_to, upper=True)
+    return flt
+
+
+def _to_chroma_where(flt: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    clauses: List[Dict[str, Any]] = []
+    for key in ("category", "platform"):
+        if key in flt:
+            clauses.append({key: {"$eq": flt[key]}})
+    if "date_from" in flt:
+        clauses.append({"date_int": {"$gte": flt["date_from"]}})
+    if "date_to" in flt:
+        clauses.append({"date_int": {"$lte": flt["date_to"]}})
+
+    if not clauses:
+        return None
+    if len(clauses) == 1:
+        return clauses[0]
+    return {"$and": clauses}
+
+
+def _match_filter(meta: Dict[str, Any], flt: Dict[str, Any]) -> bool:
+    for key in ("category", "platform"):
+        if key in flt and meta.get(key) != flt[key]:
+            return False
+    if "date_from" in flt or "date_to" in flt:
+        date_int = meta.get("date_int")
+        if not isinstance(date_int, int):
+            return False
+        if "date_from" in flt and date_int < flt["date_from"]:
+            return False
+        if "date_to" in flt and date_int > flt["date_to"]:
+            return False
+    return True
+
+
+# ----------------------------------------------------------------------
+# BM25 인덱스
+# ----------------------------------------------------------------------
+class BM25Index:
+    """Chroma 컬렉션 문서로 만드는 메모리 역색인 (Okapi BM25)."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self.docs: List[Document] = []
+        self.doc_lens: List[int] = []
+        self.postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self.avgdl = 0.0
+        self.built_at = ""
+        self.build_ms = 0.0
+        self.version: Tuple[str, int] = ("", 0)
+
+    def add(self, doc: Document) -> None:
+        idx = len(self.docs)
+        tokens = tokenize(f"{doc.metadata.get('title', '')}\n{doc.page_content}")
+        self.docs.append(doc)
+        self.doc_lens.append(len(tokens))
+        for token, tf in Counter(tokens).items():
+            self.postings[token].append((idx, tf))
+
+    def finalize(self) -> None:
+        self.avgdl = (sum(self.doc_lens) / len(self.doc_lens)) if self.doc_lens else 0.0
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def search(self, query: str, k: int, flt: Optional[Dict[str, Any]] = None) -> List[Tuple[Document, float]]:
+        if not self.docs:
+            return []
+
+        n_docs = len(self.docs)
+        scores: Dict[int, float] = defaultdict(float)
+        for token in set(tokenize(query)):
+            postings = self.postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for idx, tf in postings:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lens[idx] / (self.avgdl or 1))
+                scores[idx] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        results: List[Tuple[Document, float]] = []
+        for idx, score in ranked:
+            doc = self.docs[idx]
+            if flt and not _match_filter(doc.metadata, flt):
+                continue
+            results.append((doc, score))
+            if len(results) >= k:
+                break
+        return results
+
+
+# (절대 경로, 컬렉션) -> BM25Index
+_indexes: Dict[Tuple[str, str], BM25Index] = {}
+_lock = threading.Lock()
+
+_PAGE_SIZE = 1000
+
+
+def _build_index(collection) -> BM25Index:
+    started = time.perf_counter()
+    index = BM25Index()
+    offset = 0
+    while True:
+        page = collection.get(include=["documents", "metadatas"], limit=_PAGE_SIZE, offset=offset)
+        ids = page.get("ids") or []
+        if not ids:
+            break
+        for doc_id, content, meta in zip(ids, page.get("documents") or [], page.get("metadatas") or []):
+            index.add(Document(id=doc_id, page_content=content or "", metadata=dict(meta or {})))
+        offset += len(ids)
+    index.finalize()
+    index.build_ms = round((time.perf_counter() - started) * 1000, 1)
+    index.built_at = time.strftime("%Y-%m-%d %H:%M:%S")
+    return index
+
+
+def _version_path(key: Tuple[str, str]) -> Path:
+    persist_dir, collection_name = key
+    return Path(persist_dir) / f".{collection_name}.version"
+
+
+def _read_collection_version(key: Tuple[str, str]) -> str:
+    try:
+        return _version_path(key).read_text(encoding="utf-8").strip()
+    except OSError:
+        return ""
+
+
+def mark_collection_changed(
+    persist_directory: Optional[str] = None,
+    collection_name: Optional[str] = None,
+) -> None:
+    """
+    적재(추가/삭제) 후 호출. 컬렉션 버전 마커를 새로 쓰고 이 프로세스의 BM25 인덱스를 비운다.
+    다른 프로세스(서버 워커)는 다음 검색 때 버전이 바뀐 것을 보고 인덱스를 다시 만든다.
+    """
+    key = resolve_store_key(persist_directory, collection_name)
+    path = _version_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(str(time.time_ns()), encoding="utf-8")
+    tmp_path.replace(path)
+    invalidate_keyword_index(persist_directory, collection_name)
+
+
+def get_keyword_index(
+    persist_directory: Optional[str] = None,
+    collection_name: Optional[str] = None,
+) -> BM25Index:
+    """
+    컬렉션별 BM25 인덱스. 처음 호출 시 컬렉션 전체를 읽어 만들고,
+    컬렉션 버전(mark_collection_changed 가 쓰는 마커) 또는 문서 수가 달라졌거나
+    invalidate_keyword_index() 후에는 다시 만든다.
+    (문서 수만 보면 같은 수만큼 지우고 추가한 재적재를 놓친다)
+    """
+    key = resolve_store_key(persist_directory, collection_name)
+    collection = get_vectorstore(persist_directory, collection_name)._collection
+    version = (_read_collection_version(key), collection.count())
+
+    index = _indexes.get(key)
+    if index is not None and index.version == version:
+        return index
+
+    with _lock:
+        index = _indexes.get(key)
+        if index is not None and index.version == version:
+            return index
+        index = _build_index(collection)
+        index.version = version
+        _indexes[key] = index
+        logger.info(
+            "[retrieval] BM25 인덱스 생성: collection=%s docs=%d (%.1fms)",
+            key[1],
+            len(index),
+            index.build_ms,
+        )
+        return index
+
+
+def invalidate_keyword_index(
+    persist_directory: Optional[str] = None,
+    collection_name: Optional[str] = None,
+) -> None:
+    """적재 후 호출. 다음 검색 때 BM25 인덱스를 다시 만든다."""
+    with _lock:
+        _indexes.pop(resolve_store_key(persist_directory, collection_name), None)
+
+
+# ----------------------------------------------------------------------
+# 하이브리드 검색
+# ----------------------------------------------------------------------
+def _doc_key(doc: Document) -> str:
+    if doc.id:
+        return doc.id
+    return hashlib.sha256(doc.page_content.encode("utf-8")).hexdigest()
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: List[List[Document]],
+    *,
+    k: int = 60,
+    top_n: Optional[int] = None,
+) -> List[Document]:
+    """여러 순위 리스트를 RRF(sum 1 / (k + rank)) 로 합친다."""
+    scores: Dict[str, float] = defaultdict(float)
+    docs: Dict[str, Document] = {}
+    for ranked in ranked_lists:
+        for rank, doc in enumerate(ranked, start=1):
+            key = _doc_key(doc)
+            scores[key] += 1.0 / (k + rank)
+            docs.setdefault(key, doc)
+
+    ordered = sorted(scores, key=lambda key: scores[key], reverse=True)
+    if top_n is not None:
+        ordered = ordered[:top_n]
+    return [docs[key] for key in ordered]
+
+
+async def hybrid_search(
+    query: str,
+    *,
+    k: Optional[int] = None,
+    category: Optional[str] = None,
+    platform: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    persist_directory: Optional[str] = None,
+    collection_name: Optional[str] = None,
+) -> List[Document]:
+    """
+    벡터 검색 + BM25 검색을 RRF 로 합친 상위 k 개 문서.
+
+    - 벡터: Chroma asimilarity_search (settings.hybrid_vector_k 개)
+    - BM25: 메모리 역색인 (settings.hybrid_bm25_k 개) -> 브랜드명/해시태그/복합어 정확 매칭 보완
+    - category / platform / date_from~date_to 필터는 양쪽 모두에 적용
+    - hybrid_search_enabled=False 면 벡터 검색만 사용
+    """
+    k = k or settings.rag_top_k
+    flt = build_filter(category=category, platform=platform, date_from=date_from, date_to=date_to)
+    vs = get_vectorstore(persist_directory, collection_name)
+
+    vector_task = vs.asimilarity_search(query, k=settings.hybrid_vector_k, filter=_to_chroma_where(flt))
+    if not settings.hybrid_search_enabled:
+        return (await vector_task)[:k]
+
+    async def _keyword() -> List[Document]:
+        index = await asyncio.to_thread(get_keyword_index, persist_directory, collection_name)
+        return [doc for doc, _ in index.search(query, settings.hybrid_bm25_k, flt)]
+
+    vector_docs, keyword_docs = await asyncio.gather(vector_task, _keyword())
+    logger.info("[retrieval] 벡터 %d건, BM25 %d건", len(vector_docs), len(keyword_docs))
+
+    return reciprocal_rank_fusion(
+        [vector_docs, keyword_docs],
+        k=settings.hybrid_rrf_k,
+        top_n=k,
+    )
+
+
+def warm_up_keyword_index() -> None:
+    """서버 시작 시 기본 컬렉션의 BM25 인덱스를 미리 만든다."""
+    try:
+        get_keyword_index()
+    except Exception:
+        logger.exception("[retrieval] BM25 인덱스 워밍업 실패")
@@ -0,0 +1,125 @@
+# 트렌드 답변 시맨틱 캐시
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 (질의 임베딩 + 브랜드 프로필 지문, 전용 Chroma 컬렉션)
+# - 2026-10-18: 답변과 함께 근거 evidence_id 저장/반환
+# - 2026-10-18: 지문에 프롬프트가 쓰는 브랜드 프로필 항목(브랜드명/키워드/기피 트렌드/선호 색상 등) 모두 포함
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from langchain_chroma import Chroma
+
+from app.core.config import settings
+from app.llm.embedding_cache import normalize_embedding_text
+from app.services.vector_service import get_vectorstore
+
+logger = logging.getLogger(__name__)
+
+# 답변 내용에 영향을 주는 브랜드 프로필 항목
+# - 합성 프롬프트(trend_agent._format_brand_profile)와 에이전트 state 에 들어가는 항목은 모두 포함한다.
+#   (브랜드명/키워드가 들어간 답변이 다른 사용자·프로젝트에 재사용되지 않도록)
+FINGERPRINT_KEYS = (
+    "brand_name",
+    "name",
+    "category",
+    "industry",
+    "tone_mood",
+    "core_keywords",
+    "target_age",
+    "target_gender",
+    "avoided_trends",
+    "preferred_colors",
+    "slogan",
+)
+
+
+def _fingerprint_value(value: Any) -> str:
+    if isinstance(value, (list, tuple, set)):
+        return json.dumps(sorted(normalize_embedding_text(str(item)) for item in value), ensure_ascii=False)
+    return normalize_embedding_text(str(value))
+
+
+def profile_fingerprint(mode: str, brand_profile: Optional[Dict[str, Any]]) -> str:
+    """mode + 브랜드 프로필 주요 항목의 해시. 같은 지문끼리만 캐시를 공유한다."""
+    profile = brand_profile or {}
+    payload = {
+        "mode": mode,
+        **{key: _fingerprint_value(profile[key]) for key in FINGERPRINT_KEYS if profile.get(key)},
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def _get_store() -> Chroma:
+    # 코사인 거리: score(distance) = 1 - 코사인 유사도
+    return get_vectorstore(
+        collection_name=settings.trend_answer_cache_collection,
+        collection_metadata={"hnsw:space": "cosine"},
+    )
+
+
+async def lookup_trend_answer(query: str, fingerprint: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    지문이 같고 TTL 이내인 이전 답변 중, 질의 유사도가 임계값 이상인 가장 가까운 답변.
+    (답변, 근거 evidence_id) 또는 None.
+    """
+    min_ts = int(time.time()) - settings.trend_answer_cache_ttl_seconds
+    try:
+        results = await _get_store().asimilarity_search_with_score(
+            query,
+            k=1,
+            filter={"$and": [{"fingerprint": fingerprint}, {"created_ts": {"$gte": min_ts}}]},
+        )
+    except Exception as e:
+        logger.warning("[trend_cache] 조회 실패: %s", e)
+        return None
+
+    if not results:
+        return None
+
+    doc, distance = results[0]
+    similarity = 1.0 - float(distance)
+    if similarity < settings.trend_answer_cache_threshold:
+        logger.info("[trend_cache] 미스 (유사도 %.3f): %s", similarity, query)
+        return None
+
+    logger.info("[trend_cache] 적중 (유사도 %.3f): %s ~ %s", similarity, query, doc.page_content)
+    answer = doc.metadata.get("answer")
+    if not answer:
+        return None
+    return answer, doc.metadata.get("evidence_id") or None
+
+
+async def store_trend_answer(
+    query: str,
+    fingerprint: str,
+    answer: str,
+    *,
+    evidence_id: Optional[str] = None,
+) -> None:
+    """답변을 저장하고, TTL 이 지난 항목은 정리한다."""
+    now = int(time.time())
+    doc_id = hashlib.sha256(f"{fingerprint}\x00{normalize_embedding_text(query)}".encode("utf-8")).hexdigest()
+    store = _get_store()
+    try:
+        await store.aadd_texts(
+            [query],
+            metadatas=[
+                {
+                    "fingerprint": fingerprint,
+                    "answer": answer,
+                    "evidence_id": evidence_id or "",
+                    "created_ts": now,
+                }
+            ],
+            ids=[doc_id],
+        )
+        await store.adelete(where={"created_ts": {"$lt": now - settings.trend_answer_cache_ttl_seconds}})
+    except Exception as e:
+        logger.warning("[trend_cache] 저장 실패: %s", e)
@@ -0,0 +1,114 @@
+# 트렌드 근거 문서 저장소
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 (evidence_id 로 재정렬된 근거 문서 묶음 보관, TTL 정리)
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+
+from langchain_core.documents import Document
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+class TrendEvidenceStore:
+    """
+    트렌드 답변의 근거 문서 묶음 저장소 (로컬 SQLite).
+    - TrendContext 에는 evidence_id 만 두고, 본문은 여기 보관한다. (체크포인트 크기 유지)
+    - retry/refine 턴은 evidence_id 로 문서를 다시 읽어 검색 없이 답변을 다시 만든다.
+    """
+
+    def __init__(self, sqlite_path: str) -> None:
+        path = Path(sqlite_path)
+        if not path.is_absolute():
+            path = BASE_DIR / path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS trend_evidence (
+                evidence_id TEXT PRIMARY KEY,
+                query       TEXT NOT NULL,
+                docs        TEXT NOT NULL,
+                created_at  REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_trend_evidence_created_at ON trend_evidence (created_at)"
+        )
+        self._conn.commit()
+
+    def save(self, query: str, docs: List[Document]) -> str:
+        evidence_id = uuid.uuid4().hex
+        now = time.time()
+        payload = json.dumps(
+            [{"page_content": doc.page_content, "metadata": doc.metadata or {}} for doc in docs],
+            ensure_ascii=False,
+            default=str,
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO trend_evidence (evidence_id, query, docs, created_at) VALUES (?, ?, ?, ?)",
+                (evidence_id, query, payload, now),
+            )
+            self._conn.execute(
+                "DELETE FROM trend_evidence WHERE created_at < ?",
+                (now - settings.trend_evidence_ttl_seconds,),
+            )
+            self._conn.commit()
+        return evidence_id
+
+    def load(self, evidence_id: str) -> Optional[List[Document]]:
+        """TTL 이내의 문서 묶음. 없거나 만료됐으면 None."""
+        min_created = time.time() - settings.trend_evidence_ttl_seconds
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT docs FROM trend_evidence WHERE evidence_id = ? AND created_at >= ?",
+                (evidence_id, min_created),
+            ).fetchone()
+        if row is None:
+            return None
+        return [Document(page_content=item["page_content"], metadata=item["metadata"]) for item in json.loads(row[0])]
+
+
+@lru_cache
+def get_trend_evidence_store() -> TrendEvidenceStore:
+    return TrendEvidenceStore(settings.trend_evidence_path)
+
+
+async def save_trend_evidence(query: str, docs: List[Document]) -> Optional[str]:
+    if not docs:
+        return None
+    try:
+        return await run_in_threadpool(get_trend_evidence_store().save, query, docs)
+    except Exception as e:
+        logger.warning("[trend_evidence] 저장 실패: %s", e)
+        return None
+
+
+async def load_trend_evidence(evidence_id: Optional[str]) -> Optional[List[Document]]:
+    if not evidence_id:
+        return None
+    try:
+        return await run_in_threadpool(get_trend_evidence_store().load, evidence_id)
+    except Exception as e:
+        logger.warning("[trend_evidence] 조회 실패: %s", e)
+        return None
@@ -0,0 +1,75 @@
+# 트렌드 질의 단기 메모리
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 (키별 최근 N개 질문/답변, 키 개수 LRU 제한)
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Deque, List, Optional, Tuple
+
+from app.core.config import settings
+
+QAPair = Tuple[str, str]
+
+
+class TrendMemory:
+    """
+    트렌드 후속 질문용 단기 메모리 (프로세스 메모리).
+
+    - 키(user_id/project_id)별로 최근 max_turns 개의 (질문, 답변)만 보관한다.
+    - 키는 최근 사용 순으로 max_keys 개까지만 유지한다. (오래된 키부터 제거)
+    - 트렌드 실행은 기본이 stateless 이고, use_memory=True 로 요청할 때만 읽고 쓴다.
+    """
+
+    def __init__(self, *, max_turns: int, max_keys: int, answer_max_chars: int) -> None:
+        self.max_turns = max_turns
+        self.max_keys = max_keys
+        self.answer_max_chars = answer_max_chars
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, Deque[QAPair]]" = OrderedDict()
+
+    def get(self, key: str) -> List[QAPair]:
+        with self._lock:
+            pairs = self._items.get(key)
+            if pairs is None:
+                return []
+            self._items.move_to_end(key)
+            return list(pairs)
+
+    def append(self, key: str, question: str, answer: str) -> None:
+        if self.max_turns <= 0:
+            return
+        if self.answer_max_chars > 0 and len(answer) > self.answer_max_chars:
+            answer = answer[: self.answer_max_chars] + "…"
+        with self._lock:
+            pairs = self._items.get(key)
+            if pairs is None:
+                pairs = deque(maxlen=self.max_turns)
+                self._items[key] = pairs
+            pairs.append((question, answer))
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_keys:
+                self._items.popitem(last=False)
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def memory_key(user_id: Optional[int], project_id: Optional[int]) -> str:
+    return f"trend:{user_id or 'anon'}:{project_id or 'none'}"
+
+
+@lru_cache
+def get_trend_memory() -> TrendMemory:
+    return TrendMemory(
+        max_turns=settings.trend_memory_turns,
+        max_keys=settings.trend_memory_max_keys,
+        answer_max_chars=settings.history_tool_output_max_chars,
+    )
@@ -0,0 +1,413 @@
+# 트렌드 카테고리 리포트 사전 계산
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 ((카테고리, 타깃, 플랫폼) 리포트 일괄 생성/저장, 브랜드 프로필 매칭 조회, 주기 갱신)
+# - 2026-10-18: 타깃 매칭을 문자열 비교 대신 연령대/성별 코드 비교로 변경
+# - 2026-10-18: 주기 갱신은 SQLite 리스(lease)를 잡은 워커 하나만 실행
+# - 2026-10-18: 리포트가 반영하지 않는 프로필 항목 판별(profile_needs_tailoring) 추가
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.llm.client import get_embeddings
+from app.llm.embedding_cache import normalize_embedding_text
+from app.services.trend_answer_cache import FINGERPRINT_KEYS
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+# 질의에 이 표현이 있으면 해당 플랫폼 리포트를 우선 매칭
+_PLATFORM_ALIASES: Dict[str, Sequence[str]] = {
+    "instagram": ("instagram", "인스타", "릴스"),
+    "youtube": ("youtube", "유튜브", "쇼츠"),
+    "tiktok": ("tiktok", "틱톡"),
+}
+
+# 타깃 문자열 -> 성별 코드 (female 을 male 보다 먼저 검사)
+_GENDER_ALIASES: Sequence[Tuple[str, Sequence[str]]] = (
+    ("female", ("female", "woman", "women", "여성", "여자", "여대생")),
+    ("male", ("male", "man", "men", "남성", "남자", "남대생")),
+)
+_GENDER_ANY = ("남녀", "성별무관", "무관", "전체", "all", "any")
+
+# "20대", "20~30대", "20s", "2030" 같은 연령대 표현
+_AGE_RANGE = re.compile(r"(\d)0\s*[~\-–]\s*(\d)0\s*(?:대|s)")
+_AGE_DECADE = re.compile(r"(\d)0\s*(?:대|s)")
+_AGE_PAIR = re.compile(r"(?<!\d)([1-6])0([1-6])0(?!\d)")
+
+# 리포트 생성/매칭에 반영되는 프로필 항목. 나머지 항목(톤/키워드/기피 트렌드 등)은 리포트에 없다.
+REPORT_PROFILE_KEYS = ("category", "industry", "target_age", "target_gender")
+
+
+def _norm(value: Optional[str]) -> str:
+    return normalize_embedding_text(value or "").lower()
+
+
+@dataclass(frozen=True)
+class ReportSpec:
+    """사전 계산할 리포트 하나. audience / platform 은 비워 두면 '전체'."""
+    category: str
+    audience: str = ""
+    platform: str = ""
+
+    def normalized(self) -> "ReportSpec":
+        return ReportSpec(_norm(self.category), _norm(self.audience), _norm(self.platform))
+
+    @property
+    def key(self) -> str:
+        spec = self.normalized()
+        raw = f"{spec.category}\x00{spec.audience}\x00{spec.platform}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    def to_query(self) -> str:
+        parts = ["요즘"]
+        if self.audience:
+            parts.append(f"{self.audience} 대상")
+        parts.append(self.category)
+        if self.platform:
+            parts.append(self.platform)
+        parts.append("마케팅 트렌드를 알려줘.")
+        return " ".join(parts)
+
+
+@dataclass
+class PrecomputeStats:
+    """일괄 생성 결과 집계."""
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    failed_specs: List[Dict[str, str]] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "failed_specs": list(self.failed_specs),
+        }
+
+
+class TrendReportStore:
+    """사전 계산된 트렌드 리포트 저장소 (로컬 SQLite, 리포트 키 기준 1건)."""
+
+    def __init__(self, sqlite_path: str) -> None:
+        path = Path(sqlite_path)
+        if not path.is_absolute():
+            path = BASE_DIR / path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS trend_report (
+                report_key  TEXT PRIMARY KEY,
+                category    TEXT NOT NULL,
+                audience    TEXT NOT NULL,
+                platform    TEXT NOT NULL,
+                query       TEXT NOT NULL,
+                answer      TEXT NOT NULL,
+                evidence_id TEXT,
+                created_at  REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_trend_report_category ON trend_report (category)")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS trend_report_lease (
+                name        TEXT PRIMARY KEY,
+                owner       TEXT NOT NULL,
+                expires_at  REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def try_acquire_lease(self, name: str, owner: str, ttl_seconds: float) -> bool:
+        """
+        이름별 리스를 잡거나 연장한다. 다른 owner 의 리스가 아직 유효하면 False.
+        (여러 uvicorn 워커가 같은 SQLite 파일을 보므로 워커 간 리더 선출에 사용)
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO trend_report_lease (name, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE trend_report_lease.owner = excluded.owner OR trend_report_lease.expires_at < ?",
+                (name, owner, now + ttl_seconds, now),
+            )
+            self._conn.commit()
+            row = self._conn.execute(
+                "SELECT owner FROM trend_report_lease WHERE name = ?", (name,)
+            ).fetchone()
+        return row is not None and row["owner"] == owner
+
+    def put(self, spec: ReportSpec, query: str, answer: str, evidence_id: Optional[str]) -> None:
+        norm = spec.normalized()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO trend_report "
+                "(report_key, category, audience, platform, query, answer, evidence_id, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (spec.key, norm.category, norm.audience, norm.platform, query, answer, evidence_id, time.time()),
+            )
+            self._conn.commit()
+
+    def find_by_category(self, category: str, min_created: float) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM trend_report WHERE category = ? AND created_at >= ?",
+                (_norm(category), min_created),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def list_all(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM trend_report ORDER BY category, audience, platform"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+
+@lru_cache
+def get_trend_report_store() -> TrendReportStore:
+    return TrendReportStore(settings.trend_report_path)
+
+
+# ----------------------------------------------------------------------
+# 일괄 생성
+# ----------------------------------------------------------------------
+async def precompute_reports(
+    specs: Sequence[ReportSpec],
+    *,
+    concurrency: Optional[int] = None,
+) -> PrecomputeStats:
+    """
+    리포트 목록을 트렌드 파이프라인으로 생성해 저장한다.
+    - 동시 실행 수는 concurrency (기본 settings.trend_report_concurrency) 로 제한
+    - 캐시/사전 계산 결과를 쓰지 않고 항상 새로 생성한다.
+    """
+    # trend_agent 가 이 모듈의 조회 함수를 쓰므로 실행 시점에 import
+    from app.agents.trend_agent import arun_trend_query
+
+    unique = list({spec.key: spec for spec in specs}.values())
+    stats = PrecomputeStats(total=len(unique))
+    semaphore = asyncio.Semaphore(max(1, concurrency or settings.trend_report_concurrency))
+    store = get_trend_report_store()
+
+    async def run_one(spec: ReportSpec) -> None:
+        query = spec.to_query()
+        async with semaphore:
+            try:
+                result = await arun_trend_query(
+                    query,
+                    mode="brand",
+                    brand_profile={"category": spec.category},
+                    strategy="pipeline",
+                    use_cache=False,
+                )
+                await run_in_threadpool(store.put, spec, query, result.answer, result.evidence_id)
+                stats.succeeded += 1
+                logger.info("[trend_report] 생성 완료: %s", query)
+            except Exception as e:
+                stats.failed += 1
+                stats.failed_specs.append(
+                    {"category": spec.category, "audience": spec.audience, "platform": spec.platform}
+                )
+                logger.warning("[trend_report] 생성 실패 (%s): %s", query, e)
+
+    await asyncio.gather(*(run_one(spec) for spec in unique))
+    return stats
+
+
+def default_report_specs() -> List[ReportSpec]:
+    return [ReportSpec(**spec) for spec in settings.trend_report_default_specs]
+
+
+async def refresh_reports(*, concurrency: Optional[int] = None) -> PrecomputeStats:
+    """기본 목록 + 저장된 리포트 중 갱신 주기가 지난 것만 다시 생성."""
+    store = get_trend_report_store()
+    rows = await run_in_threadpool(store.list_all)
+    fresh_after = time.time() - settings.trend_report_refresh_interval_seconds
+    fresh_keys = {row["report_key"] for row in rows if row["created_at"] >= fresh_after}
+
+    specs = default_report_specs() + [
+        ReportSpec(row["category"], row["audience"], row["platform"]) for row in rows
+    ]
+    stale = [spec for spec in specs if spec.key not in fresh_keys]
+    if not stale:
+        return PrecomputeStats()
+    return await precompute_reports(stale, concurrency=concurrency)
+
+
+_REFRESH_LEASE = "refresh"
+
+
+async def run_trend_report_refresh(interval_seconds: int) -> None:
+    """
+    사전 계산 리포트를 주기적으로 갱신하는 백그라운드 루프.
+    (main.lifespan 에서 asyncio task 로 실행, settings.trend_report_refresh_enabled 일 때만)
+
+    - 워커마다 이 루프가 돌지만, SQLite 리스를 잡은 워커 하나만 실제로 갱신한다.
+    - 리스는 주기의 1.5배 동안 유효하고 매 주기 연장된다. (리더가 죽으면 만료 후 다른 워커가 이어받음)
+    """
+    owner = f"{os.getpid()}:{id(asyncio.current_task())}"
+    store = get_trend_report_store()
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            is_leader = await run_in_threadpool(
+                store.try_acquire_lease, _REFRESH_LEASE, owner, interval_seconds * 1.5
+            )
+            if not is_leader:
+                continue
+            stats = await refresh_reports()
+            if stats.total:
+                logger.info("[trend_report] 주기 갱신: %s", stats.as_dict())
+        except Exception:
+            logger.exception("[trend_report] 주기 갱신 실패")
+
+
+# ----------------------------------------------------------------------
+# 조회 (trend_search / arun_trend_query)
+# ----------------------------------------------------------------------
+def _detect_platform(query: str) -> str:
+    text = _norm(query)
+    for platform, aliases in _PLATFORM_ALIASES.items():
+        if any(alias in text for alias in aliases):
+            return platform
+    return ""
+
+
+def _age_buckets(text: str) -> FrozenSet[int]:
+    """연령대 표현을 10단위 버킷 집합으로. (예: "20~30대" -> {20, 30}, 없으면 빈 집합)"""
+    buckets = set()
+    for start, end in _AGE_RANGE.findall(text):
+        buckets.update(range(int(start) * 10, int(end) * 10 + 1, 10))
+    for decade in _AGE_DECADE.findall(text):
+        buckets.add(int(decade) * 10)
+    for first, second in _AGE_PAIR.findall(text):
+        buckets.update((int(first) * 10, int(second) * 10))
+    return frozenset(buckets)
+
+
+def _gender_code(text: str) -> str:
+    """성별 표현을 female / male 코드로. 남녀 모두이거나 없으면 ""."""
+    compact = text.replace(" ", "")
+    if any(alias in compact for alias in _GENDER_ANY):
+        return ""
+    for code, aliases in _GENDER_ALIASES:
+        if any(alias in compact for alias in aliases):
+            return code
+    return ""
+
+
+def _audience_codes(text: Optional[str]) -> Tuple[FrozenSet[int], str]:
+    normalized = _norm(text)
+    return _age_buckets(normalized), _gender_code(normalized)
+
+
+def _profile_audience(brand_profile: Dict[str, Any]) -> Tuple[FrozenSet[int], str]:
+    """브랜드 프로필 타깃 -> (연령대 버킷, 성별 코드). 연령/성별은 각 필드에서 따로 읽는다."""
+    ages, _ = _audience_codes(str(brand_profile.get("target_age") or ""))
+    _, gender = _audience_codes(str(brand_profile.get("target_gender") or ""))
+    if not gender:
+        # target_age 에 "20대 여성" 처럼 함께 적힌 경우
+        _, gender = _audience_codes(str(brand_profile.get("target_age") or ""))
+    return ages, gender
+
+
+def _audience_matches(row_audience: str, profile_ages: FrozenSet[int], profile_gender: str) -> bool:
+    """리포트 타깃이 비어 있거나, 연령대/성별이 각각 프로필과 맞으면 True."""
+    ages, gender = _audience_codes(row_audience)
+    if ages and not ages & profile_ages:
+        return False
+    if gender and gender != profile_gender:
+        return False
+    return True
+
+
+def profile_needs_tailoring(brand_profile: Optional[Dict[str, Any]]) -> bool:
+    """
+    리포트에 반영되지 않는 프로필 항목(브랜드명/톤/키워드/기피 트렌드/선호 색상 등)이 있으면 True.
+    이 경우 리포트 본문을 그대로 쓰지 않고 리포트 근거로 다시 합성해야 한다.
+    """
+    profile = brand_profile or {}
+    return any(profile.get(key) for key in FINGERPRINT_KEYS if key not in REPORT_PROFILE_KEYS)
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+async def find_precomputed_report(
+    query: str,
+    brand_profile: Optional[Dict[str, Any]],
+) -> Optional[Dict[str, Any]]:
+    """
+    브랜드 프로필 업종과 같은 카테고리의 리포트 중 질문에 맞는 것을 돌려준다. 없으면 None.
+
+    - 타깃은 연령대 버킷/성별 코드로 각각 비교 (리포트 쪽이 비어 있으면 '전체')
+    - 질문 속 플랫폼이 리포트와 다르면 제외 (리포트 쪽이 비어 있으면 '전체')
+    - 더 구체적인(타깃/플랫폼이 일치하는) 리포트 우선
+    - 질문과 리포트 질의의 임베딩 유사도가 trend_report_match_threshold 미만이면 사용하지 않음
+    """
+    profile = brand_profile or {}
+    category = profile.get("category") or profile.get("industry")
+    if not category:
+        return None
+
+    store = get_trend_report_store()
+    min_created = time.time() - settings.trend_report_ttl_seconds
+    rows = await run_in_threadpool(store.find_by_category, str(category), min_created)
+    if not rows:
+        return None
+
+    profile_ages, profile_gender = _profile_audience(profile)
+    platform = _detect_platform(query)
+    candidates = [
+        row
+        for row in rows
+        if _audience_matches(row["audience"], profile_ages, profile_gender)
+        and row["platform"] in ("", platform)
+    ]
+    if not candidates:
+        return None
+    candidates.sort(key=lambda row: (bool(row["platform"]), bool(row["audience"])), reverse=True)
+
+    embeddings = get_embeddings()
+    try:
+        query_vec = await embeddings.aembed_query(query)
+        report_vecs = await embeddings.aembed_documents([row["query"] for row in candidates])
+    except Exception as e:
+        logger.warning("[trend_report] 조회 실패: %s", e)
+        return None
+
+    for row, report_vec in zip(candidates, report_vecs):
+        similarity = _cosine(query_vec, report_vec)
+        if similarity >= settings.trend_report_match_threshold:
+            logger.info("[trend_report] 사전 계산 리포트 사용 (유사도 %.3f): %s ~ %s", similarity, query, row["query"])
+            return row
+    return None
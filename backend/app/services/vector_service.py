@@ -4,38 +4,125 @@
 # 수정내역
 # - 2025-11-18: 초기 작성
 # - 2025-11-19: 싱글톤 함수 추가
+# - 2026-10-18: (경로, 컬렉션) 기준 프로세스 공용 레지스트리로 변경, 워밍업/상태 조회 추가
+# - 2026-10-18: 레지스트리 키 함수 공개 (retrieval_service BM25 인덱스와 공유)
+# - 2026-10-18: 컬렉션 생성 시 metadata(거리 함수 등) 지정 옵션 추가
 
-from functools import lru_cache
+import logging
+import threading
+import time
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_chroma import Chroma
 
 from app.llm.client import get_embeddings
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 (backend 의 상위 폴더). settings.vector_store_dir 는 이 경로 기준 상대 경로.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+
+# (절대 경로, 컬렉션) -> Chroma
+_stores: Dict[Tuple[str, str], Chroma] = {}
+# (절대 경로, 컬렉션) -> 오픈 정보 (상태 조회용)
+_store_info: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+def resolve_store_key(
+    persist_directory: Optional[str],
+    collection_name: Optional[str],
+) -> Tuple[str, str]:
+    """벡터스토어 레지스트리 키 (절대 경로, 컬렉션). 기본값은 settings 값."""
+    path = Path(persist_directory or settings.vector_store_dir)
+    if not path.is_absolute():
+        path = PROJECT_ROOT / path
+    return str(path.resolve()), collection_name or settings.vector_store_collection
+
 
-@lru_cache
 def get_vectorstore(
-    persist_directory: str | None = None,
-    collection_name: str = "collection_md",
+    persist_directory: Optional[str] = None,
+    collection_name: Optional[str] = None,
+    collection_metadata: Optional[Dict[str, Any]] = None,
 ) -> Chroma:
     """
     공통 Chroma 벡터스토어 인스턴스.
-    
+    (경로, 컬렉션) 별로 프로세스에서 한 번만 열고 이후에는 같은 인스턴스를 돌려준다.
+
     Args:
-        persist_directory: 벡터스토어 저장 경로 (기본값: "./chroma_db")
-        collection_name: 컬렉션 이름 (기본값: "collection_md")
-    
+        persist_directory: 벡터스토어 저장 경로 (기본값: settings.vector_store_dir, 프로젝트 루트 기준)
+        collection_name: 컬렉션 이름 (기본값: settings.vector_store_collection)
+        collection_metadata: 컬렉션을 새로 만들 때 쓸 metadata (예: {"hnsw:space": "cosine"})
+
     Returns:
         Chroma 벡터스토어 인스턴스
     """
-    if persist_directory is None:
-        # 기본 경로는 backend/chroma_db
-        base_dir = Path(__file__).resolve().parent.parent.parent
-        persist_directory = str(base_dir / "chroma_db")
-    
-    return Chroma(
-        persist_directory=persist_directory,
-        embedding_function=get_embeddings(),
-        collection_name=collection_name,
-    )
\ No newline at end of file
+    key = resolve_store_key(persist_directory, collection_name)
+
+    store = _stores.get(key)
+    if store is not None:
+        return store
+
+    with _lock:
+        store = _stores.get(key)
+        if store is not None:
+            return store
+
+        started = time.perf_counter()
+        store = Chroma(
+            persist_directory=key[0],
+            embedding_function=get_embeddings(),
+            collection_name=key[1],
+            collection_metadata=collection_metadata,
+        )
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        _stores[key] = store
+        _store_info[key] = {
+            "opened_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "open_ms": elapsed_ms,
+        }
+        logger.info("[vector_service] Chroma 오픈: path=%s collection=%s (%.1fms)", key[0], key[1], elapsed_ms)
+        return store
+
+
+def warm_up_vectorstores(targets: Optional[List[Tuple[Optional[str], Optional[str]]]] = None) -> None:
+    """
+    서버 시작 시 벡터스토어를 미리 열어 둔다. (첫 트렌드 질의의 오픈 비용 제거)
+    - targets 가 없으면 기본 (settings.vector_store_dir, settings.vector_store_collection) 하나만 연다.
+    """
+    for persist_directory, collection_name in targets or [(None, None)]:
+        try:
+            store = get_vectorstore(persist_directory, collection_name)
+            # 컬렉션 메타데이터/세그먼트까지 읽도록 한 번 조회
+            store._collection.count()
+        except Exception:
+            logger.exception(
+                "[vector_service] 워밍업 실패: path=%s collection=%s",
+                persist_directory,
+                collection_name,
+            )
+
+
+def get_vectorstore_health() -> List[Dict[str, Any]]:
+    """열려 있는 벡터스토어별 상태 (문서 수, 오픈 시각/소요 시간)."""
+    with _lock:
+        items = list(_stores.items())
+
+    result: List[Dict[str, Any]] = []
+    for key, store in items:
+        info: Dict[str, Any] = {
+            "path": key[0],
+            "collection": key[1],
+            **_store_info.get(key, {}),
+        }
+        try:
+            info["count"] = store._collection.count()
+            info["status"] = "ok"
+        except Exception as e:
+            info["status"] = "error"
+            info["error"] = str(e)
+        result.append(info)
+    return result
@@ -0,0 +1,192 @@
+# 웹 검색(Tavily) 서비스 + 결과 캐시
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성 (정규화 질의 키, SQLite TTL 캐시, stale-while-revalidate)
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.llm.embedding_cache import normalize_embedding_text
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+# 같은 키로 동시에 들어온 검색은 한 번만 호출 (key -> Task)
+_inflight: Dict[str, "asyncio.Task[List[Dict[str, Any]]]"] = {}
+# 백그라운드 재검증 Task 참조 보관 (GC 방지)
+_background: Set["asyncio.Task[Any]"] = set()
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 질의 정규화: 유니코드/공백 정리, 소문자, 끝의 물음표/마침표 제거."""
+    return normalize_embedding_text(query).lower().rstrip("?.!？ ")
+
+
+class WebSearchCache:
+    """
+    웹 검색 결과 SQLite 캐시.
+    - 키: sha256(정규화 질의 + 검색 파라미터)
+    - 값: 결과 리스트(JSON) + 조회 시각
+    """
+
+    def __init__(self, sqlite_path: str) -> None:
+        path = Path(sqlite_path)
+        if not path.is_absolute():
+            path = BASE_DIR / path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS web_search_cache (
+                cache_key  TEXT PRIMARY KEY,
+                query      TEXT NOT NULL,
+                params     TEXT NOT NULL,
+                results    TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_web_search_cache_fetched_at ON web_search_cache (fetched_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        """(결과, 조회 후 경과 초) 또는 None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results, fetched_at FROM web_search_cache WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), time.time() - row[1]
+
+    def put(self, key: str, query: str, params: Dict[str, Any], results: List[Dict[str, Any]]) -> None:
+        now = time.time()
+        max_age = settings.web_search_cache_ttl_seconds + settings.web_search_cache_stale_seconds
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO web_search_cache (cache_key, query, params, results, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, query, json.dumps(params, sort_keys=True), json.dumps(results, ensure_ascii=False), now),
+            )
+            # stale 기간까지 지난 항목 정리
+            self._conn.execute("DELETE FROM web_search_cache WHERE fetched_at < ?", (now - max_age,))
+            self._conn.commit()
+
+
+@lru_cache
+def get_web_search_cache() -> Optional[WebSearchCache]:
+    if not settings.web_search_cache_enabled:
+        return None
+    return WebSearchCache(settings.web_search_cache_path)
+
+
+@lru_cache
+def _get_tavily(max_results: int, search_depth: str):
+    from langchain_community.tools.tavily_search import TavilySearchResults
+
+    return TavilySearchResults(
+        tavily_api_key=settings.tavily_api_key,
+        max_results=max_results,
+        search_depth=search_depth,
+    )
+
+
+async def _fetch(query: str, max_results: int, search_depth: str) -> List[Dict[str, Any]]:
+    results = await _get_tavily(max_results, search_depth).ainvoke({"query": query})
+    if not isinstance(results, list):
+        # 오류 시 Tavily 도구는 문자열을 돌려준다 -> 캐시하지 않도록 예외로 처리
+        raise RuntimeError(f"Tavily 검색 실패: {results}")
+    return results
+
+
+async def _fetch_and_store(
+    key: str,
+    query: str,
+    params: Dict[str, Any],
+    cache: Optional[WebSearchCache],
+) -> List[Dict[str, Any]]:
+    try:
+        results = await _fetch(query, params["max_results"], params["search_depth"])
+        if cache is not None:
+            await run_in_threadpool(cache.put, key, normalize_query(query), params, results)
+        return results
+    finally:
+        _inflight.pop(key, None)
+
+
+def _start_fetch(
+    key: str,
+    query: str,
+    params: Dict[str, Any],
+    cache: Optional[WebSearchCache],
+) -> "asyncio.Task[List[Dict[str, Any]]]":
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_and_store(key, query, params, cache))
+        _inflight[key] = task
+    return task
+
+
+async def web_search(
+    query: str,
+    *,
+    max_results: int = 5,
+    search_depth: str = "advanced",
+) -> List[Dict[str, Any]]:
+    """
+    Tavily 웹 검색 (결과: [{"title", "url", "content", ...}, ...]).
+
+    - 정규화 질의 + 파라미터 키로 SQLite 캐시를 먼저 본다.
+      * web_search_cache_ttl_seconds 이내: 캐시 결과 그대로
+      * 그 이후 web_search_cache_stale_seconds 이내: 캐시 결과를 바로 돌려주고 백그라운드에서 갱신
+      * 그보다 오래됐거나 없으면: 검색 후 저장
+    - 같은 키로 동시에 들어온 요청은 한 번만 검색한다.
+    """
+    params = {"max_results": max_results, "search_depth": search_depth}
+    key = hashlib.sha256(
+        f"{normalize_query(query)}\x00{json.dumps(params, sort_keys=True)}".encode("utf-8")
+    ).hexdigest()
+
+    cache = get_web_search_cache()
+    if cache is not None:
+        cached = await run_in_threadpool(cache.get, key)
+        if cached is not None:
+            results, age = cached
+            if age < settings.web_search_cache_ttl_seconds:
+                logger.info("[web_search] 캐시 적중 (%.0fs): %s", age, query)
+                return results
+            if age < settings.web_search_cache_ttl_seconds + settings.web_search_cache_stale_seconds:
+                logger.info("[web_search] 만료 캐시 사용 + 백그라운드 갱신 (%.0fs): %s", age, query)
+                if key not in _inflight:
+                    task = _start_fetch(key, query, params, cache)
+                    _background.add(task)
+                    task.add_done_callback(_on_background_done)
+                return results
+
+    return await asyncio.shield(_start_fetch(key, query, params, cache))
+
+
+def _on_background_done(task: "asyncio.Task[Any]") -> None:
+    _background.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("[web_search] 백그라운드 갱신 실패: %s", task.exception())
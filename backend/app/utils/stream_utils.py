@@ -0,0 +1,87 @@
+# 그래프 실행 스트리밍(SSE) 유틸
+# 작성일: 2026-10-18
+# 수정내역
+# - 2026-10-18: 초기 작성
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# SSE 응답 공통 헤더 (프록시 버퍼링 방지)
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    """
+    SSE 한 건을 문자열로 만든다.
+
+    event: <event>
+    data: <json>
+    """
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def _chunk_text(chunk: Any) -> str:
+    """AIMessageChunk 에서 텍스트만 뽑는다. (content 가 list 인 모델도 대응)"""
+    content = getattr(chunk, "content", "")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for part in content:
+            if isinstance(part, str):
+                parts.append(part)
+            elif isinstance(part, dict) and part.get("type") == "text":
+                parts.append(part.get("text") or "")
+        return "".join(parts)
+    return ""
+
+
+async def stream_graph_events(
+    graph: Any,
+    state: Dict[str, Any],
+    config: Dict[str, Any],
+    *,
+    token_nodes: Iterable[str],
+) -> AsyncIterator[str]:
+    """
+    LangGraph 그래프를 astream 으로 실행하면서 SSE 이벤트를 흘려보낸다.
+
+    - node  : 노드 시작/종료 진행 이벤트 ({"node": "trend_search", "status": "started"})
+    - token : token_nodes 에 속한 노드의 LLM 토큰 ({"node": "brand_chat", "content": "..."})
+
+    최종 state 는 체크포인터에 저장되므로, 호출하는 쪽에서 graph.aget_state(config) 로 읽는다.
+    """
+    token_node_set = set(token_nodes)
+
+    async for mode, chunk in graph.astream(
+        state,
+        config=config,
+        stream_mode=["messages", "tasks"],
+    ):
+        if mode == "messages":
+            message_chunk, metadata = chunk
+            node = (metadata or {}).get("langgraph_node")
+            if node not in token_node_set:
+                continue
+            text = _chunk_text(message_chunk)
+            if text:
+                yield sse_event("token", {"node": node, "content": text})
+
+        elif mode == "tasks":
+            name: Optional[str] = chunk.get("name")
+            if not name:
+                continue
+            if "result" in chunk or "error" in chunk:
+                status = "failed" if chunk.get("error") else "finished"
+            else:
+                status = "started"
+            yield sse_event("node", {"node": name, "status": status})
@@ -78,6 +78,92 @@ async function apiRequest<T>(endpoint: string, options?: RequestInit): Promise<T
   return response.json();
 }
 
+// SSE 스트리밍 이벤트 타입 (/brand/chat/stream, /logo/chat/stream, /shorts/chat/stream)
+export type ChatStreamEvent<T> =
+  | { event: 'node'; data: { node: string; status: 'started' | 'finished' | 'failed' } }
+  | { event: 'token'; data: { node: string; content: string } }
+  | { event: 'final'; data: T }
+  | { event: 'error'; data: { detail: string } };
+
+// SSE 스트리밍 API 호출 헬퍼
+// - 이벤트가 올 때마다 onEvent 를 호출하고, final 이벤트의 데이터를 반환한다.
+async function apiStream<T>(
+  endpoint: string,
+  body: unknown,
+  onEvent: (event: ChatStreamEvent<T>) => void,
+): Promise<T> {
+  const token = localStorage.getItem('accessToken') || sessionStorage.getItem('accessToken');
+
+  const response = await fetch(`${API_BASE_URL}${endpoint}`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      Accept: 'text/event-stream',
+      ...(token && { Authorization: `Bearer ${token}` }),
+    },
+    body: JSON.stringify(body),
+  });
+
+  if (!response.ok || !response.body) {
+    const errorText = await response.text();
+    let errorMessage = `API request failed: ${response.statusText}`;
+    try {
+      const errorJson = JSON.parse(errorText);
+      errorMessage = errorJson.detail || errorMessage;
+    } catch {
+      if (errorText) {
+        errorMessage = errorText;
+      }
+    }
+    throw new Error(errorMessage);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let finalData: T | undefined;
+
+  const handleBlock = (block: string) => {
+    let eventName = 'message';
+    const dataLines: string[] = [];
+    for (const line of block.split('\n')) {
+      if (line.startsWith('event:')) {
+        eventName = line.slice(6).trim();
+      } else if (line.startsWith('data:')) {
+        dataLines.push(line.slice(5).trim());
+      }
+    }
+    if (dataLines.length === 0) return;
+
+    const event = { event: eventName, data: JSON.parse(dataLines.join('\n')) } as ChatStreamEvent<T>;
+    if (event.event === 'error') {
+      throw new Error(event.data.detail || '스트리밍 응답 처리 중 오류가 발생했습니다.');
+    }
+    if (event.event === 'final') {
+      finalData = event.data;
+    }
+    onEvent(event);
+  };
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let separatorIndex = buffer.indexOf('\n\n');
+    while (separatorIndex !== -1) {
+      handleBlock(buffer.slice(0, separatorIndex));
+      buffer = buffer.slice(separatorIndex + 2);
+      separatorIndex = buffer.indexOf('\n\n');
+    }
+  }
+
+  if (finalData === undefined) {
+    throw new Error('스트리밍 응답이 완료되지 않았습니다.');
+  }
+  return finalData;
+}
+
 // 메뉴 목록 조회
 export async function getMenus(): Promise<Menu[]> {
   return apiRequest<Menu[]>('/menus', { method: 'GET' });
@@ -170,6 +256,14 @@ export async function sendBrandChat(data: BrandChatRequest): Promise<BrandChatRe
   });
 }
 
+// 브랜드 챗 스트리밍 API 호출 (토큰 단위로 onEvent 호출, 최종 응답 반환)
+export async function streamBrandChat(
+  data: BrandChatRequest,
+  onEvent: (event: ChatStreamEvent<BrandChatResponse>) => void,
+): Promise<BrandChatResponse> {
+  return apiStream<BrandChatResponse>('/brand/chat/stream', data, onEvent);
+}
+
 // 브랜드 프로젝트 생성
 export interface CreateBrandProjectRequest {
   brand_session_id: string;
@@ -26,7 +26,7 @@ import { Send, Plus, Upload, Image, Video, X } from "lucide-react";
 import { projectStorage, type Message } from "@/lib/projectStorage";
 import { useToast } from "@/hooks/use-toast";
 import StudioTopBar from "@/components/StudioTopBar";
-import { sendBrandChat, createBrandProject, BrandInfo } from "@/lib/api";
+import { streamBrandChat, createBrandProject, BrandInfo } from "@/lib/api";
 
 type InfoStep = "collecting" | "logoQuestion" | "complete";
 
@@ -487,15 +487,24 @@ const ChatPage = () => {
   
     // 🆕 항상 백엔드 API 호출
     setIsLoadingChat(true);
+    // 스트리밍으로 받은 토큰을 assistant 메시지에 바로 이어 붙인다
+    let streamedReply = "";
+    let replyCompleted = false;
     try {
-      const response = await sendBrandChat({
+      const response = await streamBrandChat({
         message: inputMessage,
         brand_session_id: brandSessionId || undefined, // 저장된 brand_session_id 사용
         grp_nm: isDraftMode ? draftProjectInfo?.name : undefined,
         grp_desc: isDraftMode ? draftProjectInfo?.description : undefined,
+      }, (event) => {
+        if (event.event !== "token") return;
+        const isFirstToken = streamedReply === "";
+        streamedReply += event.data.content;
+        const partial: Message = { role: "assistant", content: streamedReply };
+        setMessages(prev => isFirstToken ? [...prev, partial] : [...prev.slice(0, -1), partial]);
       });
 
-      // 백엔드 응답을 assistant 메시지로 추가
+      // 최종 응답 본문으로 assistant 메시지를 확정
       const assistantMessage: Message = {
         role: "assistant",
         content: response.reply
@@ -511,36 +520,38 @@ const ChatPage = () => {
         setBrandInfo(response.brand_info);
       }
 
-      setTimeout(() => {
-        setMessages(prev => [...prev, assistantMessage]);
+      setMessages(prev => streamedReply ? [...prev.slice(0, -1), assistantMessage] : [...prev, assistantMessage]);
+      replyCompleted = true;
+
+      // project_id가 반환되면 저장 (draft 모드에서 프로젝트 생성된 경우)
+      if (response.project_id && isDraftMode) {
+        setDbProjectId(response.project_id);
+        setIsDraftMode(false); // draft 모드 종료
         
-        // project_id가 반환되면 저장 (draft 모드에서 프로젝트 생성된 경우)
-        if (response.project_id && isDraftMode) {
-          setDbProjectId(response.project_id);
-          setIsDraftMode(false); // draft 모드 종료
-          
-          // draft 정보 삭제
-          localStorage.removeItem('makery_draft_project');
-          
-          // project_id를 brand_session_id로도 사용
-          if (response.brand_session_id) {
-            setBrandSessionId(response.brand_session_id);
-          } else {
-            setBrandSessionId(response.project_id.toString());
-          }
-          
-          // 프로젝트 생성 완료 메시지
-          toast({
-            title: "프로젝트 생성 완료",
-            description: "브랜드 정보 수집을 계속합니다.",
-            status: "success",
-          });
+        // draft 정보 삭제
+        localStorage.removeItem('makery_draft_project');
+        
+        // project_id를 brand_session_id로도 사용
+        if (response.brand_session_id) {
+          setBrandSessionId(response.brand_session_id);
+        } else {
+          setBrandSessionId(response.project_id.toString());
         }
         
-      }, 500);
+        // 프로젝트 생성 완료 메시지
+        toast({
+          title: "프로젝트 생성 완료",
+          description: "브랜드 정보 수집을 계속합니다.",
+          status: "success",
+        });
+      }
   
     } catch (error) {
       console.error('브랜드 챗 API 오류:', error);
+      // 도중에 끊긴 스트리밍 답변은 완성된 답변처럼 남지 않도록 제거
+      if (streamedReply && !replyCompleted) {
+        setMessages(prev => prev.slice(0, -1));
+      }
       toast({
         title: "오류",
         description: error instanceof Error ? error.message : "메시지 전송에 실패했습니다.",
@@ -298,3 +298,71 @@ END;
 ------------------------------------------------------------------------------------------------------------------------
 
 
+
+-- graph_thread 테이블 (LangGraph 체크포인터: 대화 스레드)
+CREATE TABLE graph_thread (
+    thread_id   VARCHAR2(255)   NOT NULL,               -- 스레드ID
+    create_dt   DATE            NOT NULL,               -- 생성일
+    update_dt   DATE            NOT NULL,               -- 수정일 (TTL 정리 기준)
+    CONSTRAINT PK_GRAPH_THREAD PRIMARY KEY (thread_id)
+);
+
+CREATE INDEX IX_GRAPH_THREAD_UPDATE_DT ON graph_thread (update_dt);
+
+COMMENT ON COLUMN graph_thread.thread_id IS '스레드ID';
+COMMENT ON COLUMN graph_thread.create_dt IS '생성일';
+COMMENT ON COLUMN graph_thread.update_dt IS '수정일';
+
+------------------------------------------------------------------------------------------------------------------------
+
+-- graph_checkpoint 테이블 (LangGraph 체크포인터: 체크포인트 스냅샷)
+CREATE TABLE graph_checkpoint (
+    thread_id            VARCHAR2(255)  NOT NULL,      -- 스레드ID
+    checkpoint_ns        VARCHAR2(255)  NOT NULL,      -- 체크포인트 네임스페이스 (루트는 '-')
+    checkpoint_id        VARCHAR2(64)   NOT NULL,      -- 체크포인트ID
+    parent_checkpoint_id VARCHAR2(64)   NULL,          -- 부모 체크포인트ID
+    ckpt_type            VARCHAR2(50)   NOT NULL,      -- 체크포인트 직렬화 타입
+    ckpt_data            BLOB           NULL,          -- 체크포인트 데이터
+    meta_type            VARCHAR2(50)   NOT NULL,      -- 메타데이터 직렬화 타입
+    meta_data            BLOB           NULL,          -- 메타데이터
+    create_dt            DATE           NOT NULL,      -- 생성일
+    CONSTRAINT PK_GRAPH_CHECKPOINT PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+
+COMMENT ON COLUMN graph_checkpoint.thread_id IS '스레드ID';
+COMMENT ON COLUMN graph_checkpoint.checkpoint_ns IS '체크포인트 네임스페이스';
+COMMENT ON COLUMN graph_checkpoint.checkpoint_id IS '체크포인트ID';
+COMMENT ON COLUMN graph_checkpoint.parent_checkpoint_id IS '부모 체크포인트ID';
+COMMENT ON COLUMN graph_checkpoint.ckpt_type IS '체크포인트 직렬화 타입';
+COMMENT ON COLUMN graph_checkpoint.ckpt_data IS '체크포인트 데이터';
+COMMENT ON COLUMN graph_checkpoint.meta_type IS '메타데이터 직렬화 타입';
+COMMENT ON COLUMN graph_checkpoint.meta_data IS '메타데이터';
+COMMENT ON COLUMN graph_checkpoint.create_dt IS '생성일';
+
+------------------------------------------------------------------------------------------------------------------------
+
+-- graph_checkpoint_write 테이블 (LangGraph 체크포인터: 노드 중간 쓰기)
+CREATE TABLE graph_checkpoint_write (
+    thread_id       VARCHAR2(255)   NOT NULL,          -- 스레드ID
+    checkpoint_ns   VARCHAR2(255)   NOT NULL,          -- 체크포인트 네임스페이스 (루트는 '-')
+    checkpoint_id   VARCHAR2(64)    NOT NULL,          -- 체크포인트ID
+    task_id         VARCHAR2(64)    NOT NULL,          -- 태스크ID
+    write_idx       NUMBER          NOT NULL,          -- 쓰기 순번
+    channel         VARCHAR2(255)   NOT NULL,          -- 채널명
+    value_type      VARCHAR2(50)    NOT NULL,          -- 값 직렬화 타입
+    value_data      BLOB            NULL,              -- 값 데이터
+    task_path       VARCHAR2(1000)  NULL,              -- 태스크 경로
+    CONSTRAINT PK_GRAPH_CHECKPOINT_WRITE PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx)
+);
+
+COMMENT ON COLUMN graph_checkpoint_write.thread_id IS '스레드ID';
+COMMENT ON COLUMN graph_checkpoint_write.checkpoint_ns IS '체크포인트 네임스페이스';
+COMMENT ON COLUMN graph_checkpoint_write.checkpoint_id IS '체크포인트ID';
+COMMENT ON COLUMN graph_checkpoint_write.task_id IS '태스크ID';
+COMMENT ON COLUMN graph_checkpoint_write.write_idx IS '쓰기 순번';
+COMMENT ON COLUMN graph_checkpoint_write.channel IS '채널명';
+COMMENT ON COLUMN graph_checkpoint_write.value_type IS '값 직렬화 타입';
+COMMENT ON COLUMN graph_checkpoint_write.value_data IS '값 데이터';
+COMMENT ON COLUMN graph_checkpoint_write.task_path IS '태스크 경로';
+
+------------------------------------------------------------------------------------------------------------------------